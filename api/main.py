@@ -1,88 +1,576 @@
-from fastapi import FastAPI, HTTPException
+import time
+
+# Measured so startup regressions show up in /health/ready
+_import_started = time.perf_counter()
+
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+import asyncio
+import functools
+import os
+import uuid
 import pandas as pd
 
+from src.data.company_cache import CompanyInfoCache
 from src.data.financial import FinancialData
+from src.data.store import OHLCVStore
+from src.analysis.cache import SentimentCache
 from src.analysis.sentiment import SentimentAnalyzer
+from src.analysis.workers import get_shared_pool
+from src.models.features import FeaturePipeline
+from src.models.multi_series import SCALING_MODES, MultiSeriesPredictor
 from src.models.price_predictor import PricePredictor
+from src.models.registry import ModelRegistry
+from src.serving.batching import MicroBatcher
+from src.serving.executor import BoundedExecutor, CapacityExceeded, ExecutionTimeout
+from src.serving.formats import (
+    ARROW_STREAM, COLUMNAR_JSON, FRAME_MEDIA_TYPES, JSON_RECORDS, PARQUET,
+    NotAcceptable, negotiate, to_arrow_ipc, to_columnar_json, to_parquet
+)
+from src.serving.jobs import TrainingJobQueue
+from src.serving.lazy import FAILED, LazyComponent
+from src.serving.metrics import REGISTRY, stage
+from src.serving.profiler import SamplingProfiler
+from src.serving.streaming import (
+    NDJSON, STREAM_MEDIA_TYPES, StreamTimer, encode_stream, stream_from_executor
+)
+
+def build_financial_data() -> FinancialData:
+    # Bars are served from a local store and only missing ranges are fetched
+    return FinancialData(store=OHLCVStore(os.getenv("QUANTBRAIN_DATA_DIR", "artifacts/market_data")))
+
+def build_company_info() -> CompanyInfoCache:
+    # Stale entries are served while they refresh; the snapshot survives restarts
+    return CompanyInfoCache(
+        financial_data.get().get_company_info,
+        snapshot_path=os.getenv("QUANTBRAIN_COMPANY_SNAPSHOT", "artifacts/company_info.json")
+    )
+
+def build_sentiment_analyzer() -> SentimentAnalyzer:
+    # Set QUANTBRAIN_SENTIMENT_WORKERS to run inference in a process pool
+    workers = int(os.getenv("QUANTBRAIN_SENTIMENT_WORKERS", "0"))
+    return SentimentAnalyzer(
+        cache=SentimentCache(db_path=os.getenv("QUANTBRAIN_SENTIMENT_CACHE", "artifacts/sentiment.sqlite")),
+        pool=get_shared_pool(num_workers=workers) if workers > 0 else None
+    )
+
+# Set QUANTBRAIN_FEATURES=1 to train on technical features as well as the close
+FEATURES = FeaturePipeline() if os.getenv("QUANTBRAIN_FEATURES", "0") == "1" else None
+
+def model_inputs(symbol: str, data: pd.DataFrame):
+    """Close prices, or the symbol's cached features when FEATURES is enabled."""
+    if FEATURES is None:
+        return data['Close']
+    # Only bars appended since the last call are computed
+    return FEATURES.update(symbol, data)
+
+def new_predictor() -> PricePredictor:
+    return PricePredictor(features=FEATURES)
+
+def load_model_inputs(symbol: str):
+    return model_inputs(symbol, financial_data.get().get_stock_data(symbol))
+
+def build_model_registry() -> ModelRegistry:
+    # Trained models are cached per symbol so requests only run inference
+    return ModelRegistry(
+        load_model_inputs,
+        cache_dir=os.getenv("QUANTBRAIN_MODEL_DIR", "artifacts/models"),
+        # Hold out the latest windows and stop once they stop improving
+        train_kwargs={"validation_split": 0.1, "patience": 10},
+        # Daily refreshes fine-tune on the new bars; every 20th retrains from scratch
+        max_updates=int(os.getenv("QUANTBRAIN_MAX_UPDATES", "19")),
+        factory=new_predictor
+    )
+
+def load_universe_closes(universe: str) -> Dict[str, pd.Series]:
+    """Close prices of every symbol in a comma-separated universe."""
+    data = financial_data.get().get_bulk_stock_data(universe.split(","))
+    if data.empty:
+        return {}
+    return {symbol: bars.set_index('Date')['Close'] for symbol, bars in data.groupby('Symbol', sort=False)}
+
+# Bars per input window of the multi-series models
+BATCH_SEQUENCE_LENGTH = 10
+
+def build_batch_models() -> Dict[str, ModelRegistry]:
+    # One multi-series model per universe of symbols, trained and refreshed like single-symbol models
+    registry = model_registry.get()
+    return {
+        scaling: ModelRegistry(
+            load_universe_closes,
+            cache_dir=os.path.join(registry.cache_dir, f"batch_{scaling}") if registry.cache_dir else None,
+            train_kwargs=registry.train_kwargs,
+            factory=functools.partial(MultiSeriesPredictor, BATCH_SEQUENCE_LENGTH, scaling=scaling)
+        )
+        for scaling in SCALING_MODES
+    }
+
+def build_training_jobs() -> TrainingJobQueue:
+    # Queued jobs survive restarts and publish into the model registry
+    return TrainingJobQueue(
+        model_registry.get(),
+        db_path=os.getenv("QUANTBRAIN_JOBS_DB", "artifacts/jobs.sqlite"),
+        workers=int(os.getenv("QUANTBRAIN_TRAINING_WORKERS", "1"))
+    )
+
+# Components are built on first use so importing this module stays cheap
+financial_data = LazyComponent("financial_data", build_financial_data)
+company_info = LazyComponent("company_info", build_company_info)
+sentiment_analyzer = LazyComponent("sentiment_analyzer", build_sentiment_analyzer)
+model_registry = LazyComponent("model_registry", build_model_registry)
+batch_models = LazyComponent("batch_models", build_batch_models)
+training_jobs = LazyComponent("training_jobs", build_training_jobs)
+COMPONENTS = [financial_data, company_info, sentiment_analyzer, model_registry, batch_models, training_jobs]
+
+# Set QUANTBRAIN_WARMUP=1 to load models before accepting traffic
+WARMUP = os.getenv("QUANTBRAIN_WARMUP", "0") == "1"
+# Comma-separated symbols whose company info is refreshed in the background at startup
+UNIVERSE = [symbol for symbol in os.getenv("QUANTBRAIN_UNIVERSE", "").split(",") if symbol.strip()]
+
+def warm_up() -> None:
+    """Build every component ahead of the first request."""
+    for component in COMPONENTS:
+        component.get()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if WARMUP:
+        await asyncio.get_running_loop().run_in_executor(None, warm_up)
+    if UNIVERSE:
+        # Loads the snapshot, then refreshes stale symbols without delaying startup
+        await asyncio.get_running_loop().run_in_executor(None, lambda: company_info.get().prewarm(UNIVERSE))
+    yield
+    # Components outlive the app and may serve a restarted one, so only persist the cache
+    cache = company_info.peek()
+    if cache is not None:
+        cache.save()
 
 app = FastAPI(
     title="QuantBrain API",
     description="AI-powered quantitative finance analysis tool",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Initialize components
-financial_data = FinancialData()
-sentiment_analyzer = SentimentAnalyzer()
-price_predictor = PricePredictor()
+# Blocking work runs in bounded pools; over capacity returns 429, timeouts 503
+data_executor = BoundedExecutor("data", max_workers=8, max_pending=32, timeout=30)
+sentiment_executor = BoundedExecutor("sentiment", max_workers=2, max_pending=8, timeout=60)
+prediction_executor = BoundedExecutor("prediction", max_workers=2, max_pending=4, timeout=300)
+EXECUTORS = [data_executor, sentiment_executor, prediction_executor]
+
+def http_error(e: Exception) -> HTTPException:
+    """Map a failure from an executor or batcher to an HTTP error."""
+    if isinstance(e, HTTPException):
+        return e
+    if isinstance(e, CapacityExceeded):
+        return HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    if isinstance(e, ExecutionTimeout):
+        return HTTPException(status_code=503, detail=str(e))
+    return HTTPException(status_code=500, detail=str(e))
+
+async def run_blocking(executor: BoundedExecutor, fn, *args):
+    """Run a blocking call in `executor`, mapping failures to HTTP errors."""
+    try:
+        return await executor.run(fn, *args)
+    except Exception as e:
+        raise http_error(e)
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    "quantbrain_http_request_duration_seconds",
+    "Time until the response starts, by route and status",
+    labels=("method", "route", "status")
+)
+
+def sentiment_cache_stats() -> dict:
+    analyzer = sentiment_analyzer.peek()
+    if analyzer is None or analyzer.cache is None:
+        return {}
+    return analyzer.cache.stats()
+
+REGISTRY.gauge(
+    "quantbrain_sentiment_cache_hit_ratio",
+    "Share of sentiment lookups served from the cache",
+    lambda: {(): stats["hit_ratio"]} if (stats := sentiment_cache_stats()) else {}
+)
+REGISTRY.gauge(
+    "quantbrain_sentiment_cache_lookups",
+    "Sentiment cache lookups by result since startup",
+    lambda: {
+        (result,): stats[result] for result in ("memory_hits", "disk_hits", "misses")
+    } if (stats := sentiment_cache_stats()) else {},
+    labels=("result",)
+)
+REGISTRY.gauge(
+    "quantbrain_executor_in_flight",
+    "Calls admitted to each executor",
+    lambda: {(executor.name,): executor.stats()["in_flight"] for executor in EXECUTORS},
+    labels=("executor",)
+)
+REGISTRY.gauge(
+    "quantbrain_executor_rejected",
+    "Calls rejected by each executor because it was at capacity",
+    lambda: {(executor.name,): executor.stats()["rejected"] for executor in EXECUTORS},
+    labels=("executor",)
+)
+
+# Set QUANTBRAIN_PROFILING=1 to allow sampling a request with `X-Profile: 1`
+PROFILING = os.getenv("QUANTBRAIN_PROFILING", "0") == "1"
+PROFILES: "OrderedDict[str, SamplingProfiler]" = OrderedDict()
+MAX_PROFILES = 32
+
+@app.middleware("http")
+async def instrument_requests(request: Request, call_next):
+    profiler = None
+    if PROFILING and request.headers.get("x-profile") == "1":
+        profiler = SamplingProfiler().start()
+    
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        elapsed = time.perf_counter() - started
+        route = request.scope.get("route")
+        REQUEST_SECONDS.observe(
+            elapsed,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status)
+        )
+        if profiler is not None:
+            profiler.stop()
+    
+    response.headers["Server-Timing"] = f"app;dur={elapsed * 1000:.1f}"
+    if profiler is not None:
+        profile_id = uuid.uuid4().hex
+        PROFILES[profile_id] = profiler
+        while len(PROFILES) > MAX_PROFILES:
+            PROFILES.popitem(last=False)
+        response.headers["X-Profile-Id"] = profile_id
+    return response
+
+STARTED_AT = time.time()
+IMPORT_SECONDS = time.perf_counter() - _import_started
 
 class StockRequest(BaseModel):
     symbol: str
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
+class BulkStockRequest(BaseModel):
+    symbols: List[str]
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
 class SentimentRequest(BaseModel):
     texts: List[str]
+    batch_size: int = 32
 
 class PredictionRequest(BaseModel):
     symbol: str
     steps: int = 5
 
+class TrainingJobRequest(BaseModel):
+    symbol: str
+    epochs: Optional[int] = None
+    batch_size: Optional[int] = None
+    learning_rate: Optional[float] = None
+
+class BatchPredictionRequest(BaseModel):
+    symbols: List[str]
+    steps: int = 5
+    scaling: str = "per_symbol"
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to QuantBrain API"}
 
-@app.post("/api/data/financial")
-async def get_financial_data(request: StockRequest):
+@app.get("/health/live")
+async def liveness():
+    return {"status": "alive", "uptime_seconds": time.time() - STARTED_AT}
+
+@app.get("/health/ready")
+async def readiness():
+    components = {component.name: component.status() for component in COMPONENTS}
+    # Without warm-up, components load on first use and only failures block readiness
+    failed = any(component.state == FAILED for component in COMPONENTS)
+    loaded = all(component.loaded for component in COMPONENTS)
+    ready = not failed and (loaded or not WARMUP)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "loading",
+            "import_seconds": IMPORT_SECONDS,
+            "components": components,
+            "executors": {executor.name: executor.stats() for executor in EXECUTORS}
+        }
+    )
+
+@app.get("/metrics")
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/debug/profiles/{profile_id}")
+async def get_profile(profile_id: str, format: str = "json"):
+    profiler = PROFILES.get(profile_id)
+    if profiler is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "collapsed":
+        return PlainTextResponse(profiler.collapsed())
+    return {
+        "elapsed_ms": profiler.elapsed * 1000,
+        "samples": profiler.sample_count,
+        "top": profiler.top()
+    }
+
+def negotiate_or_406(accept: Optional[str], supported: List[str], default: str) -> str:
     try:
-        data = financial_data.get_stock_data(
-            request.symbol,
-            request.start_date,
-            request.end_date
-        )
-        if data.empty:
-            raise HTTPException(status_code=404, detail="No data found")
+        return negotiate(accept, supported, default)
+    except NotAcceptable as e:
+        raise HTTPException(status_code=406, detail=str(e))
+
+def frame_response(data: pd.DataFrame, media_type: str, headers: Optional[dict] = None) -> Response:
+    """Serialize a frame straight to a binary format; JSON is handled by callers."""
+    if media_type == ARROW_STREAM:
+        return Response(to_arrow_ipc(data), media_type=ARROW_STREAM, headers=headers)
+    if media_type == PARQUET:
+        return Response(to_parquet(data), media_type=PARQUET, headers=headers)
+    return JSONResponse(to_columnar_json(data), media_type=COLUMNAR_JSON, headers=headers)
+
+def fetch_financial_frame(request: StockRequest, media_type: str):
+    data = financial_data.get().get_stock_data(
+        request.symbol,
+        request.start_date,
+        request.end_date
+    )
+    if data.empty:
+        raise HTTPException(status_code=404, detail="No data found")
+    if media_type == JSON_RECORDS:
         return data.to_dict(orient="records")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return frame_response(data, media_type)
+
+@app.post("/api/data/financial")
+async def get_financial_data(request: StockRequest, accept: Optional[str] = Header(None)):
+    media_type = negotiate_or_406(accept, FRAME_MEDIA_TYPES, JSON_RECORDS)
+    return await run_blocking(data_executor, fetch_financial_frame, request, media_type)
+
+def fetch_bulk_financial_frame(request: BulkStockRequest, media_type: str):
+    data = financial_data.get().get_bulk_stock_data(
+        request.symbols,
+        request.start_date,
+        request.end_date
+    )
+    if data.empty:
+        raise HTTPException(status_code=404, detail="No data found")
+    found = set(data['Symbol'])
+    missing = list(dict.fromkeys(
+        symbol.strip().upper() for symbol in request.symbols if symbol.strip().upper() not in found
+    ))
+    if media_type != JSON_RECORDS:
+        return frame_response(data, media_type, headers={"X-Missing-Symbols": ",".join(missing)})
+    
+    data['Date'] = data['Date'].dt.strftime("%Y-%m-%d")
+    return {
+        "symbols": data['Symbol'].unique().tolist(),
+        "missing": missing,
+        "columns": data.to_dict(orient="list")
+    }
+
+@app.post("/api/data/financial/bulk")
+async def get_bulk_financial_data(request: BulkStockRequest, accept: Optional[str] = Header(None)):
+    media_type = negotiate_or_406(accept, [JSON_RECORDS, ARROW_STREAM, PARQUET], JSON_RECORDS)
+    return await run_blocking(data_executor, fetch_bulk_financial_frame, request, media_type)
+
+def score_texts(texts: List[str]) -> List[dict]:
+    return sentiment_analyzer.get().analyze_texts(texts)
+
+# Texts from concurrent requests are scored together in one batched call
+sentiment_batcher = MicroBatcher(
+    "sentiment",
+    score_texts,
+    sentiment_executor,
+    max_batch_size=int(os.getenv("QUANTBRAIN_SENTIMENT_MAX_BATCH", "64")),
+    max_wait=float(os.getenv("QUANTBRAIN_SENTIMENT_MAX_WAIT_MS", "5")) / 1000
+)
 
 @app.post("/api/analysis/sentiment")
 async def analyze_sentiment(request: SentimentRequest):
     try:
-        results = sentiment_analyzer.analyze_texts(request.texts)
-        return results
+        return await sentiment_batcher.submit(request.texts)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise http_error(e)
+
+def score_text_batches(emit, texts: List[str], batch_size: int) -> dict:
+    analyzer = sentiment_analyzer.get()
+    for offset in range(0, len(texts), batch_size):
+        batch = texts[offset:offset + batch_size]
+        emit({"event": "batch", "offset": offset, "results": analyzer.analyze_texts(batch)})
+    return {"count": len(texts)}
+
+def start_stream(executor: BoundedExecutor, fn, *args):
+    try:
+        return stream_from_executor(executor, fn, *args)
+    except CapacityExceeded as e:
+        raise http_error(e)
+
+@app.post("/api/analysis/sentiment/stream")
+async def stream_sentiment(request: SentimentRequest, accept: Optional[str] = Header(None)):
+    timer = StreamTimer()
+    media_type = negotiate_or_406(accept, STREAM_MEDIA_TYPES, NDJSON)
+    events = start_stream(
+        sentiment_executor, score_text_batches, request.texts, max(request.batch_size, 1)
+    )
+    return StreamingResponse(
+        encode_stream(events, media_type, timer, "sentiment"),
+        media_type=media_type
+    )
+
+def forecast_price(request: PredictionRequest) -> dict:
+    # Get historical data
+    with stage("prediction.data"):
+        data = financial_data.get().get_stock_data(request.symbol)
+    if data.empty:
+        raise HTTPException(status_code=404, detail="No data found")
+    
+    inputs = model_inputs(request.symbol, data)
+    
+    # Use the cached model for this symbol, training it only on first use
+    with stage("prediction.model"):
+        predictor = model_registry.get().get(request.symbol, inputs)
+    with stage("prediction.predict"):
+        predictions = predictor.predict(inputs, request.steps)
+    
+    return {
+        "symbol": request.symbol,
+        "predictions": predictions.tolist(),
+        "last_date": data.index[-1].strftime("%Y-%m-%d")
+    }
 
 @app.post("/api/prediction/price")
 async def predict_price(request: PredictionRequest):
-    try:
-        # Get historical data
-        data = financial_data.get_stock_data(request.symbol)
-        if data.empty:
-            raise HTTPException(status_code=404, detail="No data found")
-        
-        # Train model and make predictions
-        price_predictor.train(data['Close'])
-        predictions = price_predictor.predict(data['Close'], request.steps)
-        
-        return {
-            "symbol": request.symbol,
-            "predictions": predictions.tolist(),
-            "last_date": data.index[-1].strftime("%Y-%m-%d")
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await run_blocking(prediction_executor, forecast_price, request)
+
+def forecast_prices(request: BatchPredictionRequest) -> dict:
+    if request.scaling not in SCALING_MODES:
+        raise HTTPException(status_code=422, detail=f"scaling must be one of {list(SCALING_MODES)}")
+    
+    # Get historical data for the whole universe concurrently
+    closes = load_universe_closes(",".join(request.symbols))
+    if not closes:
+        raise HTTPException(status_code=404, detail="No data found")
+    # Symbols without a full window of history cannot be forecast
+    closes = {
+        symbol: series for symbol, series in closes.items()
+        if len(series) >= BATCH_SEQUENCE_LENGTH
+    }
+    missing = list(dict.fromkeys(
+        symbol.strip().upper() for symbol in request.symbols if symbol.strip().upper() not in closes
+    ))
+    if not closes:
+        return {"predictions": {}, "missing": missing}
+    
+    # One model over all symbols, cached per universe; one forward pass per horizon step
+    universe = ",".join(sorted(closes))
+    predictor = batch_models.get()[request.scaling].get(universe, closes)
+    predictions = predictor.predict(closes, request.steps)
+    
+    return {
+        "predictions": {
+            symbol: {
+                "predictions": predictions[symbol].tolist(),
+                "last_date": series.index[-1].strftime("%Y-%m-%d")
+            }
+            for symbol, series in closes.items()
+        },
+        "missing": missing
+    }
+
+def train_and_forecast(emit, request: PredictionRequest, data: pd.DataFrame) -> dict:
+    registry = model_registry.get()
+    inputs = model_inputs(request.symbol, data)
+    if registry.peek(request.symbol, stale=True) is None:
+        emit({"event": "training", "symbol": request.symbol})
+    else:
+        # Stale models are served while the registry refreshes them
+        emit({"event": "model", "symbol": request.symbol, "cached": True})
+    # Cold starts train under the registry's per-symbol lock, so a concurrent
+    # request or job waits for this run; epochs stream only if this call trains
+    predictor = registry.get(
+        request.symbol,
+        inputs,
+        callback=lambda epoch, loss: emit({"event": "epoch", "epoch": epoch + 1, "loss": loss})
+    )
+    
+    predictions = predictor.predict(inputs, request.steps)
+    emit({
+        "event": "forecast",
+        "symbol": request.symbol,
+        "predictions": predictions.tolist(),
+        "last_date": data.index[-1].strftime("%Y-%m-%d")
+    })
+    return {}
+
+def fetch_prediction_history(symbol: str) -> pd.DataFrame:
+    data = financial_data.get().get_stock_data(symbol)
+    if data.empty:
+        raise HTTPException(status_code=404, detail="No data found")
+    return data
+
+@app.post("/api/prediction/price/stream")
+async def stream_price_prediction(request: PredictionRequest, accept: Optional[str] = Header(None)):
+    timer = StreamTimer()
+    media_type = negotiate_or_406(accept, STREAM_MEDIA_TYPES, NDJSON)
+    # Fetch first so a missing symbol is still a plain 404
+    data = await run_blocking(data_executor, fetch_prediction_history, request.symbol)
+    events = start_stream(prediction_executor, train_and_forecast, request, data)
+    return StreamingResponse(
+        encode_stream(events, media_type, timer, "prediction"),
+        media_type=media_type
+    )
+
+@app.post("/api/prediction/price/batch")
+async def predict_prices(request: BatchPredictionRequest):
+    return await run_blocking(prediction_executor, forecast_prices, request)
+
+def fetch_company_info(symbol: str) -> dict:
+    info = company_info.get().get(symbol)
+    if not info:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return info
+
+def submit_training_job(request: TrainingJobRequest) -> dict:
+    params = request.model_dump(exclude={"symbol"}, exclude_none=True)
+    return training_jobs.get().submit(request.symbol, params)
+
+def find_training_job(job_id: str, cancel: bool = False) -> dict:
+    jobs = training_jobs.get()
+    job = jobs.cancel(job_id) if cancel else jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.post("/api/jobs/train", status_code=202)
+async def create_training_job(request: TrainingJobRequest):
+    return await run_blocking(data_executor, submit_training_job, request)
+
+@app.get("/api/jobs")
+async def list_training_jobs(status: Optional[str] = None, limit: int = 50):
+    return await run_blocking(data_executor, lambda: training_jobs.get().list(status, limit))
+
+@app.get("/api/jobs/{job_id}")
+async def get_training_job(job_id: str):
+    return await run_blocking(data_executor, find_training_job, job_id)
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_training_job(job_id: str):
+    return await run_blocking(data_executor, find_training_job, job_id, True)
 
 @app.get("/api/company/{symbol}")
 async def get_company_info(symbol: str):
-    try:
-        info = financial_data.get_company_info(symbol)
-        if not info:
-            raise HTTPException(status_code=404, detail="Company not found")
-        return info
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+    return await run_blocking(data_executor, fetch_company_info, symbol)
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import torch
+
+from benchmarks.synthetic import (
+    StubSentimentModel, SyntheticSource, synthetic_headlines, synthetic_prices
+)
+
+
+def summarize(latencies: List[float], items_per_call: int = 1, wall_time: float = None) -> Dict[str, float]:
+    """
+    Latency percentiles and throughput of a series of timed calls.
+
+    Args:
+        latencies: Seconds taken by each call
+        items_per_call: Items (rows, texts, requests) processed per call
+        wall_time: Total elapsed time when calls overlapped; defaults to
+            the sum of latencies
+
+    Returns:
+        Dictionary with p50_ms, p99_ms and throughput (items per second)
+    """
+    latencies = np.asarray(latencies)
+    elapsed = wall_time if wall_time is not None else latencies.sum()
+    return {
+        'p50_ms': float(np.percentile(latencies, 50) * 1000),
+        'p99_ms': float(np.percentile(latencies, 99) * 1000),
+        'throughput': float(len(latencies) * items_per_call / elapsed)
+    }
+
+
+def timed(fn: Callable[[], object], repeats: int, warmup: int = 1) -> List[float]:
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def predictor_prepare_data(scale: float) -> Dict[str, float]:
+    from src.models.price_predictor import PricePredictor
+    data = synthetic_prices(5000)
+    predictor = PricePredictor()
+    return summarize(timed(lambda: predictor.prepare_data(data), int(200 * scale)), len(data))
+
+
+def predictor_train(scale: float) -> Dict[str, float]:
+    from src.models.price_predictor import PricePredictor
+    data = synthetic_prices(500)
+    torch.manual_seed(0)
+    latencies = timed(lambda: PricePredictor().train(data, epochs=5), max(int(5 * scale), 1))
+    # Throughput in training windows per second
+    return summarize(latencies, (len(data) - 10) * 5)
+
+
+def predictor_predict(scale: float) -> Dict[str, float]:
+    from src.models.price_predictor import PricePredictor
+    data = synthetic_prices(500)
+    torch.manual_seed(0)
+    predictor = PricePredictor()
+    predictor.train(data, epochs=1)
+    return summarize(timed(lambda: predictor.predict(data, 30), int(100 * scale)), 30)
+
+
+def sentiment_batches(scale: float, batch_size: int) -> Dict[str, float]:
+    from src.analysis.sentiment import SentimentAnalyzer
+    texts = synthetic_headlines(512)
+    # No cache, so every call pays for inference
+    analyzer = SentimentAnalyzer(model=StubSentimentModel())
+    latencies = timed(lambda: analyzer.analyze_texts(texts, batch_size), max(int(5 * scale), 1))
+    return summarize(latencies, len(texts))
+
+
+def api_endpoint(scale: float, path: str, payload: Dict, concurrency: int = 16) -> Dict[str, float]:
+    import httpx
+    import api.main as main
+    from src.analysis.sentiment import SentimentAnalyzer
+    from src.data.financial import FinancialData
+    from src.models.registry import ModelRegistry
+    from src.serving.lazy import LazyComponent
+
+    # In-memory components so the run touches neither the network nor disk
+    main.financial_data = LazyComponent('financial_data', lambda: FinancialData(source=SyntheticSource()))
+    main.sentiment_analyzer = LazyComponent(
+        'sentiment_analyzer', lambda: SentimentAnalyzer(model=StubSentimentModel())
+    )
+    main.model_registry = LazyComponent(
+        'model_registry', lambda: ModelRegistry(main.load_model_inputs, train_kwargs={'epochs': 2})
+    )
+    requests = int(400 * scale)
+
+    async def run() -> Dict[str, float]:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            # Loads components and trains the model outside the measurement
+            await client.post(path, json=payload)
+
+            latencies, rejected = [], 0
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def call() -> None:
+                nonlocal rejected
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await client.post(path, json=payload)
+                    if response.status_code == 429:
+                        rejected += 1
+                        return
+                    if response.status_code != 200:
+                        raise RuntimeError(f"{path} returned {response.status_code}: {response.text}")
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(call() for _ in range(requests)))
+            result = summarize(latencies, wall_time=time.perf_counter() - started)
+            return {**result, 'rejected': rejected}
+
+    return asyncio.run(run())
+
+
+HEADLINES = synthetic_headlines(16, seed=1)
+
+# Case name -> (function, extra arguments); API concurrency matches each
+# endpoint's executor capacity so requests queue rather than being rejected
+CASES = {
+    'predictor.prepare_data': (predictor_prepare_data, {}),
+    'predictor.train': (predictor_train, {}),
+    'predictor.predict': (predictor_predict, {}),
+    **{
+        f'sentiment.analyze_texts[batch={size}]': (sentiment_batches, {'batch_size': size})
+        for size in (1, 8, 32, 128)
+    },
+    'api.financial': (api_endpoint, {
+        'path': '/api/data/financial', 'payload': {'symbol': 'AAPL'}, 'concurrency': 32
+    }),
+    'api.sentiment': (api_endpoint, {
+        'path': '/api/analysis/sentiment', 'payload': {'texts': HEADLINES}, 'concurrency': 8
+    }),
+    'api.prediction': (api_endpoint, {
+        'path': '/api/prediction/price', 'payload': {'symbol': 'AAPL'}, 'concurrency': 4
+    }),
+}
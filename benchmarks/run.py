@@ -0,0 +1,204 @@
+"""
+Run the benchmark suite and compare it against a stored baseline.
+
+    python -m benchmarks.run                    # run and compare
+    python -m benchmarks.run --update-baseline  # run and store as the baseline
+    python -m benchmarks.run -k sentiment       # only cases matching a substring
+
+Each case runs in a fresh process so peak RSS is measured per case. The
+exit status is 1 when any case regresses beyond the tolerance. Timings only
+compare on the machine they were recorded on, so the baseline stores a
+fingerprint of its runner (CPU, core count, Python and torch versions); when
+there is no baseline, or it comes from a different runner, the results are
+printed but the regression gate is skipped. Record the baseline on the
+machine that enforces the gate, with --repeat to take the median of several
+runs of each case.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+RUNNER_KEY = '_runner'
+
+# Metric -> whether larger values are better
+METRICS = {'p50_ms': False, 'p99_ms': False, 'throughput': True, 'peak_rss_mb': False}
+# p99 is noisy on shared machines, so it gets a wider margin
+TOLERANCE_FACTORS = {'p99_ms': 2.0}
+
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(name: str, scale: float) -> Dict[str, float]:
+    """Run one case; meant to be called in a fresh process."""
+    import torch
+    from benchmarks.cases import CASES
+
+    # Fixed threading keeps numbers comparable between runs
+    torch.set_num_threads(1)
+    fn, kwargs = CASES[name]
+    result = fn(scale, **kwargs)
+    result['peak_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def runner_fingerprint() -> Dict[str, str]:
+    """Properties of this machine that timings depend on."""
+    import torch
+
+    cpu = platform.processor()
+    try:
+        with open('/proc/cpuinfo') as f:
+            cpu = next(line.split(':', 1)[1].strip() for line in f if line.startswith('model name'))
+    except (OSError, StopIteration):
+        pass
+    return {
+        'machine': platform.machine(),
+        'cpu': cpu,
+        'cpu_count': str(os.cpu_count()),
+        'python': platform.python_version(),
+        'torch': torch.__version__
+    }
+
+
+def runner_mismatch(stored: Dict[str, str], current: Dict[str, str]) -> List[str]:
+    """Fingerprint fields in which the baseline's runner differs from this one."""
+    return [
+        f"{key}: {stored.get(key)!r} vs {value!r}"
+        for key, value in current.items()
+        if stored.get(key) != value
+    ]
+
+
+def median_metrics(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    """Per-metric median of repeated runs of a case."""
+    return {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+
+
+def run_isolated(fn, *args):
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        return executor.submit(fn, *args).result()
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float
+) -> List[str]:
+    """
+    List the metrics that regressed against the baseline.
+
+    Args:
+        results: Case name -> metrics from this run
+        baseline: Case name -> stored metrics
+        tolerance: Allowed relative change, e.g. 0.25 for 25%
+
+    Returns:
+        Human readable regressions (empty when the run passes)
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, higher_is_better in METRICS.items():
+            expected = baseline.get(name, {}).get(metric)
+            actual = metrics.get(metric)
+            if expected is None or actual is None or not expected:
+                continue
+            allowed = tolerance * TOLERANCE_FACTORS.get(metric, 1.0)
+            change = (actual - expected) / expected
+            if (higher_is_better and change < -allowed) or (not higher_is_better and change > allowed):
+                regressions.append(
+                    f"{name} {metric}: {actual:.2f} vs baseline {expected:.2f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def print_table(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]]
+) -> None:
+    print(f"{'case':<36} {'p50 ms':>10} {'p99 ms':>10} {'items/s':>12} {'rss MB':>8} {'vs base':>8}")
+    for name, metrics in results.items():
+        base = baseline.get(name, {}).get('throughput')
+        delta = f"{metrics['throughput'] / base - 1:+.0%}" if base else '-'
+        print(f"{name:<36} {metrics['p50_ms']:>10.2f} {metrics['p99_ms']:>10.2f} "
+              f"{metrics['throughput']:>12.1f} {metrics['peak_rss_mb']:>8.0f} {delta:>8}")
+
+
+def main(argv: List[str] = None) -> int:
+    from benchmarks.cases import CASES
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='pattern', default='', help='only run cases containing this substring')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline JSON file')
+    parser.add_argument('--update-baseline', action='store_true', help='store this run as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative regression')
+    parser.add_argument('--scale', type=float, default=1.0, help='multiplier on repetitions')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per case; the median of each metric is kept')
+    parser.add_argument('--output', help='also write results to this JSON file')
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.pattern in name]
+    if not names:
+        parser.error(f"no cases match {args.pattern!r}")
+
+    runner = run_isolated(runner_fingerprint)
+    results = {}
+    for name in names:
+        print(f"running {name}...", file=sys.stderr)
+        runs = [run_isolated(run_case, name, args.scale) for _ in range(max(args.repeat, 1))]
+        results[name] = median_metrics(runs)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    stored_runner = baseline.pop(RUNNER_KEY, None)
+
+    print_table(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        if stored_runner is not None and runner_mismatch(stored_runner, runner):
+            # Numbers from another machine cannot be mixed with these
+            baseline = {}
+        stored = {**baseline, **results, RUNNER_KEY: runner}
+        with open(args.baseline, 'w') as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}; regression gate skipped")
+        return 0
+    mismatch = runner_mismatch(stored_runner or {}, runner)
+    if mismatch:
+        print("Baseline was recorded on a different runner; regression gate skipped")
+        for difference in mismatch:
+            print(f"  {difference}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
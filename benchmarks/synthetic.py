@@ -0,0 +1,85 @@
+import hashlib
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import torch
+
+from src.data.sources import DataSource
+
+WORDS = (
+    'shares', 'rally', 'drop', 'earnings', 'beat', 'miss', 'guidance', 'record',
+    'revenue', 'plunge', 'upgrade', 'downgrade', 'merger', 'lawsuit', 'dividend'
+)
+
+
+def synthetic_prices(n: int = 1000, seed: int = 0, start: str = '2015-01-01') -> pd.Series:
+    """Geometric random walk of daily closes on business days."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(start, periods=n, name='Date')
+    return pd.Series(100 * np.exp(rng.normal(0, 0.01, n).cumsum()), index=index)
+
+
+def synthetic_headlines(n: int, seed: int = 0) -> List[str]:
+    """Headlines of varied length built from a small vocabulary."""
+    rng = np.random.default_rng(seed)
+    return [
+        ' '.join(rng.choice(WORDS, size=rng.integers(4, 40)))
+        for _ in range(n)
+    ]
+
+
+class SyntheticSource(DataSource):
+    """Deterministic OHLCV bars for any symbol, with no network access."""
+
+    def fetch(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        index = pd.bdate_range(start, end - pd.Timedelta(days=1), name='Date')
+        seed = int(hashlib.md5(symbol.encode('utf-8')).hexdigest()[:8], 16)
+        rng = np.random.default_rng(seed)
+        close = 100 * np.exp(rng.normal(0, 0.01, len(index)).cumsum())
+        return pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+            'Volume': rng.integers(1_000, 100_000, len(index))
+        }, index=index)
+
+    def company_info(self, symbol: str) -> Dict:
+        return {
+            'name': f"{symbol} Inc.",
+            'sector': 'Technology',
+            'industry': 'Software',
+            'market_cap': 1e11,
+            'pe_ratio': 25.0
+        }
+
+
+class StubSentimentModel:
+    """
+    Stand-in for a transformers sentiment pipeline with realistic cost shape.
+
+    Each call embeds the batch padded to its longest text and runs a small
+    matrix multiply per token, so the cost grows with batch size and padding
+    the way a transformer forward pass does, plus a fixed per-call overhead.
+    """
+    tokenizer = None
+
+    def __init__(self, width: int = 64, seed: int = 0):
+        generator = torch.Generator().manual_seed(seed)
+        self.embedding = torch.randn(256, width, generator=generator)
+        self.weight = torch.randn(width, width, generator=generator) / width ** 0.5
+        self.head = torch.randn(width, generator=generator)
+
+    def __call__(self, inputs, **kwargs):
+        batch = inputs if isinstance(inputs, list) else [inputs]
+        encoded = [text.encode('utf-8')[:512] for text in batch]
+        length = max(len(ids) for ids in encoded)
+        tokens = torch.zeros(len(batch), length, dtype=torch.long)
+        for i, ids in enumerate(encoded):
+            tokens[i, :len(ids)] = torch.tensor(list(ids))
+        with torch.inference_mode():
+            hidden = torch.tanh(self.embedding[tokens] @ self.weight)
+            hidden = torch.tanh(hidden @ self.weight)
+            logits = hidden.mean(dim=1) @ self.head
+        return [
+            {'label': 'POSITIVE' if logit > 0 else 'NEGATIVE', 'score': float(torch.sigmoid(logit.abs()))}
+            for logit in logits
+        ]
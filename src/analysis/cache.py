@@ -0,0 +1,159 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+# SQLite limits the number of bound parameters per statement
+SQLITE_BATCH = 500
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize a text and collapse runs of whitespace."""
+    return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+
+def cache_key(model_id: str, text: str) -> str:
+    """
+    Content address of a text scored by a given model.
+
+    Args:
+        model_id: Identifier of the sentiment model
+        text: Raw input text
+
+    Returns:
+        Hex digest identifying (model, normalized text)
+    """
+    payload = f"{model_id}\0{normalize_text(text)}".encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+class SentimentCache:
+    """
+    Two-tier cache of sentiment results keyed by `cache_key`.
+
+    Results live in an in-memory LRU and, when `db_path` is given, in a
+    SQLite table that survives restarts. Entries found on disk are promoted
+    to memory. Only the label and score are stored; callers re-attach the
+    text they asked about.
+    """
+
+    def __init__(self, capacity: int = 100_000, db_path: Optional[str] = None):
+        """
+        Args:
+            capacity: Maximum number of results held in memory
+            db_path: SQLite file for the on-disk tier (None keeps it in memory only)
+        """
+        self.capacity = capacity
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        self._memory: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment "
+                "(key TEXT PRIMARY KEY, label TEXT NOT NULL, score REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of the keys that were found to their results
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Dict] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                else:
+                    missing.append(key)
+
+            if self._db is not None and missing:
+                for start in range(0, len(missing), SQLITE_BATCH):
+                    chunk = missing[start:start + SQLITE_BATCH]
+                    rows = self._db.execute(
+                        "SELECT key, label, score FROM sentiment WHERE key IN "
+                        f"({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    for key, label, score in rows:
+                        found[key] = {'label': label, 'score': score}
+                        self._remember(key, found[key])
+                        self.disk_hits += 1
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, key: str, result: Dict) -> None:
+        self.put_many({key: result})
+
+    def put_many(self, results: Dict[str, Dict]) -> None:
+        """
+        Store several results.
+
+        Args:
+            results: Mapping of cache key to a result with 'label' and 'score'
+        """
+        entries = {
+            key: {'label': result['label'], 'score': float(result['score'])}
+            for key, result in results.items()
+        }
+        with self._lock:
+            for key, entry in entries.items():
+                self._remember(key, entry)
+            if self._db is not None and entries:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO sentiment (key, label, score) VALUES (?, ?, ?)",
+                    [(key, entry['label'], entry['score']) for key, entry in entries.items()]
+                )
+                self._db.commit()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters (`hits` is `memory_hits` plus `disk_hits`) and current memory size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'memory_hits': self.hits - self.disk_hits,
+                'disk_hits': self.disk_hits,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'size': len(self._memory)
+            }
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM sentiment")
+                self._db.commit()
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
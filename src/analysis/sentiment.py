@@ -1,15 +1,48 @@
-from transformers import pipeline
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Optional, Union
 import pandas as pd
 
+from src.analysis.cache import SentimentCache, cache_key
+from src.analysis.streaming import ChunkSource, score_stream
+from src.analysis.workers import SentimentWorkerPool
+from src.serving.metrics import stage
+
+DEFAULT_MODEL = "microsoft/phi-2@v1.0.0"  # Using a smaller, more stable model
+
 class SentimentAnalyzer:
-    def __init__(self):
-        self.model = pipeline(
-            "sentiment-analysis",
-            model="microsoft/phi-2@v1.0.0",  # Using a smaller, more stable model
-            device=-1,
-            trust_remote_code=False  # Explicitly refuse remote execution
-        )
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = 32,
+        max_length: int = 512,
+        model: Optional[Any] = None,
+        cache: Optional[SentimentCache] = None,
+        pool: Optional[SentimentWorkerPool] = None
+    ):
+        """
+        Args:
+            model_name: Hugging Face model used for sentiment classification
+            batch_size: Number of texts per pipeline forward pass
+            max_length: Texts longer than this many tokens are truncated
+            model: Pre-built pipeline to use instead of loading `model_name`
+            cache: Result cache consulted before running the model
+            pool: Worker processes to run inference in; the model is then
+                loaded by the workers rather than in this process
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.cache = cache
+        self.pool = pool
+        if model is None and pool is None:
+            # Imported here so importing this module does not pull in transformers
+            from transformers import pipeline
+            model = pipeline(
+                "sentiment-analysis",
+                model=model_name,
+                device=-1,
+                trust_remote_code=False  # Explicitly refuse remote execution
+            )
+        self.model = model
         
     def analyze_text(self, text: str) -> Dict:
         """
@@ -21,28 +54,127 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with sentiment analysis results
         """
+        if self.cache is None or not isinstance(text, str):
+            return self._analyze_uncached(text)
+        
+        key = cache_key(self.model_name, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._format_result(cached, text)
+        
+        result = self._analyze_uncached(text)
+        if 'error' not in result:
+            self.cache.put(key, result)
+        return result
+    
+    def _analyze_uncached(self, text: str) -> Dict:
+        if self.model is None:
+            return self.pool.score([text])[0]
         try:
-            result = self.model(text)[0]
-            return {
-                'label': result['label'],
-                'score': result['score'],
-                'text': text
-            }
+            result = self.model(text, truncation=True, max_length=self.max_length)[0]
+            return self._format_result(result, text)
         except Exception as e:
             print(f"Error analyzing text: {str(e)}")
             return {'error': str(e)}
 
-    def analyze_texts(self, texts: List[str]) -> List[Dict]:
+    def analyze_texts(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict]:
         """
         Analyze sentiment of multiple texts.
         
+        Identical texts are scored once, and texts already in the cache are
+        not sent to the model. The rest are sorted by token length and sent
+        to the pipeline in batches, so each forward pass pads to a similar
+        length. If a batch fails, its texts are retried one by one so a
+        single bad input only affects its own result.
+        
         Args:
             texts: List of texts to analyze
+            batch_size: Texts per forward pass (defaults to `self.batch_size`)
             
         Returns:
-            List of dictionaries with sentiment analysis results
+            List of dictionaries with sentiment analysis results, in input order
         """
-        return [self.analyze_text(text) for text in texts]
+        # Deduplicate by content address; non-string inputs are scored as-is
+        keys = [
+            cache_key(self.model_name, text) if isinstance(text, str) else f"invalid:{i}"
+            for i, text in enumerate(texts)
+        ]
+        unique = {}
+        for key, text in zip(keys, texts):
+            unique.setdefault(key, text)
+        
+        scored = self.cache.get_many(unique) if self.cache is not None else {}
+        pending = [key for key in unique if key not in scored]
+        pending_texts = [unique[key] for key in pending]
+        if self.pool is not None:
+            outputs = self.pool.score(pending_texts, batch_size)
+        else:
+            outputs = self._run_batches(pending_texts, batch_size)
+        
+        fresh = {}
+        for key, output in zip(pending, outputs):
+            scored[key] = output
+            if 'error' not in output and not key.startswith('invalid:'):
+                fresh[key] = output
+        if self.cache is not None and fresh:
+            self.cache.put_many(fresh)
+        
+        return [
+            scored[key] if 'error' in scored[key] else self._format_result(scored[key], text)
+            for key, text in zip(keys, texts)
+        ]
+    
+    def _run_batches(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict]:
+        """Score texts in length-sorted batches, isolating per-item failures."""
+        batch_size = batch_size or self.batch_size
+        with stage('sentiment.tokenization'):
+            lengths = self._token_lengths(texts)
+        order = sorted(range(len(texts)), key=lambda i: lengths[i])
+        
+        results: List[Optional[Dict]] = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            batch = [texts[i] for i in indices]
+            try:
+                with stage('sentiment.forward'):
+                    outputs = self.model(
+                        batch,
+                        batch_size=len(batch),
+                        truncation=True,
+                        max_length=self.max_length
+                    )
+                for i, text, output in zip(indices, batch, outputs):
+                    results[i] = self._format_result(output, text)
+            except Exception as e:
+                print(f"Error analyzing batch, retrying texts individually: {str(e)}")
+                for i, text in zip(indices, batch):
+                    results[i] = self._analyze_uncached(text)
+        
+        return results
+    
+    def _token_lengths(self, texts: List[str]) -> List[int]:
+        """Token count of each text, falling back to character count."""
+        tokenizer = getattr(self.model, 'tokenizer', None)
+        if tokenizer is not None:
+            try:
+                encoded = tokenizer(
+                    texts,
+                    truncation=True,
+                    max_length=self.max_length,
+                    add_special_tokens=True
+                )
+                return [len(ids) for ids in encoded['input_ids']]
+            except Exception:
+                pass
+        return [len(text) if isinstance(text, str) else 0 for text in texts]
+    
+    @staticmethod
+    def _format_result(result: Dict, text: str) -> Dict:
+        return {
+            'label': result['label'],
+            'score': result['score'],
+            'text': text
+        }
 
     def analyze_dataframe(
         self,
@@ -64,7 +196,30 @@ class SentimentAnalyzer:
             
         results = self.analyze_texts(df[text_column].tolist())
         
-        df['sentiment_label'] = [r['label'] for r in results]
-        df['sentiment_score'] = [r['score'] for r in results]
+        df['sentiment_label'] = [r.get('label') for r in results]
+        df['sentiment_score'] = [r.get('score') for r in results]
+        
+        return df
+
+    def analyze_stream(
+        self,
+        source: ChunkSource,
+        text_column: str,
+        output_path: str,
+        chunksize: int = 10_000,
+        resume: bool = True
+    ) -> Dict[str, float]:
+        """
+        Score a large corpus chunk by chunk without holding it in memory.
         
-        return df 
\ No newline at end of file
+        Args:
+            source: CSV or Parquet path, a DataFrame, or an iterable of DataFrames
+            text_column: Name of the column containing text
+            output_path: CSV file or '.parquet' directory for the results
+            chunksize: Rows per chunk for file and DataFrame sources
+            resume: Continue from the last completed chunk of a previous run
+            
+        Returns:
+            Dictionary with rows scored and rows/sec (see `score_stream`)
+        """
+        return score_stream(self, source, text_column, output_path, chunksize, resume) 
\ No newline at end of file
@@ -0,0 +1,160 @@
+import json
+import os
+import shutil
+import time
+from typing import Dict, Iterable, Iterator, Union
+
+import pandas as pd
+
+ChunkSource = Union[str, pd.DataFrame, Iterable[pd.DataFrame]]
+
+
+def score_frame(analyzer, df: pd.DataFrame, text_column: str) -> pd.DataFrame:
+    """
+    Score one chunk, returning a copy with sentiment columns added.
+
+    Args:
+        analyzer: SentimentAnalyzer used for scoring
+        df: Chunk containing text data
+        text_column: Name of the column containing text
+
+    Returns:
+        Copy of `df` with 'sentiment_label' and 'sentiment_score' columns
+    """
+    if text_column not in df.columns:
+        raise ValueError(f"Column {text_column} not found in DataFrame")
+
+    results = analyzer.analyze_texts(df[text_column].tolist())
+    scored = df.copy()
+    scored['sentiment_label'] = [r.get('label') for r in results]
+    scored['sentiment_score'] = [r.get('score') for r in results]
+    return scored
+
+
+def iter_chunks(source: ChunkSource, chunksize: int, skip_rows: int = 0) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a source in DataFrame chunks.
+
+    Args:
+        source: CSV or Parquet path, a DataFrame, or an iterable of DataFrames
+        chunksize: Rows per chunk for file and DataFrame sources
+        skip_rows: Leading data rows to skip (used when resuming)
+
+    Yields:
+        DataFrame chunks
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(skip_rows, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+        return
+
+    if isinstance(source, str) and source.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        skipped = 0
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize):
+            if skipped + batch.num_rows <= skip_rows:
+                skipped += batch.num_rows
+                continue
+            chunk = batch.to_pandas()
+            yield chunk.iloc[skip_rows - skipped:] if skipped < skip_rows else chunk
+            skipped = skip_rows
+        return
+
+    if isinstance(source, str):
+        # Skipped rows are never parsed; row 0 is the header
+        skip = range(1, skip_rows + 1) if skip_rows else None
+        yield from pd.read_csv(source, chunksize=chunksize, skiprows=skip)
+        return
+
+    skipped = 0
+    for chunk in source:
+        if skipped + len(chunk) <= skip_rows:
+            skipped += len(chunk)
+            continue
+        yield chunk.iloc[skip_rows - skipped:] if skipped < skip_rows else chunk
+        skipped = skip_rows
+
+
+def score_stream(
+    analyzer,
+    source: ChunkSource,
+    text_column: str,
+    output_path: str,
+    chunksize: int = 10_000,
+    resume: bool = True
+) -> Dict[str, float]:
+    """
+    Score a large corpus chunk by chunk, writing results as it goes.
+
+    Results are appended to a CSV file, or written as numbered part files
+    when `output_path` ends in '.parquet' (a directory is created). A
+    checkpoint next to the output records how many rows are complete and
+    the size of the output at that point, so an interrupted run resumes
+    after the last completed chunk without duplicating rows.
+
+    Args:
+        analyzer: SentimentAnalyzer used for scoring
+        source: CSV or Parquet path, a DataFrame, or an iterable of DataFrames
+        text_column: Name of the column containing text
+        output_path: CSV file or '.parquet' directory for the results
+        chunksize: Rows per chunk for file and DataFrame sources
+        resume: Continue from an existing checkpoint instead of starting over
+
+    Returns:
+        Dictionary with rows, chunks, seconds and rows_per_sec for this run
+    """
+    checkpoint_path = f"{output_path}.checkpoint"
+    parquet = output_path.endswith('.parquet')
+
+    state = {'rows': 0, 'parts': 0, 'bytes': 0}
+    if resume and os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            state = json.load(f)
+        if not parquet and os.path.exists(output_path):
+            # Drop anything written after the last checkpoint
+            with open(output_path, 'r+b') as f:
+                f.truncate(state['bytes'])
+    else:
+        # Starting over: clear results and the checkpoint of any earlier run
+        if os.path.isdir(output_path):
+            shutil.rmtree(output_path)
+        elif os.path.exists(output_path):
+            os.remove(output_path)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+    if parquet:
+        os.makedirs(output_path, exist_ok=True)
+
+    start_time = time.perf_counter()
+    rows = chunks = 0
+    for chunk in iter_chunks(source, chunksize, skip_rows=state['rows']):
+        scored = score_frame(analyzer, chunk, text_column)
+
+        if parquet:
+            part_path = os.path.join(output_path, f"part-{state['parts']:05d}.parquet")
+            scored.to_parquet(f"{part_path}.tmp", index=False)
+            os.replace(f"{part_path}.tmp", part_path)
+            state['parts'] += 1
+        else:
+            scored.to_csv(output_path, mode='a', header=state['bytes'] == 0, index=False)
+            state['bytes'] = os.path.getsize(output_path)
+
+        state['rows'] += len(chunk)
+        with open(f"{checkpoint_path}.tmp", 'w') as f:
+            json.dump(state, f)
+        os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+
+        rows += len(chunk)
+        chunks += 1
+        elapsed = time.perf_counter() - start_time
+        print(f"Scored {state['rows']} rows ({rows / elapsed:.0f} rows/sec)")
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        'rows': rows,
+        'chunks': chunks,
+        'total_rows': state['rows'],
+        'seconds': elapsed,
+        'rows_per_sec': rows / elapsed if elapsed > 0 else 0.0
+    }
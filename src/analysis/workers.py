@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# Per-process analyzer, created once by the pool initializer
+_worker_analyzer = None
+
+
+def _init_worker(
+    model_name: str,
+    batch_size: int,
+    max_length: int,
+    num_threads: int,
+    model_factory: Optional[Callable[[], Any]]
+) -> None:
+    import torch
+    from src.analysis.sentiment import SentimentAnalyzer
+
+    # Each worker gets its own slice of the cores instead of all of them
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+
+    global _worker_analyzer
+    model = model_factory() if model_factory is not None else None
+    _worker_analyzer = SentimentAnalyzer(model_name, batch_size, max_length, model=model)
+
+
+def _score_batch(texts: List[str]) -> List[Dict]:
+    return _worker_analyzer._run_batches(texts)
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+class SentimentWorkerPool:
+    """
+    Pool of processes that each hold a loaded sentiment model.
+
+    Texts are sorted by length and dealt out one batch per task, so workers
+    stay busy and each batch pads to a similar length. Torch intra-op
+    threads are split between workers to avoid oversubscribing the CPU.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        model_name: Optional[str] = None,
+        batch_size: int = 32,
+        max_length: int = 512,
+        threads_per_worker: Optional[int] = None,
+        model_factory: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Args:
+            num_workers: Worker processes (defaults to the number of CPUs)
+            model_name: Hugging Face model each worker loads
+            batch_size: Texts per forward pass and per task
+            max_length: Texts longer than this many tokens are truncated
+            threads_per_worker: Torch intra-op threads per worker (defaults to
+                an even split of the CPUs)
+            model_factory: Picklable callable returning a pipeline, used
+                instead of loading `model_name`
+        """
+        from src.analysis.sentiment import DEFAULT_MODEL
+
+        cpus = os.cpu_count() or 1
+        self.num_workers = num_workers or cpus
+        self.model_name = model_name or DEFAULT_MODEL
+        self.batch_size = batch_size
+        self.threads_per_worker = threads_per_worker or max(1, cpus // self.num_workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(
+                self.model_name,
+                batch_size,
+                max_length,
+                self.threads_per_worker,
+                model_factory
+            )
+        )
+
+    def score(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict]:
+        """
+        Score texts across the worker processes.
+
+        Args:
+            texts: Texts to analyze
+            batch_size: Texts per task (defaults to the pool's batch size)
+
+        Returns:
+            List of results in input order
+        """
+        batch_size = batch_size or self.batch_size
+        order = sorted(
+            range(len(texts)),
+            key=lambda i: len(texts[i]) if isinstance(texts[i], str) else 0
+        )
+        shards = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+        futures = [
+            self._executor.submit(_score_batch, [texts[i] for i in shard])
+            for shard in shards
+        ]
+
+        results: List[Optional[Dict]] = [None] * len(texts)
+        for shard, future in zip(shards, futures):
+            for i, result in zip(shard, future.result()):
+                results[i] = result
+        return results
+
+    def worker_pids(self) -> List[int]:
+        """Process ids of the running workers."""
+        futures = [self._executor.submit(_worker_pid) for _ in range(self.num_workers * 4)]
+        return sorted({future.result() for future in futures})
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_shared_pool: Optional[SentimentWorkerPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_pool(**kwargs) -> SentimentWorkerPool:
+    """
+    Process-wide worker pool shared by the API and offline bulk scoring.
+
+    The first call creates the pool with `kwargs`; later calls return it.
+
+    Returns:
+        Shared SentimentWorkerPool
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = SentimentWorkerPool(**kwargs)
+        return _shared_pool
@@ -0,0 +1,3 @@
+"""
+Historical evaluation of price forecasts
+"""
@@ -0,0 +1,74 @@
+"""
+Walk-forward backtest of the price predictor on local or synthetic data.
+
+    python -m src.backtest AAPL MSFT              # bars already in the local store
+    python -m src.backtest --synthetic 4          # four random-walk series
+    python -m src.backtest AAPL --max-updates 4   # fine-tune between full retrains
+
+Nothing is fetched from upstream: symbols are read from the Parquet store
+in QUANTBRAIN_DATA_DIR (default artifacts/market_data).
+"""
+import argparse
+import os
+import sys
+from typing import List
+
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_prices
+from src.backtest.walk_forward import WalkForwardBacktest
+from src.data.store import OHLCVStore
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('symbols', nargs='*', help='symbols to read from the local store')
+    parser.add_argument('--synthetic', type=int, default=0, help='number of synthetic series to add')
+    parser.add_argument('--length', type=int, default=1000, help='bars per synthetic series')
+    parser.add_argument('--horizon', type=int, default=5)
+    parser.add_argument('--step', type=int, default=20, help='bars between cut-offs')
+    parser.add_argument('--min-train', type=int, default=250, help='bars before the first cut-off')
+    parser.add_argument('--train-window', type=int, help='train on this many recent bars (default: all)')
+    parser.add_argument('--epochs', type=int, default=20)
+    parser.add_argument('--max-updates', type=int, default=0, help='fine-tuned folds per full training')
+    parser.add_argument('--workers', type=int, help='worker processes (0 runs in this process)')
+    parser.add_argument('--cost', type=float, default=0.0, help='round-trip cost as a fraction')
+    parser.add_argument('--output', help='write every forecast to this CSV file')
+    args = parser.parse_args(argv)
+
+    prices = {f"SYN{i}": synthetic_prices(args.length, seed=i) for i in range(args.synthetic)}
+    store = OHLCVStore(os.getenv("QUANTBRAIN_DATA_DIR", "artifacts/market_data"))
+    for symbol in args.symbols:
+        bars = store.read(symbol.upper())
+        if bars.empty:
+            print(f"No local bars for {symbol}; fetch them through the API first", file=sys.stderr)
+            continue
+        prices[symbol.upper()] = bars['Close']
+    if not prices:
+        parser.error("no price data to backtest")
+
+    backtest = WalkForwardBacktest(
+        horizon=args.horizon,
+        min_train=args.min_train,
+        step=args.step,
+        train_window=args.train_window,
+        max_updates=args.max_updates,
+        train_kwargs={'epochs': args.epochs},
+        workers=args.workers
+    )
+    result = backtest.run(prices)
+
+    with pd.option_context('display.width', 160, 'display.max_columns', None):
+        print(result.metrics(cost=args.cost).round(4))
+        print()
+        print(result.summary(cost=args.cost).round(4))
+        refits = result.folds.groupby('refit')['train_seconds'].agg(['count', 'mean'])
+        print()
+        print(refits.round(3))
+    if args.output:
+        result.predictions.to_csv(args.output, index=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+# Columns every predictions frame passed to `forecast_metrics` must have
+PREDICTION_COLUMNS = ('symbol', 'cutoff', 'date', 'step', 'previous', 'actual', 'predicted')
+
+
+def strategy_returns(
+    predicted: np.ndarray,
+    actual: np.ndarray,
+    previous: np.ndarray,
+    cost: float = 0.0
+) -> np.ndarray:
+    """
+    Returns of trading on each forecast's direction.
+
+    A forecast above the last observed close goes long at that close, one
+    below it goes short, and the position is closed at the actual close of
+    the forecast date. A flat forecast stays out of the market.
+
+    Args:
+        predicted: Forecast closes
+        actual: Realized closes
+        previous: Last observed close at each forecast's cut-off
+        cost: Round-trip cost as a fraction of notional
+
+    Returns:
+        Simple return per forecast
+    """
+    position = np.sign(predicted - previous)
+    return position * (actual / previous - 1) - cost * np.abs(position)
+
+
+def forecast_metrics(
+    predictions: pd.DataFrame,
+    by: Sequence[str] = ('symbol', 'step'),
+    cost: float = 0.0
+) -> pd.DataFrame:
+    """
+    Error and PnL metrics of backtested forecasts, per group.
+
+    Everything is computed column-wise and aggregated with one groupby:
+    MAE, RMSE, MAPE (percent), directional accuracy (share of forecasts
+    whose direction from the last observed close was right) and the
+    returns of `strategy_returns`. PnL is summed per unit of capital, not
+    compounded, and the drawdown is taken over that running sum in cut-off
+    order.
+
+    Args:
+        predictions: Frame with `PREDICTION_COLUMNS`, one row per forecast
+        by: Columns to group by; empty for a single overall row
+        cost: Round-trip trading cost as a fraction of notional
+
+    Returns:
+        DataFrame of metrics indexed by `by`
+    """
+    frame = predictions.sort_values(['cutoff', 'symbol', 'step'])
+    keys = list(by) or ['scope']
+    predicted = frame['predicted'].to_numpy(dtype=np.float64)
+    actual = frame['actual'].to_numpy(dtype=np.float64)
+    previous = frame['previous'].to_numpy(dtype=np.float64)
+    error = predicted - actual
+
+    columns = pd.DataFrame({
+        'abs_error': np.abs(error),
+        'squared_error': error ** 2,
+        'pct_error': np.abs(error) / np.abs(actual) * 100,
+        'direction_hit': np.sign(predicted - previous) == np.sign(actual - previous),
+        'pnl': strategy_returns(predicted, actual, previous, cost)
+    }, index=frame.index)
+    columns['win'] = columns['pnl'] > 0
+    for key in keys:
+        columns[key] = frame[key] if key in frame else 'all'
+
+    columns['equity'] = columns.groupby(keys)['pnl'].cumsum()
+    columns['drawdown'] = columns.groupby(keys)['equity'].cummax().clip(lower=0) - columns['equity']
+
+    metrics = columns.groupby(keys, sort=True).agg(
+        forecasts=('pnl', 'size'),
+        mae=('abs_error', 'mean'),
+        rmse=('squared_error', 'mean'),
+        mape=('pct_error', 'mean'),
+        directional_accuracy=('direction_hit', 'mean'),
+        mean_return=('pnl', 'mean'),
+        total_return=('pnl', 'sum'),
+        volatility=('pnl', 'std'),
+        hit_rate=('win', 'mean'),
+        max_drawdown=('drawdown', 'max')
+    )
+    metrics['rmse'] = np.sqrt(metrics['rmse'])
+    metrics['sharpe'] = metrics['mean_return'] / metrics['volatility'].replace(0, np.nan)
+    return metrics
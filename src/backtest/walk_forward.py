@@ -0,0 +1,335 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import torch
+from sklearn.preprocessing import MinMaxScaler
+
+from src.backtest.metrics import PREDICTION_COLUMNS, forecast_metrics
+from src.models.price_predictor import PricePredictor, torch_threads
+from src.models.windowing import make_windows
+
+# Per-process fold runner, created once by the pool initializer
+_worker_runner = None
+
+
+def _init_worker(prices: Dict[str, pd.Series], config: Dict[str, Any], num_threads: int) -> None:
+    # Each worker gets its own slice of the cores instead of all of them
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+
+    global _worker_runner
+    _worker_runner = FoldRunner(prices, **config)
+
+
+def _run_folds(symbol: str, cutoffs: List[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    return _worker_runner.run(symbol, cutoffs)
+
+
+def walk_forward_cutoffs(length: int, min_train: int, horizon: int, step: int) -> List[int]:
+    """
+    Rolling-origin cut-offs over a series.
+
+    A cut-off is the position of the first bar a fold has not seen: the
+    model trains on bars before it and forecasts the `horizon` bars from it.
+
+    Args:
+        length: Number of bars in the series
+        min_train: Bars before the first cut-off
+        horizon: Bars forecast per fold
+        step: Bars between consecutive cut-offs
+
+    Returns:
+        Cut-off positions, oldest first
+    """
+    if step < 1 or horizon < 1:
+        raise ValueError("step and horizon must be at least 1")
+    return list(range(min_train, length - horizon + 1, step))
+
+
+class FoldRunner:
+    """
+    Trains and forecasts the folds of one or more series.
+
+    Each series is windowed once, unscaled, and every fold slices the
+    windows it may train on out of those tensors. Min-max scaling is affine,
+    so a fold's scaled windows are one multiply-add over the slice instead
+    of re-windowing its training series. A process keeps the raw windows
+    for all the folds it runs.
+    """
+
+    def __init__(
+        self,
+        prices: Dict[str, pd.Series],
+        sequence_length: int = 10,
+        horizon: int = 5,
+        train_window: Optional[int] = None,
+        train_kwargs: Optional[Dict[str, Any]] = None,
+        update_kwargs: Optional[Dict[str, Any]] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            prices: Symbol -> close prices
+            sequence_length: Timesteps per input window
+            horizon: Bars forecast per fold
+            train_window: Most recent bars each fold trains on (None for an
+                expanding window over all earlier bars)
+            train_kwargs: Keyword arguments forwarded to `PricePredictor.train`
+            update_kwargs: Keyword arguments forwarded to `PricePredictor.update`
+            seed: Base seed; each fold seeds torch with seed + cut-off
+        """
+        self.prices = prices
+        self.sequence_length = sequence_length
+        self.horizon = horizon
+        self.train_window = train_window
+        self.train_kwargs = train_kwargs or {}
+        self.update_kwargs = update_kwargs or {}
+        self.seed = seed
+        self._windows: Dict[str, Tuple[torch.Tensor, torch.Tensor]] = {}
+
+    def fold_windows(self, symbol: str, start: int, cutoff: int, scaler: MinMaxScaler) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Scaled windows lying entirely within bars [start, cutoff).
+
+        Args:
+            symbol: Series to window
+            start: First training bar
+            cutoff: First bar the fold has not seen
+            scaler: Scaler fitted on the training bars
+
+        Returns:
+            Tuple of (X, y) tensors
+        """
+        if symbol not in self._windows:
+            self._windows[symbol] = make_windows(self.prices[symbol].to_numpy(dtype=np.float64), self.sequence_length)
+        X, y = self._windows[symbol]
+        scale, offset = float(scaler.scale_[0]), float(scaler.min_[0])
+        end = max(cutoff - self.sequence_length, start)
+        return X[start:end] * scale + offset, y[start:end] * scale + offset
+
+    def run(self, symbol: str, cutoffs: Sequence[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Run consecutive folds of one series.
+
+        The first fold trains from scratch; later ones fine-tune that model
+        with `PricePredictor.update` on the bars added since the previous
+        cut-off.
+
+        Args:
+            symbol: Series to backtest
+            cutoffs: Cut-off positions, oldest first
+
+        Returns:
+            Tuple of (predictions, folds) frames
+        """
+        series = self.prices[symbol]
+        values = series.to_numpy(dtype=np.float64)
+        predictions, folds = [], []
+        predictor, previous_cutoff = None, None
+
+        for cutoff in cutoffs:
+            start = max(cutoff - self.train_window, 0) if self.train_window else 0
+            torch.manual_seed(self.seed + cutoff)
+            started = time.perf_counter()
+            if predictor is None:
+                predictor = PricePredictor(self.sequence_length)
+                predictor.scaler.fit(values[start:cutoff].reshape(-1, 1))
+                losses = predictor.train(
+                    series.iloc[start:cutoff],
+                    windows=self.fold_windows(symbol, start, cutoff, predictor.scaler),
+                    **self.train_kwargs
+                )
+                refit = 'train'
+            else:
+                losses = predictor.update(series.iloc[previous_cutoff:cutoff], **self.update_kwargs)
+                refit = 'update'
+            train_seconds = time.perf_counter() - started
+            previous_cutoff = cutoff
+
+            forecast = predictor.predict(series.iloc[cutoff - self.sequence_length:cutoff], self.horizon)
+            end = cutoff + self.horizon
+            predictions.append(pd.DataFrame({
+                'symbol': symbol,
+                'cutoff': series.index[cutoff - 1],
+                'date': series.index[cutoff:end],
+                'step': np.arange(1, self.horizon + 1),
+                'previous': values[cutoff - 1],
+                'actual': values[cutoff:end],
+                'predicted': forecast.to_numpy()
+            }))
+            folds.append({
+                'symbol': symbol,
+                'cutoff': series.index[cutoff - 1],
+                'refit': refit,
+                'train_size': cutoff - start,
+                'train_seconds': train_seconds,
+                'loss': losses[-1] if losses else float('nan')
+            })
+
+        return pd.concat(predictions, ignore_index=True), pd.DataFrame(folds)
+
+
+class BacktestResult:
+    """Forecasts and per-fold training statistics of a backtest."""
+
+    def __init__(self, predictions: pd.DataFrame, folds: pd.DataFrame):
+        """
+        Args:
+            predictions: One row per forecast with `PREDICTION_COLUMNS`
+            folds: One row per fold with its refit kind, training size,
+                training time and final loss
+        """
+        self.predictions = predictions
+        self.folds = folds
+
+    def metrics(self, by: Sequence[str] = ('symbol', 'step'), cost: float = 0.0) -> pd.DataFrame:
+        """
+        Error and PnL metrics per group (see `forecast_metrics`).
+
+        Args:
+            by: Prediction columns to group by; empty for one overall row
+            cost: Round-trip trading cost as a fraction of notional
+
+        Returns:
+            DataFrame of metrics indexed by `by`
+        """
+        return forecast_metrics(self.predictions, by, cost)
+
+    def summary(self, cost: float = 0.0) -> pd.DataFrame:
+        """Metrics per forecast step across all symbols."""
+        return self.metrics(('step',), cost)
+
+
+class WalkForwardBacktest:
+    """
+    Rolling-origin evaluation of `PricePredictor` forecasts.
+
+    Every symbol's history is cut at regular intervals; at each cut-off a
+    model is trained on earlier bars only and forecasts the next `horizon`
+    bars, which are then compared with what actually happened. Folds run in
+    a process pool, so many cut-offs and symbols can be evaluated at once.
+
+    With `max_updates` > 0, a fold that trains from scratch is followed by
+    up to that many folds fine-tuned on the new bars, which is how the model
+    registry refreshes models, so the cost and accuracy of both retraining
+    policies can be compared.
+    """
+
+    def __init__(
+        self,
+        horizon: int = 5,
+        min_train: int = 250,
+        step: int = 20,
+        train_window: Optional[int] = None,
+        sequence_length: int = 10,
+        max_updates: int = 0,
+        train_kwargs: Optional[Dict[str, Any]] = None,
+        update_kwargs: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            horizon: Bars forecast per fold
+            min_train: Bars before the first cut-off
+            step: Bars between consecutive cut-offs
+            train_window: Most recent bars each fold trains on (None for an
+                expanding window)
+            sequence_length: Timesteps per input window
+            max_updates: Folds fine-tuned after each full training
+            train_kwargs: Keyword arguments forwarded to `PricePredictor.train`
+            update_kwargs: Keyword arguments forwarded to `PricePredictor.update`
+            workers: Worker processes (defaults to the number of CPUs; 0
+                runs every fold in this process)
+            threads_per_worker: Torch intra-op threads per worker (defaults to
+                an even split of the CPUs)
+            seed: Base seed for model initialization
+        """
+        if min_train <= sequence_length:
+            raise ValueError("min_train must be greater than sequence_length")
+
+        cpus = os.cpu_count() or 1
+        self.horizon = horizon
+        self.min_train = min_train
+        self.step = step
+        self.max_updates = max_updates
+        self.workers = cpus if workers is None else workers
+        self.threads_per_worker = threads_per_worker or max(1, cpus // max(self.workers, 1))
+        self.config = {
+            'sequence_length': sequence_length,
+            'horizon': horizon,
+            'train_window': train_window,
+            'train_kwargs': train_kwargs,
+            'update_kwargs': update_kwargs,
+            'seed': seed
+        }
+
+    def tasks(self, prices: Dict[str, pd.Series]) -> List[Tuple[str, List[int]]]:
+        """
+        Split the folds into units of work.
+
+        Each task is one full training followed by its fine-tuned folds, so
+        tasks are independent and can run in any process.
+
+        Args:
+            prices: Symbol -> close prices
+
+        Returns:
+            List of (symbol, cut-offs) pairs
+        """
+        group = self.max_updates + 1
+        tasks = []
+        for symbol, series in prices.items():
+            cutoffs = walk_forward_cutoffs(len(series), self.min_train, self.horizon, self.step)
+            tasks.extend(
+                (symbol, cutoffs[start:start + group])
+                for start in range(0, len(cutoffs), group)
+            )
+        return tasks
+
+    def run(self, prices: Union[pd.Series, Dict[str, pd.Series]]) -> BacktestResult:
+        """
+        Backtest one or more series.
+
+        Args:
+            prices: Close prices, or symbol -> close prices
+
+        Returns:
+            BacktestResult with every forecast and fold
+        """
+        if isinstance(prices, pd.Series):
+            prices = {prices.name or 'series': prices}
+        tasks = self.tasks(prices)
+        if not tasks:
+            raise ValueError(f"Need more than {self.min_train + self.horizon - 1} bars to backtest")
+
+        if self.workers == 0:
+            runner = FoldRunner(prices, **self.config)
+            with torch_threads(self.threads_per_worker):
+                results = [runner.run(symbol, cutoffs) for symbol, cutoffs in tasks]
+        else:
+            # Spawned workers start without the parent's torch thread pools
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(tasks)),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(prices, self.config, self.threads_per_worker)
+            ) as executor:
+                futures = [executor.submit(_run_folds, symbol, cutoffs) for symbol, cutoffs in tasks]
+                results = [future.result() for future in futures]
+
+        predictions = pd.concat([result[0] for result in results], ignore_index=True)
+        folds = pd.concat([result[1] for result in results], ignore_index=True)
+        return BacktestResult(
+            predictions.sort_values(['symbol', 'cutoff', 'step'], ignore_index=True)[list(PREDICTION_COLUMNS)],
+            folds.sort_values(['symbol', 'cutoff'], ignore_index=True)
+        )
@@ -0,0 +1,3 @@
+"""
+Data retrieval and processing module
+"""
\ No newline at end of file
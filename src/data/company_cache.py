@@ -0,0 +1,292 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from src.data.singleflight import SingleFlight
+from src.serving.metrics import REGISTRY
+
+# Descriptive fields rarely change; valuation fields move with the price
+FIELD_TTLS = {
+    'name': timedelta(days=7),
+    'sector': timedelta(days=7),
+    'industry': timedelta(days=7),
+    'market_cap': timedelta(minutes=5),
+    'pe_ratio': timedelta(minutes=5)
+}
+
+COMPANY_INFO_LOOKUPS = REGISTRY.counter(
+    'quantbrain_company_info_lookups_total',
+    'Company info lookups by outcome (fresh, stale: served while refreshing, miss: fetched upstream)',
+    labels=('result',)
+)
+
+
+class CompanyEntry:
+    """Cached fields of one company and when each was last fetched."""
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None, fetched_at: Optional[Dict[str, float]] = None):
+        self.values = values or {}
+        self.fetched_at = fetched_at or {}
+        # Last time upstream was asked, including when it knew nothing
+        self.checked_at = max(self.fetched_at.values(), default=0.0)
+
+    def merge(self, values: Dict[str, Any], now: float) -> 'CompanyEntry':
+        """
+        Entry updated with newly fetched values.
+
+        Fields upstream did not return (or returned as None) keep their
+        previous value and age; a None never seen before is kept as None.
+        """
+        merged = CompanyEntry(dict(self.values), dict(self.fetched_at))
+        for field, value in values.items():
+            if value is not None:
+                merged.values[field] = value
+                merged.fetched_at[field] = now
+            else:
+                merged.values.setdefault(field, None)
+        merged.checked_at = now
+        return merged
+
+
+class CompanyInfoCache:
+    """
+    Company metadata cache with per-field TTLs and stale-while-revalidate.
+
+    Each field is fresh for its own TTL, so a lookup that finds a stale
+    market cap still answers immediately from the cache and refreshes the
+    symbol in the background. Only symbols never seen (or older than
+    `max_stale`) wait for upstream, and concurrent misses for a symbol share
+    one fetch. Unknown symbols are remembered for `negative_ttl`.
+
+    Entries are periodically written to a JSON snapshot and reloaded on
+    startup, so a restart serves from the cache straight away.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Dict[str, Any]],
+        field_ttls: Optional[Dict[str, timedelta]] = None,
+        default_ttl: timedelta = timedelta(minutes=5),
+        max_stale: timedelta = timedelta(days=30),
+        negative_ttl: timedelta = timedelta(minutes=5),
+        snapshot_path: Optional[str] = None,
+        snapshot_interval: timedelta = timedelta(minutes=1),
+        refresh_workers: int = 4
+    ):
+        """
+        Args:
+            fetch: Returns a symbol's metadata, or an empty dict if unknown
+            field_ttls: Field -> time it stays fresh (defaults to `FIELD_TTLS`)
+            default_ttl: Freshness of fields not in `field_ttls`
+            max_stale: Age beyond which a stale entry is no longer served
+                and lookups wait for a refresh
+            negative_ttl: How long an unknown symbol is remembered
+            snapshot_path: JSON file the cache is saved to and restored
+                from (None keeps it in memory only)
+            snapshot_interval: Minimum time between snapshot writes
+            refresh_workers: Background refresh threads
+        """
+        self.fetch = fetch
+        self.field_ttls = {
+            field: ttl.total_seconds()
+            for field, ttl in (FIELD_TTLS if field_ttls is None else field_ttls).items()
+        }
+        self.default_ttl = default_ttl.total_seconds()
+        self.max_stale = max_stale.total_seconds()
+        self.negative_ttl = negative_ttl.total_seconds()
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval.total_seconds()
+
+        self._entries: Dict[str, CompanyEntry] = {}
+        self._lock = threading.Lock()
+        # Refresh threads may all reach `save` at once
+        self._save_lock = threading.Lock()
+        self._flights = SingleFlight()
+        self._refreshing: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_workers,
+            thread_name_prefix="company-refresh"
+        )
+        self._dirty = False
+        self._saved_at = time.time()
+
+        if snapshot_path:
+            self._load_snapshot()
+
+    def get(self, symbol: str, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Metadata for a symbol, served from the cache whenever possible.
+
+        Args:
+            symbol: Stock symbol
+            fields: Fields whose freshness matters (defaults to all cached
+                fields); e.g. ('name', 'sector') never triggers a refresh
+                just because the market cap aged
+
+        Returns:
+            Dictionary of fields; empty if upstream does not know the symbol
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            entry = self._entries.get(symbol)
+
+        now = time.time()
+        if entry is None or now - entry.checked_at > self.max_stale:
+            COMPANY_INFO_LOOKUPS.inc(result='miss')
+            try:
+                entry = self._flights.do(symbol, self._refresh, symbol)
+            except Exception:
+                if entry is None:
+                    raise
+                # Upstream is down; an old answer beats none
+                print(f"Serving expired company info for {symbol}")
+        elif self._is_fresh(entry, now, fields):
+            COMPANY_INFO_LOOKUPS.inc(result='fresh')
+        else:
+            COMPANY_INFO_LOOKUPS.inc(result='stale')
+            self.refresh(symbol)
+        return dict(entry.values)
+
+    def refresh(self, symbol: str) -> Future:
+        """
+        Refetch a symbol in the background.
+
+        Repeated calls while a refresh is running return the same future.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Future resolving to the updated fields
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            future = self._refreshing.get(symbol)
+            if future is None:
+                future = self._executor.submit(self._background_refresh, symbol)
+                self._refreshing[symbol] = future
+            return future
+
+    def prewarm(self, symbols: Iterable[str], wait: bool = False) -> List[Future]:
+        """
+        Refresh every symbol that is missing or stale.
+
+        Args:
+            symbols: Symbol universe to keep warm
+            wait: Block until every refresh finished, then save a snapshot
+
+        Returns:
+            Futures of the refreshes that were started
+        """
+        now = time.time()
+        futures = []
+        for symbol in dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()):
+            with self._lock:
+                entry = self._entries.get(symbol)
+            if entry is None or not self._is_fresh(entry, now):
+                futures.append(self.refresh(symbol))
+        if wait:
+            for future in futures:
+                future.exception()
+            self.save()
+        return futures
+
+    def peek(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Cached fields of a symbol regardless of age, without fetching."""
+        with self._lock:
+            entry = self._entries.get(symbol.upper())
+        return dict(entry.values) if entry is not None else None
+
+    def save(self) -> None:
+        """Write the snapshot now, if there is anything new to write."""
+        if not self.snapshot_path:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = {
+                    symbol: {'values': entry.values, 'fetched_at': entry.fetched_at, 'checked_at': entry.checked_at}
+                    for symbol, entry in self._entries.items()
+                }
+                self._dirty = False
+                self._saved_at = time.time()
+
+            directory = os.path.dirname(self.snapshot_path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            # Write to a unique temporary file first so a crash (or another
+            # process) never leaves a partial snapshot
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, self.snapshot_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def close(self) -> None:
+        """
+        Stop background refreshes and write a final snapshot.
+
+        The cache cannot refresh afterwards; servers that may restart in
+        the same process should only `save`.
+        """
+        self._executor.shutdown(wait=True)
+        self.save()
+
+    def _is_fresh(self, entry: CompanyEntry, now: float, fields: Optional[Sequence[str]] = None) -> bool:
+        if not entry.values:
+            return now - entry.checked_at <= self.negative_ttl
+        for field in fields if fields is not None else entry.values:
+            fetched_at = entry.fetched_at.get(field)
+            if fetched_at is None:
+                # Upstream never had it; asking again on every stale check would not help
+                if now - entry.checked_at > self.field_ttls.get(field, self.default_ttl):
+                    return False
+            elif now - fetched_at > self.field_ttls.get(field, self.default_ttl):
+                return False
+        return True
+
+    def _refresh(self, symbol: str) -> CompanyEntry:
+        values = self.fetch(symbol) or {}
+        with self._lock:
+            previous = self._entries.get(symbol, CompanyEntry())
+            entry = previous.merge(values, time.time())
+            self._entries[symbol] = entry
+            self._dirty = True
+            due = time.time() - self._saved_at >= self.snapshot_interval
+        if due:
+            self.save()
+        return entry
+
+    def _background_refresh(self, symbol: str) -> Dict[str, Any]:
+        try:
+            return self._flights.do(symbol, self._refresh, symbol).values
+        except Exception as e:
+            print(f"Error refreshing company info for {symbol}: {str(e)}")
+            raise
+        finally:
+            with self._lock:
+                self._refreshing.pop(symbol, None)
+
+    def _load_snapshot(self) -> None:
+        if not os.path.exists(self.snapshot_path):
+            return
+        try:
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading company info snapshot: {str(e)}")
+            return
+        for symbol, state in snapshot.items():
+            entry = CompanyEntry(state.get('values'), state.get('fetched_at'))
+            entry.checked_at = state.get('checked_at', entry.checked_at)
+            self._entries[symbol] = entry
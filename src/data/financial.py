@@ -0,0 +1,194 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from src.data.singleflight import SingleFlight
+from src.data.sources import OHLCV_COLUMNS, DataSource, YFinanceSource, normalize_bars
+from src.data.store import OHLCVStore
+from src.serving.metrics import stage
+
+DEFAULT_PERIOD = '1y'
+
+DateLike = Union[datetime, pd.Timestamp, str]
+
+
+def period_start(period: str, end: pd.Timestamp) -> pd.Timestamp:
+    """
+    Start date of a yfinance-style period ('5d', '1mo', '1y', 'ytd', 'max').
+
+    Args:
+        period: Period string
+        end: Date the period ends at
+
+    Returns:
+        First date of the period
+    """
+    if period == 'max':
+        return pd.Timestamp('1970-01-01')
+    if period == 'ytd':
+        return pd.Timestamp(year=end.year, month=1, day=1)
+
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    count, unit = int(match.group(1)), match.group(2)
+    offsets = {
+        'd': pd.DateOffset(days=count),
+        'wk': pd.DateOffset(weeks=count),
+        'mo': pd.DateOffset(months=count),
+        'y': pd.DateOffset(years=count)
+    }
+    return end - offsets[unit]
+
+
+class FinancialData:
+    def __init__(
+        self,
+        source: Optional[DataSource] = None,
+        store: Optional[OHLCVStore] = None,
+        fetch_workers: int = 8,
+        open_range_ttl: timedelta = timedelta(minutes=5)
+    ):
+        """
+        Args:
+            source: Upstream data provider (defaults to Yahoo Finance)
+            store: Local bar store; when given, requests are served from it
+                and only date ranges it has not seen are fetched upstream
+            fetch_workers: Concurrent fetches allowed for bulk requests
+            open_range_ttl: How long today's still-forming bars are served
+                from the store before being fetched upstream again
+        """
+        self.source = source or YFinanceSource()
+        self.store = store
+        self.open_range_ttl = open_range_ttl
+        self._flights = SingleFlight()
+        self._fetch_pool = ThreadPoolExecutor(fetch_workers, thread_name_prefix="fetch")
+
+    def get_stock_data(
+        self,
+        symbol: str,
+        start_date: Optional[DateLike] = None,
+        end_date: Optional[DateLike] = None,
+        period: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Get daily OHLCV bars for a stock.
+
+        Concurrent calls for the same symbol and range share one fetch, and
+        therefore the same returned DataFrame.
+
+        Args:
+            symbol: Stock symbol
+            start_date: First date to include (defaults to the start of `period`)
+            end_date: Last date to include (defaults to today)
+            period: Lookback used when `start_date` is omitted, e.g. '1mo'
+
+        Returns:
+            DataFrame with Open, High, Low, Close and Volume columns indexed by date
+        """
+        start, end = self._date_range(start_date, end_date, period)
+        key = (symbol.upper(), start, end)
+        return self._flights.do(key, self._load_bars, symbol, start, end)
+
+    def get_bulk_stock_data(
+        self,
+        symbols: List[str],
+        start_date: Optional[DateLike] = None,
+        end_date: Optional[DateLike] = None,
+        period: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Get daily bars for several stocks concurrently.
+
+        Args:
+            symbols: Stock symbols; case and surrounding whitespace are ignored
+            start_date: First date to include (defaults to the start of `period`)
+            end_date: Last date to include (defaults to today)
+            period: Lookback used when `start_date` is omitted, e.g. '1mo'
+
+        Returns:
+            Long DataFrame with upper-case Symbol and Date columns followed
+            by OHLCV columns; symbols without data are left out
+        """
+        symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+        futures = [
+            self._fetch_pool.submit(self.get_stock_data, symbol, start_date, end_date, period)
+            for symbol in symbols
+        ]
+
+        frames = []
+        for symbol, future in zip(symbols, futures):
+            try:
+                data = future.result()
+            except Exception as e:
+                print(f"Error fetching data for {symbol}: {str(e)}")
+                continue
+            if not data.empty:
+                frames.append(data.reset_index().assign(Symbol=symbol))
+
+        if not frames:
+            return pd.DataFrame(columns=['Symbol', 'Date', *OHLCV_COLUMNS])
+        bulk = pd.concat(frames, ignore_index=True)
+        return bulk[['Symbol', 'Date', *OHLCV_COLUMNS]]
+
+    def _date_range(
+        self,
+        start_date: Optional[DateLike],
+        end_date: Optional[DateLike],
+        period: Optional[str]
+    ) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        today = pd.Timestamp.now().normalize()
+        end = pd.Timestamp(end_date).tz_localize(None).normalize() if end_date is not None else today
+        # Upstream ranges exclude their end date
+        end = end + timedelta(days=1)
+        if start_date is not None:
+            start = pd.Timestamp(start_date).tz_localize(None).normalize()
+        else:
+            start = period_start(period or DEFAULT_PERIOD, end)
+        return start, end
+
+    def _open_range_fresh(self, symbol: str, today: pd.Timestamp) -> bool:
+        fetched_at = self.store.fetched_at(symbol)
+        return (
+            fetched_at is not None
+            and fetched_at >= today
+            and pd.Timestamp.now() - fetched_at < self.open_range_ttl
+        )
+
+    def _load_bars(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        today = pd.Timestamp.now().normalize()
+        if self.store is None:
+            with stage('data.fetch'):
+                return normalize_bars(self.source.fetch(symbol, start, end))
+
+        fetch_end = end
+        if end > today and self._open_range_fresh(symbol, today):
+            fetch_end = today
+        for missing_start, missing_end in self.store.missing_ranges(symbol, start, fetch_end):
+            fetched_at = pd.Timestamp.now()
+            with stage('data.fetch'):
+                bars = self.source.fetch(symbol, missing_start, missing_end)
+            self.store.write(symbol, normalize_bars(bars))
+            # Today's bar is still forming, so never mark it as final; it is
+            # only reused until the TTL runs out
+            self.store.mark_covered(symbol, missing_start, min(missing_end, today))
+            if missing_end > today:
+                self.store.mark_fetched(symbol, fetched_at)
+
+        with stage('data.store_read'):
+            return self.store.read(symbol, start, end)
+
+    def get_company_info(self, symbol: str) -> Dict:
+        """
+        Get company information.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Dictionary with name, sector, industry, market_cap and pe_ratio
+        """
+        return self.source.company_info(symbol)
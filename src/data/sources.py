@@ -0,0 +1,85 @@
+from typing import Dict
+
+import pandas as pd
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def normalize_bars(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Bring upstream bars into the shape the rest of the code expects.
+
+    Args:
+        data: Bars indexed by timestamp
+
+    Returns:
+        OHLCV columns indexed by a tz-naive, sorted, unique 'Date' index
+    """
+    data = data[[column for column in OHLCV_COLUMNS if column in data.columns]].copy()
+    index = pd.DatetimeIndex(data.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    data.index = index.rename('Date')
+    data = data[~data.index.duplicated(keep='last')]
+    return data.sort_index()
+
+
+class DataSource:
+    """
+    Upstream provider of market data.
+
+    Implementations fetch daily OHLCV bars for the half-open range
+    [start, end) and company metadata. Tests can substitute a local fake.
+    """
+
+    def fetch(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """
+        Fetch bars for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            start: First date to include
+            end: First date to exclude
+
+        Returns:
+            DataFrame of OHLCV bars indexed by date (empty if none)
+        """
+        raise NotImplementedError
+
+    def company_info(self, symbol: str) -> Dict:
+        """
+        Fetch company metadata.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Dictionary with name, sector, industry, market_cap and pe_ratio
+        """
+        raise NotImplementedError
+
+
+class YFinanceSource(DataSource):
+    """Yahoo Finance via the yfinance package."""
+
+    def fetch(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        import yfinance as yf
+
+        data = yf.Ticker(symbol).history(start=start, end=end, auto_adjust=True)
+        if data.empty:
+            return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], name='Date'))
+        return normalize_bars(data)
+
+    def company_info(self, symbol: str) -> Dict:
+        import yfinance as yf
+
+        info = yf.Ticker(symbol).info or {}
+        if not info.get('longName') and not info.get('shortName'):
+            return {}
+        return {
+            'name': info.get('longName') or info.get('shortName'),
+            'sector': info.get('sector'),
+            'industry': info.get('industry'),
+            'market_cap': info.get('marketCap'),
+            'pe_ratio': info.get('trailingPE')
+        }
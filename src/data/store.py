@@ -0,0 +1,211 @@
+import json
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.data.sources import OHLCV_COLUMNS
+
+DateRange = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+def merge_ranges(ranges: List[DateRange]) -> List[DateRange]:
+    """Merge overlapping or touching half-open ranges."""
+    merged: List[DateRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(start: pd.Timestamp, end: pd.Timestamp, covered: List[DateRange]) -> List[DateRange]:
+    """Parts of [start, end) not covered by any of `covered` (which must be merged)."""
+    missing = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+class OHLCVStore:
+    """
+    Local Parquet store of daily bars, partitioned by symbol and year.
+
+    Layout: `<root>/<SYMBOL>/<year>.parquet` plus a `_coverage.json` per
+    symbol that records which date ranges have already been fetched from
+    upstream (including ranges with no bars, such as holidays) and a
+    `_fetched_at.json` with the last time the still-forming current day was
+    fetched. Reads only
+    open the year files that overlap the requested range and push the date
+    filter down into Parquet.
+    """
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Directory holding the store
+        """
+        self.root = root
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def read(
+        self,
+        symbol: str,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        """
+        Read stored bars for [start, end).
+
+        Args:
+            symbol: Stock symbol
+            start: First date to include (None for the beginning)
+            end: First date to exclude (None for the end)
+
+        Returns:
+            DataFrame of OHLCV bars indexed by date
+        """
+        years = self._years(symbol)
+        if start is not None:
+            years = [year for year in years if year >= start.year]
+        if end is not None:
+            years = [year for year in years if year <= end.year]
+
+        filters = []
+        if start is not None:
+            filters.append(('Date', '>=', start))
+        if end is not None:
+            filters.append(('Date', '<', end))
+
+        tables = [
+            pq.read_table(self._partition(symbol, year), filters=filters or None)
+            for year in years
+        ]
+        if not tables:
+            return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], name='Date'))
+        return pa.concat_tables(tables).to_pandas().set_index('Date').sort_index()
+
+    def write(self, symbol: str, data: pd.DataFrame) -> None:
+        """
+        Merge bars into the store, replacing rows with the same date.
+
+        Args:
+            symbol: Stock symbol
+            data: OHLCV bars indexed by date
+        """
+        if data.empty:
+            return
+        with self._lock(symbol):
+            os.makedirs(self._directory(symbol), exist_ok=True)
+            for year, bars in data.groupby(data.index.year):
+                path = self._partition(symbol, year)
+                if os.path.exists(path):
+                    existing = pq.read_table(path).to_pandas().set_index('Date')
+                    bars = pd.concat([existing, bars])
+                    bars = bars[~bars.index.duplicated(keep='last')]
+                bars = bars.sort_index()
+                bars.index = bars.index.rename('Date')
+
+                tmp_path = f"{path}.tmp"
+                pq.write_table(pa.Table.from_pandas(bars.reset_index(), preserve_index=False), tmp_path)
+                os.replace(tmp_path, path)
+
+    def coverage(self, symbol: str) -> List[DateRange]:
+        """Date ranges already fetched from upstream, merged and sorted."""
+        path = os.path.join(self._directory(symbol), '_coverage.json')
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return [(pd.Timestamp(start), pd.Timestamp(end)) for start, end in json.load(f)]
+
+    def mark_covered(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> None:
+        """
+        Record that [start, end) has been fetched from upstream.
+
+        Args:
+            symbol: Stock symbol
+            start: First fetched date
+            end: First date not fetched
+        """
+        if start >= end:
+            return
+        with self._lock(symbol):
+            ranges = merge_ranges(self.coverage(symbol) + [(start, end)])
+            os.makedirs(self._directory(symbol), exist_ok=True)
+            path = os.path.join(self._directory(symbol), '_coverage.json')
+            with open(f"{path}.tmp", 'w') as f:
+                json.dump([[start.isoformat(), end.isoformat()] for start, end in ranges], f)
+            os.replace(f"{path}.tmp", path)
+
+    def fetched_at(self, symbol: str) -> Optional[pd.Timestamp]:
+        """When the open-ended range up to today was last fetched, if ever."""
+        path = os.path.join(self._directory(symbol), '_fetched_at.json')
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return pd.Timestamp(json.load(f))
+
+    def mark_fetched(self, symbol: str, when: pd.Timestamp) -> None:
+        """
+        Record that the open-ended range up to today was fetched at `when`.
+
+        Args:
+            symbol: Stock symbol
+            when: Time of the fetch
+        """
+        with self._lock(symbol):
+            os.makedirs(self._directory(symbol), exist_ok=True)
+            path = os.path.join(self._directory(symbol), '_fetched_at.json')
+            with open(f"{path}.tmp", 'w') as f:
+                json.dump(when.isoformat(), f)
+            os.replace(f"{path}.tmp", path)
+
+    def missing_ranges(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> List[DateRange]:
+        """
+        Parts of [start, end) that still need to be fetched.
+
+        Args:
+            symbol: Stock symbol
+            start: First date wanted
+            end: First date not wanted
+
+        Returns:
+            List of half-open date ranges
+        """
+        return subtract_ranges(start, end, self.coverage(symbol))
+
+    def _directory(self, symbol: str) -> str:
+        return os.path.join(self.root, re.sub(r'[^A-Za-z0-9._-]', '_', symbol.upper()))
+
+    def _partition(self, symbol: str, year: int) -> str:
+        return os.path.join(self._directory(symbol), f"{year}.parquet")
+
+    def _years(self, symbol: str) -> List[int]:
+        directory = self._directory(symbol)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            int(name[:-len('.parquet')])
+            for name in os.listdir(directory)
+            if re.fullmatch(r'\d{4}\.parquet', name)
+        )
+
+    def _lock(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(symbol.upper(), threading.Lock())
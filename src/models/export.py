@@ -0,0 +1,259 @@
+import copy
+import inspect
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn as nn
+
+from src.models.features import FeaturePipeline
+from src.models.price_predictor import PricePredictor, forecast, scaler_from_dict, scaler_to_dict
+
+EXPORT_FORMATS = ('torchscript', 'onnx')
+METADATA_FILE = 'predictor.json'
+
+
+class _WindowModel(nn.Module):
+    """Window-only forward pass, the signature exported artifacts expose."""
+
+    def __init__(self, model: nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.model(x)
+
+
+def export_predictor(
+    predictor: PricePredictor,
+    path: str,
+    format: str = 'torchscript',
+    quantize: bool = False
+) -> str:
+    """
+    Export a trained predictor for inference outside eager PyTorch.
+
+    The sequence length, fitted scalers and feature settings are stored with the artifact
+    (inside the TorchScript archive, or in a `.json` file next to the ONNX
+    model) so `load_exported` can rebuild a working PricePredictor.
+
+    Args:
+        predictor: Trained predictor
+        path: Destination file
+        format: 'torchscript' or 'onnx'
+        quantize: Apply dynamic int8 quantization to the LSTM and Linear layers
+
+    Returns:
+        Path of the written artifact
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {EXPORT_FORMATS}")
+    model = _WindowModel(copy.deepcopy(predictor.model)).eval()
+    example = torch.zeros(1, predictor.sequence_length, predictor.input_size)
+    features = predictor.features
+    metadata = json.dumps({
+        'format': format,
+        'quantized': quantize,
+        'sequence_length': predictor.sequence_length,
+        'scaler': scaler_to_dict(predictor.scaler),
+        'features': features.config() if features is not None else None,
+        'feature_scaler': scaler_to_dict(predictor.feature_scaler) if features is not None else None
+    })
+
+    if format == 'torchscript':
+        if quantize:
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {nn.LSTM, nn.Linear}, dtype=torch.qint8
+            )
+        with torch.no_grad():
+            traced = torch.jit.trace(model, example)
+        torch.jit.save(traced, path, _extra_files={METADATA_FILE: metadata})
+        return path
+
+    try:
+        import onnx  # noqa: F401
+    except ImportError:
+        raise ImportError("ONNX export requires the 'onnx' package")
+
+    options = {}
+    if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+        # Newer releases default to the dynamo exporter; older ones only have the TorchScript one
+        options['dynamo'] = False
+    torch.onnx.export(
+        model,
+        (example,),
+        path,
+        input_names=['window'],
+        output_names=['prediction'],
+        dynamic_axes={'window': {0: 'batch'}, 'prediction': {0: 'batch'}},
+        **options
+    )
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantized_path = f"{path}.int8"
+        quantize_dynamic(path, quantized_path, weight_type=QuantType.QInt8)
+        os.replace(quantized_path, path)
+    with open(f"{path}.json", 'w') as f:
+        f.write(metadata)
+    return path
+
+
+class ExportedModel:
+    """
+    Inference-only stand-in for LSTMPredictor backed by an exported artifact.
+
+    Only the windowed forward pass is available, so training is not
+    supported.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: File written by `export_predictor`
+        """
+        self.path = path
+        if os.path.exists(f"{path}.json"):
+            with open(f"{path}.json") as f:
+                self.metadata = json.load(f)
+        else:
+            extra_files = {METADATA_FILE: ''}
+            self._module = torch.jit.load(path, map_location='cpu', _extra_files=extra_files)
+            self.metadata = json.loads(extra_files[METADATA_FILE])
+
+        if self.metadata['format'] == 'onnx':
+            try:
+                import onnxruntime
+            except ImportError:
+                raise ImportError("ONNX inference requires the 'onnxruntime' package")
+            options = onnxruntime.SessionOptions()
+            options.intra_op_num_threads = torch.get_num_threads()
+            self._session = onnxruntime.InferenceSession(
+                path, options, providers=['CPUExecutionProvider']
+            )
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        if self.metadata['format'] == 'onnx':
+            outputs = self._session.run(None, {'window': x.numpy()})
+            return torch.from_numpy(outputs[0])
+        return self._module(x)
+
+    def eval(self) -> 'ExportedModel':
+        return self
+
+    def parameters(self):
+        raise RuntimeError("Exported models are inference-only and cannot be trained")
+
+
+def load_exported(path: str) -> PricePredictor:
+    """
+    Load an exported artifact as a PricePredictor inference backend.
+
+    Args:
+        path: File written by `export_predictor`
+
+    Returns:
+        PricePredictor whose `predict` runs the exported model
+    """
+    model = ExportedModel(path)
+    features = model.metadata.get('features')
+    predictor = PricePredictor(
+        sequence_length=model.metadata['sequence_length'],
+        features=FeaturePipeline(**features) if features else None
+    )
+    predictor.model = model
+    predictor.scaler = scaler_from_dict(model.metadata['scaler'])
+    if features:
+        predictor.feature_scaler = scaler_from_dict(model.metadata['feature_scaler'])
+    return predictor
+
+
+def compare_backends(
+    predictor: PricePredictor,
+    data: Union[pd.Series, pd.DataFrame],
+    steps: int = 5,
+    repeats: int = 100,
+    variants: Optional[List[Dict[str, Any]]] = None
+) -> pd.DataFrame:
+    """
+    Compare exported variants against the eager model on accuracy and latency.
+
+    Args:
+        predictor: Trained eager predictor used as the reference
+        data: Input series for the forecasts (bars when using features)
+        steps: Forecast horizon
+        repeats: Timed forecasts per backend
+        variants: `export_predictor` keyword sets to compare; defaults to
+            TorchScript with and without quantization, plus ONNX when the
+            onnx packages are installed
+
+    Returns:
+        DataFrame with one row per backend: latency percentiles (ms),
+        speedup over eager and the maximum absolute price error
+    """
+    if variants is None:
+        variants = [
+            {'format': 'torchscript', 'quantize': False},
+            {'format': 'torchscript', 'quantize': True}
+        ]
+        try:
+            import onnx  # noqa: F401
+            import onnxruntime  # noqa: F401
+            variants += [
+                {'format': 'onnx', 'quantize': False},
+                {'format': 'onnx', 'quantize': True}
+            ]
+        except ImportError:
+            pass
+
+    if predictor.features is None:
+        window = torch.FloatTensor(
+            predictor.scaler.transform(data.values[-predictor.sequence_length:].reshape(-1, 1))
+        ).unsqueeze(0)
+
+    def measure(model) -> Dict[str, Any]:
+        if predictor.features is not None:
+            # Features are recomputed every step, so time the whole forecast
+            backend = copy.copy(predictor)
+            backend.model = model
+            run = lambda: backend.predict(data, steps).values
+        else:
+            run = lambda: predictor.scaler.inverse_transform(
+                forecast(model, window, steps).numpy().reshape(-1, 1)
+            ).flatten()
+        timings = []
+        with torch.no_grad():
+            run()
+            for _ in range(repeats):
+                start = time.perf_counter()
+                prices = run()
+                timings.append((time.perf_counter() - start) * 1000)
+        return {
+            'latency_ms_p50': float(np.percentile(timings, 50)),
+            'latency_ms_p99': float(np.percentile(timings, 99)),
+            'prices': prices
+        }
+
+    predictor.model.eval()
+    reference = measure(predictor.model)
+    rows = [('eager', reference)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for variant in variants:
+            name = variant['format'] + ('-int8' if variant.get('quantize') else '')
+            path = export_predictor(predictor, os.path.join(tmp_dir, name), **variant)
+            rows.append((name, measure(ExportedModel(path))))
+
+    return pd.DataFrame([
+        {
+            'backend': name,
+            'latency_ms_p50': result['latency_ms_p50'],
+            'latency_ms_p99': result['latency_ms_p99'],
+            'speedup': reference['latency_ms_p50'] / result['latency_ms_p50'],
+            'max_abs_error': float(np.abs(result['prices'] - reference['prices']).max())
+        }
+        for name, result in rows
+    ])
@@ -0,0 +1,186 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Raw columns the features are derived from; they are carried in the output
+RAW_COLUMNS = ['Close', 'Volume']
+
+
+class FeaturePipeline:
+    """
+    Vectorized technical features computed from daily Close and Volume.
+
+    Every feature is a rolling-window kernel over NumPy strided views (no
+    per-row Python), so the value for a bar only depends on the `lookback` bars
+    before it. That makes appending new bars cheap: only the new rows are
+    computed, from the tail of the cached frame. RSI uses simple moving
+    averages of gains and losses (Cutler's RSI) rather than Wilder's
+    recursive smoothing for the same reason.
+
+    Output frames hold the raw Close and Volume columns followed by the
+    features; the first `lookback` rows are NaN.
+    """
+
+    def __init__(
+        self,
+        volatility_window: int = 20,
+        ma_windows: Sequence[int] = (10, 50),
+        rsi_window: int = 14,
+        volume_window: int = 20,
+        cache_size: int = 256
+    ):
+        """
+        Args:
+            volatility_window: Bars in the rolling standard deviation of returns
+            ma_windows: Moving average lengths; each gives a price/MA - 1 feature
+            rsi_window: Bars in the RSI averages
+            volume_window: Bars in the volume z-score
+            cache_size: Symbols whose feature frames `update` keeps in memory
+        """
+        self.volatility_window = volatility_window
+        self.ma_windows = tuple(ma_windows)
+        self.rsi_window = rsi_window
+        self.volume_window = volume_window
+        self.cache_size = cache_size
+
+        self._cache: 'OrderedDict[str, pd.DataFrame]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def feature_names(self) -> List[str]:
+        return [
+            'log_return',
+            'volatility',
+            *(f'ma_ratio_{window}' for window in self.ma_windows),
+            'rsi',
+            'volume_z'
+        ]
+
+    @property
+    def columns(self) -> List[str]:
+        return RAW_COLUMNS + self.feature_names
+
+    @property
+    def lookback(self) -> int:
+        """Bars needed before a row for all of its features to be defined."""
+        return max(
+            self.volatility_window,
+            max(self.ma_windows, default=1) - 1,
+            self.rsi_window,
+            self.volume_window - 1
+        )
+
+    def config(self) -> Dict[str, Any]:
+        return {
+            'volatility_window': self.volatility_window,
+            'ma_windows': list(self.ma_windows),
+            'rsi_window': self.rsi_window,
+            'volume_window': self.volume_window
+        }
+
+    def transform(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute features for every bar.
+
+        Args:
+            bars: Frame with at least Close and Volume columns
+
+        Returns:
+            Frame with the same index and `columns`
+        """
+        close = bars['Close'].to_numpy(dtype=np.float64)
+        volume = bars['Volume'].to_numpy(dtype=np.float64)
+        n = len(close)
+        features = {'Close': close, 'Volume': volume}
+
+        log_return = np.full(n, np.nan)
+        log_return[1:] = np.diff(np.log(close))
+        features['log_return'] = log_return
+        features['volatility'] = _rolling(log_return[1:], self.volatility_window, n, np.std, ddof=1)
+        for window in self.ma_windows:
+            features[f'ma_ratio_{window}'] = close / _rolling(close, window, n, np.mean) - 1
+
+        change = np.diff(close)
+        gain = _rolling(change.clip(min=0), self.rsi_window, n, np.mean)
+        loss = _rolling((-change).clip(min=0), self.rsi_window, n, np.mean)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + gain / loss)
+            # No losses in the window means maximal strength; flat prices are neutral
+            features['rsi'] = np.where(loss == 0, np.where(gain > 0, 100.0, 50.0), rsi)
+
+            mean = _rolling(volume, self.volume_window, n, np.mean)
+            std = _rolling(volume, self.volume_window, n, np.std, ddof=1)
+            features['volume_z'] = np.where(std == 0, 0.0, (volume - mean) / std)
+
+        return pd.DataFrame(features, index=bars.index, columns=self.columns)
+
+    def update(self, symbol: str, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Features for a symbol, computing only bars not seen before.
+
+        `bars` is the symbol's full history (or at least everything after
+        the cached frame's tail). Bars dated after the last cached row are
+        computed from the cached tail and appended; if the history does not
+        line up with the cache (e.g. it starts later or was revised) the
+        frame is recomputed from scratch.
+
+        Args:
+            symbol: Cache key
+            bars: Frame indexed by date with Close and Volume columns
+
+        Returns:
+            Feature frame covering `bars`
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            cached = self._cache.get(symbol)
+
+        if cached is not None and len(cached) and cached.index[-1] in bars.index:
+            new_bars = bars[bars.index > cached.index[-1]]
+            aligned = (
+                bars.index[0] == cached.index[0] and
+                np.array_equal(bars['Close'].loc[:cached.index[-1]].values, cached['Close'].values)
+            )
+            if aligned:
+                if new_bars.empty:
+                    return cached
+                tail = cached[RAW_COLUMNS].iloc[-(self.lookback + 1):]
+                appended = self.transform(pd.concat([tail, new_bars[RAW_COLUMNS]])).iloc[len(tail):]
+                frame = pd.concat([cached, appended])
+                self._store(symbol, frame)
+                return frame
+
+        frame = self.transform(bars)
+        self._store(symbol, frame)
+        return frame
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _store(self, symbol: str, frame: pd.DataFrame) -> None:
+        with self._lock:
+            self._cache[symbol] = frame
+            self._cache.move_to_end(symbol)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+def _rolling(values: np.ndarray, window: int, length: int, reduce: Callable, **kwargs) -> np.ndarray:
+    """
+    Reduce every trailing window of `values`, right-aligned in an array of `length`.
+
+    Windows are strided views, so each result depends only on the values in
+    its own window (unlike running-sum kernels, whose rounding depends on
+    where the series starts).
+    """
+    result = np.full(length, np.nan)
+    if len(values) >= window:
+        result[length - len(values) + window - 1:] = reduce(
+            sliding_window_view(values, window), axis=-1, **kwargs
+        )
+    return result
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+import torch
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sklearn.preprocessing import MinMaxScaler
+
+from src.models.price_predictor import PricePredictor, forecast, scaler_from_dict, scaler_to_dict
+from src.models.windowing import make_windows, tensor_loader
+
+SCALING_MODES = ('per_symbol', 'shared')
+
+
+class MultiSeriesPredictor(PricePredictor):
+    """
+    One LSTM trained over stacked windows from many symbols.
+
+    With `scaling='per_symbol'` every series is min-max scaled on its own
+    range, so symbols with very different price levels share one model.
+    With `scaling='shared'` a single scaler is fitted over all series.
+    A validation split holds out the most recent windows of every series.
+    """
+
+    def __init__(self, sequence_length: int = 10, scaling: str = 'per_symbol'):
+        if scaling not in SCALING_MODES:
+            raise ValueError(f"scaling must be one of {SCALING_MODES}")
+        super().__init__(sequence_length)
+        self.scaling = scaling
+        self.scalers: Dict[str, MinMaxScaler] = {}
+
+    def prepare_data(self, data: Dict[str, pd.Series]) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Prepare stacked windows from several series.
+
+        Args:
+            data: Mapping of symbol to time series
+
+        Returns:
+            Tuple of (X, y) tensors covering every symbol
+        """
+        windows = self._symbol_windows(data)
+        if not windows:
+            return make_windows(np.empty(0), self.sequence_length)
+        return torch.cat([X for X, _ in windows]), torch.cat([y for _, y in windows])
+
+    def _symbol_windows(self, data: Dict[str, pd.Series]) -> List[Tuple[torch.Tensor, torch.Tensor]]:
+        """Fit the scalers and window every series separately."""
+        if self.scaling == 'shared':
+            self.scaler = MinMaxScaler().fit(
+                np.concatenate([series.values for series in data.values()]).reshape(-1, 1)
+            )
+        else:
+            self.scalers = {}
+
+        windows = []
+        for symbol, series in data.items():
+            values = series.values.reshape(-1, 1)
+            if self.scaling == 'per_symbol':
+                self.scalers[symbol] = MinMaxScaler().fit(values)
+            windows.append(make_windows(self._scaler_for(symbol, series).transform(values), self.sequence_length))
+        return windows
+
+    def _training_loaders(
+        self,
+        data: Dict[str, pd.Series],
+        batch_size: int,
+        shuffle: bool,
+        validation_split: float,
+        streaming: bool,
+        windows: Optional[Tuple[torch.Tensor, torch.Tensor]] = None
+    ) -> Tuple[Iterable, Iterable, int, int]:
+        if streaming or windows is not None:
+            raise ValueError("Multi-series training prepares its own windows; streaming and precomputed windows are not supported")
+
+        # Splitting the stacked windows would hold out whole symbols instead of recent bars
+        train_X, train_y, val_X, val_y = [], [], [], []
+        for X, y in self._symbol_windows(data):
+            n_train = len(X) - int(len(X) * validation_split)
+            train_X.append(X[:n_train])
+            train_y.append(y[:n_train])
+            val_X.append(X[n_train:])
+            val_y.append(y[n_train:])
+
+        n_train, n_val = sum(map(len, train_X)), sum(map(len, val_X))
+        if n_train == 0:
+            raise ValueError(f"Need more than {self.sequence_length} points to train")
+        train_batches = tensor_loader(torch.cat(train_X), torch.cat(train_y), batch_size, shuffle)
+        val_batches = tensor_loader(torch.cat(val_X), torch.cat(val_y), batch_size)
+        return train_batches, val_batches, n_train, n_val
+
+    def prepare_loader(self, *args, **kwargs):
+        raise ValueError("Streaming windows are not supported for multi-series training")
+
+    def update(self, *args, **kwargs):
+        raise ValueError("Incremental updates are not supported for multi-series models")
+
+    def _remember(self, *args, **kwargs) -> None:
+        # There is no single series to replay
+        pass
+
+    def predict(
+        self,
+        data: Dict[str, pd.Series],
+        steps: int = 5
+    ) -> Dict[str, pd.Series]:
+        """
+        Forecast every series in a single batch.
+
+        Each horizon step is one forward pass over all symbols.
+
+        Args:
+            data: Mapping of symbol to input series
+            steps: Number of steps to predict
+
+        Returns:
+            Mapping of symbol to series of predictions
+        """
+        symbols = list(data)
+        for symbol in symbols:
+            if len(data[symbol]) < self.sequence_length:
+                raise ValueError(
+                    f"{symbol} has {len(data[symbol])} points, "
+                    f"need at least {self.sequence_length}"
+                )
+
+        scalers = [self._scaler_for(symbol, data[symbol]) for symbol in symbols]
+        windows = np.stack([
+            scaler.transform(data[symbol].values[-self.sequence_length:].reshape(-1, 1))
+            for symbol, scaler in zip(symbols, scalers)
+        ])
+
+        self.model.eval()
+        with torch.no_grad():
+            predictions = forecast(self.model, torch.FloatTensor(windows), steps).numpy()
+
+        return {
+            symbol: pd.Series(scaler.inverse_transform(predictions[i].reshape(-1, 1)).flatten())
+            for i, (symbol, scaler) in enumerate(zip(symbols, scalers))
+        }
+
+    def state_dict(self) -> Dict[str, Any]:
+        state = super().state_dict()
+        state['scaling'] = self.scaling
+        state['scalers'] = {
+            symbol: scaler_to_dict(scaler) for symbol, scaler in self.scalers.items()
+        }
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        super().load_state_dict(state)
+        self.scaling = state['scaling']
+        self.scalers = {
+            symbol: scaler_from_dict(scaler) for symbol, scaler in state['scalers'].items()
+        }
+
+    def _scaler_for(self, symbol: str, series: pd.Series) -> MinMaxScaler:
+        if self.scaling == 'shared':
+            return self.scaler
+        scaler = self.scalers.get(symbol)
+        if scaler is None:
+            # Symbols unseen during training are scaled on their own history;
+            # the scaler is not kept, so predicting never mutates a shared model
+            scaler = MinMaxScaler().fit(series.values.reshape(-1, 1))
+        return scaler
+
@@ -1,9 +1,131 @@
+import copy
+import time
+from contextlib import contextmanager
 import torch
 import torch.nn as nn
 import numpy as np
 import pandas as pd
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Union
 from sklearn.preprocessing import MinMaxScaler
+from torch.utils.data import DataLoader
+
+from src.models.features import RAW_COLUMNS, FeaturePipeline
+from src.models.windowing import make_windows, tensor_loader, window_loader
+from src.serving.metrics import STAGE_SECONDS, stage
+
+# Fitted MinMaxScaler attributes persisted alongside the model weights
+SCALER_ATTRIBUTES = ('min_', 'scale_', 'data_min_', 'data_max_', 'data_range_')
+
+# How `PricePredictor.update` treats values outside the fitted scaler range
+SCALER_POLICIES = ('fixed', 'expand')
+
+@contextmanager
+def torch_threads(num_threads: Optional[int] = None, num_interop_threads: Optional[int] = None) -> Iterator[None]:
+    """
+    Temporarily set torch's intra-op thread count.
+    
+    The inter-op count is process-wide and can only be set before torch
+    starts parallel work, so it is applied once and never restored.
+    
+    Args:
+        num_threads: Intra-op threads (None leaves the current setting)
+        num_interop_threads: Inter-op threads (None leaves the current setting)
+    """
+    if num_interop_threads is not None and num_interop_threads != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(num_interop_threads)
+        except RuntimeError as e:
+            print(f"Could not set inter-op threads: {str(e)}")
+    
+    previous = torch.get_num_threads()
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+def scaler_to_dict(scaler: MinMaxScaler) -> Dict[str, Any]:
+    """
+    Serialize the fitted parameters of a MinMaxScaler.
+    
+    Args:
+        scaler: Fitted scaler
+        
+    Returns:
+        Dictionary of plain Python lists and numbers
+    """
+    state = {
+        name: getattr(scaler, name).tolist()
+        for name in SCALER_ATTRIBUTES
+        if hasattr(scaler, name)
+    }
+    if hasattr(scaler, 'n_samples_seen_'):
+        state['n_samples_seen_'] = int(scaler.n_samples_seen_)
+    return state
+
+def scaler_from_dict(state: Dict[str, Any]) -> MinMaxScaler:
+    """
+    Rebuild a fitted MinMaxScaler from `scaler_to_dict` output.
+    
+    Args:
+        state: Serialized scaler parameters
+        
+    Returns:
+        Fitted MinMaxScaler
+    """
+    scaler = MinMaxScaler()
+    for name in SCALER_ATTRIBUTES:
+        if name in state:
+            setattr(scaler, name, np.asarray(state[name], dtype=np.float64))
+    if 'n_samples_seen_' in state:
+        scaler.n_samples_seen_ = state['n_samples_seen_']
+        scaler.n_features_in_ = len(state['min_'])
+    return scaler
+
+def forecast(
+    model: nn.Module,
+    window: torch.Tensor,
+    steps: int
+) -> torch.Tensor:
+    """
+    Autoregressively forecast a batch of scaled series.
+    
+    Every step runs one forward pass over the whole batch and writes into a
+    preallocated output buffer, so nothing is synced back to Python until
+    the caller converts the result.
+    
+    Each step re-runs the model over the latest `sequence_length` points
+    from a zero state, exactly like training. Carrying the (h, c) state
+    forward instead would extend the context rather than slide it, which
+    the model never saw in training and which drifts from these forecasts.
+    
+    Args:
+        model: Model mapping (batch, sequence_length, 1) to (batch, 1)
+        window: Last observed window of each series
+        steps: Number of steps to predict
+        
+    Returns:
+        Tensor of shape (batch, steps) with scaled predictions
+    """
+    batch_size, sequence_length, _ = window.shape
+    predictions = torch.empty((batch_size, steps), dtype=window.dtype, device=window.device)
+    if steps == 0:
+        return predictions
+    
+    # Observed window followed by room for every prediction; each step's
+    # input is a view into this buffer instead of a freshly concatenated one
+    buffer = torch.empty(
+        (batch_size, sequence_length + steps, window.size(2)),
+        dtype=window.dtype,
+        device=window.device
+    )
+    buffer[:, :sequence_length] = window
+    for i in range(steps):
+        pred = model(buffer[:, i:i + sequence_length])
+        predictions[:, i] = pred[:, 0]
+        buffer[:, sequence_length + i] = pred
+    return predictions
 
 class LSTMPredictor(nn.Module):
     def __init__(self, input_size: int = 1, hidden_size: int = 64, num_layers: int = 2):
@@ -22,112 +144,527 @@ class LSTMPredictor(nn.Module):
         self.fc = nn.Linear(hidden_size, 1)
         
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """
+        Predict the next value for each sequence in the batch.
+        
+        Args:
+            x: Input of shape (batch, timesteps, input_size)
+            
+        Returns:
+            Predictions of shape (batch, 1)
+        """
         batch_size = x.size(0)
-        h0 = torch.zeros(self.num_layers, batch_size, self.hidden_size).to(x.device)
-        c0 = torch.zeros(self.num_layers, batch_size, self.hidden_size).to(x.device)
+        h0 = torch.zeros(self.num_layers, batch_size, self.hidden_size, device=x.device)
+        c0 = torch.zeros(self.num_layers, batch_size, self.hidden_size, device=x.device)
         
         out, _ = self.lstm(x, (h0, c0))
         out = self.fc(out[:, -1, :])
         return out
 
 class PricePredictor:
-    def __init__(self, sequence_length: int = 10):
+    def __init__(
+        self,
+        sequence_length: int = 10,
+        replay_size: int = 256,
+        features: Optional[FeaturePipeline] = None
+    ):
+        """
+        Args:
+            sequence_length: Timesteps per input window
+            replay_size: Recent points kept for `update` to fine-tune on
+            features: Train on the scaled close plus these features instead
+                of the close alone; data is then a frame of bars (or the
+                pipeline's output) rather than a Series
+        """
         self.sequence_length = sequence_length
-        self.model = LSTMPredictor()
+        self.replay_size = replay_size
+        self.features = features
+        self.model = LSTMPredictor(input_size=self.input_size)
+        # `scaler` always maps the close, which is also the target
         self.scaler = MinMaxScaler()
+        self.feature_scaler: Optional[MinMaxScaler] = MinMaxScaler() if features is not None else None
+        self.history: Dict[str, Any] = {}
+        # Raw tail of the series seen so far and the date of its last point
+        self.replay: Optional[np.ndarray] = None
+        self.last_index: Optional[pd.Timestamp] = None
+        self.updates = 0
+    
+    @property
+    def input_size(self) -> int:
+        return 1 + len(self.features.feature_names) if self.features is not None else 1
         
-    def prepare_data(self, data: pd.Series) -> Tuple[torch.Tensor, torch.Tensor]:
+    def prepare_data(self, data: Union[pd.Series, pd.DataFrame, np.ndarray]) -> Tuple[torch.Tensor, torch.Tensor]:
         """
         Prepare data for LSTM model.
         
         Args:
-            data: Time series data
+            data: Time series data, or bars when using features
             
         Returns:
             Tuple of (X, y) tensors
         """
-        scaled_data = self.scaler.fit_transform(data.values.reshape(-1, 1))
+        if self.features is not None:
+            frame = self.feature_frame(data).dropna()
+            with stage('predictor.scaling'):
+                inputs = self._scale_inputs(frame, fit=True)
+            X, y = make_windows(inputs, self.sequence_length)
+            return X, y[:, :1]
+        
+        with stage('predictor.scaling'):
+            scaled_data = self.scaler.fit_transform(np.asarray(data).reshape(-1, 1))
+        return make_windows(scaled_data, self.sequence_length)
+    
+    def feature_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Features for `data`, computing them unless it already holds them.
         
-        X, y = [], []
-        for i in range(len(scaled_data) - self.sequence_length):
-            X.append(scaled_data[i:(i + self.sequence_length)])
-            y.append(scaled_data[i + self.sequence_length])
+        Args:
+            data: Bars with Close and Volume, or `FeaturePipeline` output
+                (e.g. from its per-symbol cache)
             
-        return torch.FloatTensor(X), torch.FloatTensor(y)
+        Returns:
+            Frame with the pipeline's columns; warm-up rows are NaN
+        """
+        columns = self.features.columns
+        if all(column in data.columns for column in columns):
+            return data[columns]
+        with stage('predictor.features'):
+            return self.features.transform(data)
+    
+    def _scale_inputs(self, frame: pd.DataFrame, fit: bool = False) -> np.ndarray:
+        """Scaled close in column 0 followed by the scaled features."""
+        close = frame[['Close']].to_numpy(dtype=np.float64)
+        features = frame[self.features.feature_names].to_numpy(dtype=np.float64)
+        if fit:
+            return np.hstack([self.scaler.fit_transform(close), self.feature_scaler.fit_transform(features)])
+        return np.hstack([self.scaler.transform(close), self.feature_scaler.transform(features)])
+    
+    def prepare_loader(
+        self,
+        data: Union[pd.Series, np.ndarray],
+        batch_size: int = 32,
+        shuffle: bool = False,
+        chunk_size: int = 1_000_000,
+        indices: Optional[Sequence[int]] = None
+    ) -> DataLoader:
+        """
+        Prepare a streaming loader for series too large to window in memory.
+        
+        The scaler is fitted chunk by chunk and windows are gathered and
+        scaled per batch, so `data` may be a memory-mapped array.
+        
+        Args:
+            data: Time series data
+            batch_size: Windows per batch
+            shuffle: Whether to visit windows in random order
+            chunk_size: Number of points per scaler fitting chunk
+            indices: Only visit these windows, e.g. a training split
+            
+        Returns:
+            DataLoader yielding (X, y) batches
+        """
+        if self.features is not None:
+            raise ValueError("Streaming windows are not supported with features")
+        values = data.values if isinstance(data, pd.Series) else data
+        
+        self.scaler = MinMaxScaler()
+        for start in range(0, len(values), chunk_size):
+            chunk = np.asarray(values[start:start + chunk_size], dtype=np.float64)
+            self.scaler.partial_fit(chunk.reshape(-1, 1))
+        
+        return window_loader(
+            values,
+            self.sequence_length,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            transform=self.scaler.transform,
+            indices=indices
+        )
     
     def train(
         self,
-        data: pd.Series,
+        data: Union[pd.Series, pd.DataFrame, np.ndarray],
         epochs: int = 100,
         batch_size: int = 32,
-        learning_rate: float = 0.01
+        learning_rate: float = 0.01,
+        streaming: bool = False,
+        callback: Optional[Callable[[int, float], None]] = None,
+        shuffle: bool = True,
+        validation_split: float = 0.0,
+        patience: Optional[int] = None,
+        min_delta: float = 0.0,
+        accumulation_steps: int = 1,
+        num_threads: Optional[int] = None,
+        num_interop_threads: Optional[int] = None,
+        windows: Optional[Tuple[torch.Tensor, torch.Tensor]] = None
     ) -> List[float]:
         """
         Train the LSTM model.
         
+        Per-epoch training loss, validation loss and wall-clock time are
+        also recorded in `self.history`.
+        
         Args:
-            data: Training data
-            epochs: Number of training epochs
+            data: Training data, or bars when using features
+            epochs: Maximum number of training epochs
             batch_size: Batch size for training
             learning_rate: Learning rate
+            streaming: Window the series batch by batch instead of up front
+            callback: Called with (epoch, loss) after every epoch
+            shuffle: Whether to visit training windows in random order
+            validation_split: Fraction of the most recent windows held out
+                for validation
+            patience: Stop after this many epochs without improvement of the
+                validation loss (or the training loss without a split) and
+                restore the best weights; None always runs `epochs`
+            min_delta: Smallest decrease that counts as an improvement
+            accumulation_steps: Batches whose gradients are summed per
+                optimizer step
+            num_threads: Torch intra-op threads while training
+            num_interop_threads: Torch inter-op threads; only takes effect
+                before the process has run any parallel work
+            windows: Already scaled (X, y) windows of `data` to train on
+                instead of preparing them; `scaler` must already be fitted
             
         Returns:
             List of training losses
         """
-        X, y = self.prepare_data(data)
+        if not 0.0 <= validation_split < 1.0:
+            raise ValueError("validation_split must be in [0, 1)")
+        if accumulation_steps < 1:
+            raise ValueError("accumulation_steps must be at least 1")
+        
+        train_batches, val_batches, n_train, n_val = self._training_loaders(
+            data, batch_size, shuffle, validation_split, streaming, windows
+        )
+        with torch_threads(num_threads, num_interop_threads):
+            losses = self._fit(
+                train_batches, val_batches, n_train, n_val, epochs, learning_rate,
+                callback, patience, min_delta, accumulation_steps
+            )
+        self._remember(data)
+        self.updates = 0
+        return losses
+    
+    def update(
+        self,
+        new_data: Union[pd.Series, pd.DataFrame, np.ndarray],
+        epochs: int = 5,
+        batch_size: int = 32,
+        learning_rate: float = 0.001,
+        scaler_policy: str = 'expand',
+        callback: Optional[Callable[[int, float], None]] = None
+    ) -> List[float]:
+        """
+        Fine-tune the trained model on newly arrived observations.
+        
+        Training starts from the current weights and runs a few epochs over
+        a replay buffer of the most recent `replay_size` points plus the new
+        ones, so it takes seconds rather than a full retrain. With a dated
+        Series, points at or before the last seen date are ignored, so the
+        full history may be passed as well. With features the buffer holds
+        raw bars, and features of the new bars are computed from its tail.
         
+        Args:
+            new_data: Observations that arrived since the last train/update,
+                or bars (or the pipeline's output) when using features
+            epochs: Fine-tuning epochs
+            batch_size: Batch size
+            learning_rate: Learning rate, usually well below the one used
+                for training from scratch
+            scaler_policy: 'fixed' keeps the scalers, so values outside the
+                training range map outside [0, 1]; 'expand' widens the
+                ranges to cover them without refitting
+            callback: Called with (epoch, loss) after every epoch
+            
+        Returns:
+            List of fine-tuning losses (empty if there was nothing new)
+        """
+        if scaler_policy not in SCALER_POLICIES:
+            raise ValueError(f"scaler_policy must be one of {SCALER_POLICIES}")
+        if self.replay is None:
+            raise RuntimeError("update() needs a predictor trained with train()")
+        
+        if isinstance(new_data, (pd.Series, pd.DataFrame)) and self.last_index is not None:
+            new_data = new_data[new_data.index > self.last_index]
+        if self.features is not None:
+            values = new_data[RAW_COLUMNS].to_numpy(dtype=np.float64)
+        else:
+            values = np.asarray(new_data, dtype=np.float64).reshape(-1)
+        if len(values) == 0:
+            return []
+        
+        buffer = np.concatenate([self.replay, values])
+        if self.features is not None:
+            frame = self.features.transform(pd.DataFrame(buffer, columns=RAW_COLUMNS)).dropna()
+            if scaler_policy == 'expand':
+                new_rows = frame.iloc[-len(values):]
+                self.scaler.partial_fit(new_rows[['Close']].to_numpy())
+                self.feature_scaler.partial_fit(new_rows[self.features.feature_names].to_numpy())
+            X, y = make_windows(self._scale_inputs(frame), self.sequence_length)
+            y = y[:, :1]
+        else:
+            if scaler_policy == 'expand':
+                self.scaler.partial_fit(values.reshape(-1, 1))
+            X, y = make_windows(self.scaler.transform(buffer.reshape(-1, 1)), self.sequence_length)
+        losses = self._fit(
+            tensor_loader(X, y, batch_size, shuffle=True), [], len(X), 0,
+            epochs, learning_rate, callback
+        )
+        self._remember(new_data, buffer)
+        self.updates += 1
+        return losses
+    
+    def _fit(
+        self,
+        train_batches: Iterable,
+        val_batches: Iterable,
+        n_train: int,
+        n_val: int,
+        epochs: int,
+        learning_rate: float,
+        callback: Optional[Callable[[int, float], None]] = None,
+        patience: Optional[int] = None,
+        min_delta: float = 0.0,
+        accumulation_steps: int = 1
+    ) -> List[float]:
+        """Run the epoch loop shared by `train` and `update`."""
         criterion = nn.MSELoss()
         optimizer = torch.optim.Adam(self.model.parameters(), lr=learning_rate)
         
-        losses = []
+        self.history = {'loss': [], 'val_loss': [], 'epoch_time': [], 'best_epoch': None}
+        best_loss, best_state, stale_epochs = float('inf'), None, 0
+        
         for epoch in range(epochs):
+            started = time.perf_counter()
             self.model.train()
-            total_loss = 0
+            # Summed on-device; reading it once per epoch avoids a sync per batch
+            total_loss = torch.zeros(())
             
-            for i in range(0, len(X), batch_size):
-                batch_X = X[i:i + batch_size]
-                batch_y = y[i:i + batch_size]
-                
-                optimizer.zero_grad()
+            optimizer.zero_grad()
+            for step, (batch_X, batch_y) in enumerate(train_batches, 1):
                 outputs = self.model(batch_X)
                 loss = criterion(outputs, batch_y)
-                loss.backward()
+                (loss / accumulation_steps).backward()
+                if step % accumulation_steps == 0:
+                    optimizer.step()
+                    optimizer.zero_grad()
+                total_loss += loss.detach() * len(batch_X)
+            if step % accumulation_steps:
                 optimizer.step()
-                
-                total_loss += loss.item()
+                optimizer.zero_grad()
             
-            avg_loss = total_loss / (len(X) / batch_size)
-            losses.append(avg_loss)
+            avg_loss = total_loss.item() / n_train
+            val_loss = self._evaluate(val_batches, criterion) / n_val if n_val else None
+            self.history['loss'].append(avg_loss)
+            self.history['val_loss'].append(val_loss)
+            self.history['epoch_time'].append(time.perf_counter() - started)
+            STAGE_SECONDS.observe(self.history['epoch_time'][-1], stage='predictor.train_epoch')
+            if callback is not None:
+                callback(epoch, avg_loss)
             
             if (epoch + 1) % 10 == 0:
-                print(f'Epoch [{epoch+1}/{epochs}], Loss: {avg_loss:.4f}')
-                
-        return losses
+                print(f'Epoch [{epoch+1}/{epochs}], Loss: {avg_loss:.4f}'
+                      + (f', Val Loss: {val_loss:.4f}' if val_loss is not None else ''))
+            
+            if patience is None:
+                continue
+            monitored = val_loss if val_loss is not None else avg_loss
+            if monitored < best_loss - min_delta:
+                best_loss, stale_epochs = monitored, 0
+                best_state = copy.deepcopy(self.model.state_dict())
+                self.history['best_epoch'] = epoch
+            else:
+                stale_epochs += 1
+                if stale_epochs >= patience:
+                    print(f'Early stopping at epoch {epoch+1}, best epoch {self.history["best_epoch"]+1}')
+                    break
+        
+        if best_state is not None:
+            self.model.load_state_dict(best_state)
+        return self.history['loss']
+    
+    def _remember(
+        self,
+        data: Union[pd.Series, pd.DataFrame, np.ndarray],
+        buffer: Optional[np.ndarray] = None
+    ) -> None:
+        """Keep the tail of the series (raw bars with features) for `update` to replay."""
+        keep = self.replay_size + self.sequence_length
+        if self.features is not None:
+            # Features of the first replayed window need `lookback` earlier bars
+            keep += self.features.lookback
+            if buffer is None:
+                buffer = data[RAW_COLUMNS].to_numpy(dtype=np.float64)
+            self.replay = np.array(buffer[-keep:], dtype=np.float64)
+        else:
+            if buffer is None:
+                buffer = data.values if isinstance(data, pd.Series) else data
+            self.replay = np.array(buffer[-keep:], dtype=np.float64).reshape(-1)
+        if isinstance(data, (pd.Series, pd.DataFrame)) and isinstance(data.index, pd.DatetimeIndex) and len(data):
+            self.last_index = data.index[-1]
     
-    def predict(self, data: pd.Series, steps: int = 5) -> pd.Series:
+    def _training_loaders(
+        self,
+        data: Union[pd.Series, np.ndarray],
+        batch_size: int,
+        shuffle: bool,
+        validation_split: float,
+        streaming: bool,
+        windows: Optional[Tuple[torch.Tensor, torch.Tensor]] = None
+    ) -> Tuple[Iterable, Iterable, int, int]:
+        # The validation windows are the most recent ones, so no future data leaks into training
+        if streaming:
+            n_windows = max(len(data) - self.sequence_length, 0)
+            n_train = n_windows - int(n_windows * validation_split)
+            train_batches = self.prepare_loader(data, batch_size, shuffle, indices=range(n_train))
+            val_batches = window_loader(
+                data.values if isinstance(data, pd.Series) else data,
+                self.sequence_length,
+                batch_size=batch_size,
+                transform=self.scaler.transform,
+                indices=range(n_train, n_windows)
+            )
+        else:
+            X, y = windows if windows is not None else self.prepare_data(data)
+            n_windows = len(X)
+            n_train = n_windows - int(n_windows * validation_split)
+            train_batches = tensor_loader(X[:n_train], y[:n_train], batch_size, shuffle)
+            val_batches = tensor_loader(X[n_train:], y[n_train:], batch_size)
+        
+        if n_train == 0:
+            raise ValueError(f"Need more than {self.sequence_length} points to train")
+        return train_batches, val_batches, n_train, n_windows - n_train
+    
+    def _evaluate(self, batches: Iterable, criterion: nn.Module) -> float:
+        """Summed loss over `batches` without tracking gradients."""
+        self.model.eval()
+        total = torch.zeros(())
+        with torch.inference_mode():
+            for batch_X, batch_y in batches:
+                total += criterion(self.model(batch_X), batch_y) * len(batch_X)
+        return total.item()
+    
+    def predict(
+        self,
+        data: Union[pd.Series, pd.DataFrame],
+        steps: int = 5
+    ) -> pd.Series:
         """
         Make predictions using the trained model.
         
         Args:
-            data: Input data for prediction
+            data: Input data for prediction, or bars when using features
             steps: Number of steps to predict
             
         Returns:
             Series of predictions
         """
+        if self.features is not None:
+            return self._predict_features(data, steps)
+        
         self.model.eval()
         with torch.no_grad():
-            scaled_data = self.scaler.transform(data.values.reshape(-1, 1))
-            last_sequence = torch.FloatTensor(scaled_data[-self.sequence_length:]).unsqueeze(0)
+            with stage('predictor.scaling'):
+                scaled_data = self.scaler.transform(data.values[-self.sequence_length:].reshape(-1, 1))
+            last_sequence = torch.FloatTensor(scaled_data).unsqueeze(0)
+            with stage('predictor.forward'):
+                predictions = forecast(self.model, last_sequence, steps)
             
-            predictions = []
-            for _ in range(steps):
-                pred = self.model(last_sequence)
-                predictions.append(pred.item())
-                last_sequence = torch.cat([
-                    last_sequence[:, 1:, :],
-                    pred.unsqueeze(0).unsqueeze(0)
-                ], dim=1)
+            predictions = self.scaler.inverse_transform(predictions.numpy().reshape(-1, 1))
+            return pd.Series(predictions.flatten()) 
+    
+    def _predict_features(self, data: pd.DataFrame, steps: int) -> pd.Series:
+        """
+        Autoregressive forecast with features.
+        
+        Each predicted close is appended as a new bar (carrying the last
+        volume forward) and the features of the next window are recomputed
+        from the tail of raw bars, which only spans `lookback +
+        sequence_length` rows.
+        """
+        frame = self.feature_frame(data)
+        tail_length = self.features.lookback + self.sequence_length
+        if len(frame) < tail_length:
+            raise ValueError(f"Need at least {tail_length} bars to predict")
+        
+        bars = np.empty((tail_length + steps, len(RAW_COLUMNS)))
+        bars[:tail_length] = frame[RAW_COLUMNS].to_numpy(dtype=np.float64)[-tail_length:]
+        predictions = np.empty(steps)
+        
+        self.model.eval()
+        with torch.no_grad():
+            for i in range(steps):
+                with stage('predictor.features'):
+                    window = self.features.transform(pd.DataFrame(bars[i:i + tail_length], columns=RAW_COLUMNS))
+                with stage('predictor.scaling'):
+                    inputs = self._scale_inputs(window.iloc[-self.sequence_length:])
+                with stage('predictor.forward'):
+                    pred = self.model(torch.from_numpy(inputs).float().unsqueeze(0))
+                predictions[i] = self.scaler.inverse_transform(pred.numpy())[0, 0]
+                bars[tail_length + i] = (predictions[i], bars[tail_length + i - 1, 1])
+        return pd.Series(predictions)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the trained model and its fitted scaler.
+        
+        Returns:
+            Dictionary with model weights, scaler parameters and settings
+        """
+        return {
+            'sequence_length': self.sequence_length,
+            'model': self.model.state_dict(),
+            'scaler': scaler_to_dict(self.scaler),
+            'replay': self.replay.tolist() if self.replay is not None else None,
+            'last_index': self.last_index.isoformat() if self.last_index is not None else None,
+            'updates': self.updates,
+            'features': self.features.config() if self.features is not None else None,
+            'feature_scaler': scaler_to_dict(self.feature_scaler) if self.feature_scaler is not None else None
+        }
+    
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a model and scaler produced by `state_dict`.
+        
+        Args:
+            state: Dictionary returned by `state_dict`
+        """
+        self.sequence_length = state['sequence_length']
+        features = state.get('features')
+        self.features = FeaturePipeline(**features) if features else None
+        self.feature_scaler = scaler_from_dict(state['feature_scaler']) if features else None
+        if self.model.lstm.input_size != self.input_size:
+            self.model = LSTMPredictor(input_size=self.input_size)
+        self.model.load_state_dict(state['model'])
+        self.scaler = scaler_from_dict(state['scaler'])
+        # Files saved before incremental updates existed have no replay buffer
+        replay = state.get('replay')
+        self.replay = np.asarray(replay, dtype=np.float64) if replay is not None else None
+        self.last_index = pd.Timestamp(state['last_index']) if state.get('last_index') else None
+        self.updates = state.get('updates', 0)
+    
+    def save(self, path: str) -> None:
+        """
+        Save the trained model and scaler to disk.
+        
+        Args:
+            path: Destination file
+        """
+        torch.save(self.state_dict(), path)
+    
+    @classmethod
+    def load(cls, path: str) -> 'PricePredictor':
+        """
+        Load a predictor previously written by `save`.
+        
+        Args:
+            path: File written by `save`
             
-            predictions = self.scaler.inverse_transform(np.array(predictions).reshape(-1, 1))
-            return pd.Series(predictions.flatten()) 
\ No newline at end of file
+        Returns:
+            PricePredictor ready for inference
+        """
+        state = torch.load(path, map_location='cpu', weights_only=True)
+        predictor = cls(sequence_length=state['sequence_length'])
+        predictor.load_state_dict(state)
+        return predictor
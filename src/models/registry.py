@@ -0,0 +1,307 @@
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional, Union
+
+import pandas as pd
+import torch
+
+from src.models.price_predictor import PricePredictor
+from src.serving.metrics import REGISTRY
+
+MODEL_LOOKUPS = REGISTRY.counter(
+    'quantbrain_model_lookups_total',
+    'Model registry lookups by outcome (hit: served a trained model, miss: trained on the request path)',
+    labels=('result',)
+)
+
+
+class ModelEntry:
+    """A trained predictor together with the time it was trained."""
+
+    def __init__(self, predictor: PricePredictor, trained_at: float):
+        self.predictor = predictor
+        self.trained_at = trained_at
+
+    def age(self) -> float:
+        return time.time() - self.trained_at
+
+
+class ModelRegistry:
+    """
+    Per-symbol cache of trained price predictors.
+
+    Predictors are kept in memory with LRU eviction and optionally persisted
+    to disk (model state_dict plus fitted scaler parameters). Entries older
+    than `max_age` are still served while a replacement is trained in the
+    background, so the request path only ever runs `PricePredictor.predict`
+    once a symbol has been trained. Replacements can be fine-tuned from the
+    current model on the newest bars instead of trained from scratch.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Union[pd.Series, pd.DataFrame]],
+        capacity: int = 32,
+        max_age: timedelta = timedelta(hours=24),
+        cache_dir: Optional[str] = None,
+        train_kwargs: Optional[Dict[str, Any]] = None,
+        refresh_workers: int = 1,
+        max_updates: int = 0,
+        update_kwargs: Optional[Dict[str, Any]] = None,
+        factory: Callable[[], PricePredictor] = PricePredictor
+    ):
+        """
+        Args:
+            loader: Callable returning the training series for a symbol (or
+                its bars, for predictors built with features)
+            capacity: Maximum number of predictors held in memory
+            max_age: Age after which a predictor is retrained in the background
+            cache_dir: Directory for persisted predictors (None disables persistence)
+            train_kwargs: Keyword arguments forwarded to `PricePredictor.train`
+            refresh_workers: Number of background training threads
+            max_updates: Background refreshes that fine-tune the existing
+                model on new bars before a full retrain (0 always retrains)
+            update_kwargs: Keyword arguments forwarded to `PricePredictor.update`
+            factory: Builds an untrained predictor, e.g. one with features
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.loader = loader
+        self.capacity = capacity
+        self.max_age = max_age.total_seconds()
+        self.cache_dir = cache_dir
+        self.train_kwargs = train_kwargs or {}
+        self.max_updates = max_updates
+        self.update_kwargs = update_kwargs or {}
+        self.factory = factory
+
+        self._entries: 'OrderedDict[str, ModelEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._training_locks: Dict[str, threading.Lock] = {}
+        self._refreshing: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_workers,
+            thread_name_prefix="model-refresh"
+        )
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, symbol: str, data: Optional[pd.Series] = None, **train_kwargs) -> PricePredictor:
+        """
+        Get a trained predictor for a symbol.
+
+        Memory is checked first, then disk. If neither has a model, one is
+        trained synchronously; concurrent callers for the same symbol wait
+        for that single training run instead of starting their own.
+
+        Args:
+            symbol: Stock symbol
+            data: Training series to use on a cold start (defaults to `loader`)
+            **train_kwargs: Overrides for the registry's `train_kwargs` when
+                this call trains on a cold start, e.g. a progress `callback`
+
+        Returns:
+            Trained PricePredictor
+        """
+        symbol = symbol.upper()
+        entry = self._lookup(symbol)
+        if entry is None:
+            with self._training_lock(symbol):
+                # Another request may have finished training while we waited
+                entry = self._lookup(symbol)
+                if entry is None:
+                    MODEL_LOOKUPS.inc(result='miss')
+                    series = data if data is not None else self.loader(symbol)
+                    entry = self._train(symbol, series, **train_kwargs)
+                else:
+                    MODEL_LOOKUPS.inc(result='hit')
+        else:
+            MODEL_LOOKUPS.inc(result='hit')
+
+        if entry.age() > self.max_age:
+            self.refresh(symbol)
+        return entry.predictor
+
+    def peek(self, symbol: str, stale: bool = False) -> Optional[PricePredictor]:
+        """
+        Get a predictor without ever training one.
+
+        Args:
+            symbol: Stock symbol
+            stale: Also return a predictor older than `max_age`
+
+        Returns:
+            Predictor from memory or disk, or None if missing (or stale)
+        """
+        entry = self._lookup(symbol.upper())
+        if entry is None or (not stale and entry.age() > self.max_age):
+            return None
+        return entry.predictor
+
+    def put(self, symbol: str, predictor: PricePredictor, trained_at: Optional[float] = None) -> None:
+        """
+        Publish a trained predictor for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            predictor: Trained predictor
+            trained_at: Training timestamp (defaults to now)
+        """
+        symbol = symbol.upper()
+        entry = ModelEntry(predictor, trained_at if trained_at is not None else time.time())
+        if self.cache_dir:
+            self._save(symbol, entry)
+        self._insert(symbol, entry)
+
+    def train(self, symbol: str, data: Optional[pd.Series] = None, **train_kwargs) -> PricePredictor:
+        """
+        Train and publish a predictor for a symbol now, fresh or not.
+
+        Holds the symbol's training lock, so a cold-start `get` for the same
+        symbol waits for this run instead of training its own model.
+
+        Args:
+            symbol: Stock symbol
+            data: Training series (defaults to `loader`)
+            **train_kwargs: Overrides for the registry's `train_kwargs`
+
+        Returns:
+            Newly trained PricePredictor
+        """
+        symbol = symbol.upper()
+        with self._training_lock(symbol):
+            series = data if data is not None else self.loader(symbol)
+            return self._train(symbol, series, **train_kwargs).predictor
+
+    def refresh(self, symbol: str) -> Future:
+        """
+        Retrain a symbol in the background.
+
+        Repeated calls while a refresh is running return the same future.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Future resolving to the newly trained predictor
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            future = self._refreshing.get(symbol)
+            if future is None:
+                future = self._executor.submit(self._refresh, symbol)
+                self._refreshing[symbol] = future
+            return future
+
+    def invalidate(self, symbol: str) -> None:
+        """
+        Drop a symbol from memory and disk.
+
+        Args:
+            symbol: Stock symbol
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            self._entries.pop(symbol, None)
+        if self.cache_dir and os.path.exists(self._path(symbol)):
+            os.remove(self._path(symbol))
+
+    def symbols(self) -> list:
+        """Symbols currently held in memory, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the background refresh workers."""
+        self._executor.shutdown(wait=wait)
+
+    def _lookup(self, symbol: str) -> Optional[ModelEntry]:
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None:
+                self._entries.move_to_end(symbol)
+                return entry
+
+        entry = self._load(symbol)
+        if entry is not None:
+            self._insert(symbol, entry)
+        return entry
+
+    def _insert(self, symbol: str, entry: ModelEntry) -> None:
+        with self._lock:
+            self._entries[symbol] = entry
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def _train(self, symbol: str, data: pd.Series, **train_kwargs) -> ModelEntry:
+        predictor = self.factory()
+        predictor.train(data, **{**self.train_kwargs, **train_kwargs})
+        self.put(symbol, predictor)
+        with self._lock:
+            return self._entries[symbol]
+
+    def _refresh(self, symbol: str) -> PricePredictor:
+        try:
+            series = self.loader(symbol)
+            with self._lock:
+                entry = self._entries.get(symbol)
+            current = entry.predictor if entry is not None else None
+            if current is not None and current.replay is not None and current.updates < self.max_updates:
+                # Fine-tune a copy so requests keep using the current model meanwhile
+                predictor = copy.deepcopy(current)
+                predictor.update(series, **self.update_kwargs)
+                self.put(symbol, predictor)
+                return predictor
+            return self._train(symbol, series).predictor
+        except Exception as e:
+            print(f"Error refreshing model for {symbol}: {str(e)}")
+            raise
+        finally:
+            with self._lock:
+                self._refreshing.pop(symbol, None)
+
+    def _training_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            return self._training_locks.setdefault(symbol, threading.Lock())
+
+    def _path(self, symbol: str) -> str:
+        filename = re.sub(r'[^A-Za-z0-9._-]', '_', symbol)
+        if len(filename) > 100:
+            # Keys such as a universe of symbols can exceed filename limits
+            filename = f"{filename[:60]}-{hashlib.sha1(symbol.encode()).hexdigest()}"
+        return os.path.join(self.cache_dir, f"{filename}.pt")
+
+    def _save(self, symbol: str, entry: ModelEntry) -> None:
+        state = entry.predictor.state_dict()
+        state['trained_at'] = entry.trained_at
+        # Write to a temporary file first so readers never see a partial model
+        tmp_path = f"{self._path(symbol)}.tmp"
+        torch.save(state, tmp_path)
+        os.replace(tmp_path, self._path(symbol))
+
+    def _load(self, symbol: str) -> Optional[ModelEntry]:
+        if not self.cache_dir or not os.path.exists(self._path(symbol)):
+            return None
+        try:
+            state = torch.load(self._path(symbol), map_location='cpu', weights_only=True)
+            predictor = self.factory()
+            expected = predictor.features.config() if predictor.features is not None else None
+            if state.get('features') != expected:
+                # Saved under another feature setting; treat as missing so it is retrained
+                print(f"Ignoring saved model for {symbol}: trained with different features")
+                return None
+            predictor.load_state_dict(state)
+            return ModelEntry(predictor, state.get('trained_at', 0.0))
+        except Exception as e:
+            print(f"Error loading model for {symbol}: {str(e)}")
+            return None
@@ -0,0 +1,164 @@
+import numpy as np
+import torch
+from torch.utils.data import (
+    BatchSampler, DataLoader, Dataset, RandomSampler, SequentialSampler,
+    SubsetRandomSampler, TensorDataset
+)
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+
+def make_windows(values: np.ndarray, sequence_length: int) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Build supervised (X, y) windows as strided views over the input.
+
+    The series is converted to float32 once; every window in X is a view
+    into that buffer created with `Tensor.unfold`, so no per-window copies
+    or Python lists are materialized.
+
+    Args:
+        values: Array of shape (n,) or (n, features)
+        sequence_length: Number of timesteps per window
+
+    Returns:
+        Tuple of X with shape (n - sequence_length, sequence_length, features)
+        and y with shape (n - sequence_length, features)
+    """
+    array = np.ascontiguousarray(values, dtype=np.float32)
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+
+    n_windows = len(array) - sequence_length
+    if n_windows <= 0:
+        return (
+            torch.empty((0, sequence_length, array.shape[1])),
+            torch.empty((0, array.shape[1]))
+        )
+
+    series = torch.from_numpy(array)
+    # unfold yields (windows, features, sequence_length); permute to batch-first
+    X = series[:-1].unfold(0, sequence_length, 1).permute(0, 2, 1)
+    y = series[sequence_length:]
+    return X, y
+
+
+class WindowDataset(Dataset):
+    """
+    Lazily windowed view over a series too large to window in memory.
+
+    Windows are gathered on demand, so `values` can be a `np.memmap`. The
+    dataset accepts a list of indices in `__getitem__` and returns whole
+    batches, which is what `window_loader` relies on.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        sequence_length: int,
+        transform: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    ):
+        """
+        Args:
+            values: Array of shape (n,) or (n, features)
+            sequence_length: Number of timesteps per window
+            transform: Optional function applied to each gathered block,
+                e.g. a fitted scaler's `transform`
+        """
+        self.values = values
+        self.sequence_length = sequence_length
+        self.transform = transform
+        self._offsets = np.arange(sequence_length + 1)
+
+    def __len__(self) -> int:
+        return max(len(self.values) - self.sequence_length, 0)
+
+    def __getitem__(self, index: Union[int, List[int]]) -> Tuple[torch.Tensor, torch.Tensor]:
+        single = np.isscalar(index)
+        indices = np.atleast_1d(np.asarray(index, dtype=np.int64))
+        if indices.size and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError("window index out of range")
+
+        # One fancy-indexing gather of shape (batch, sequence_length + 1[, features])
+        block = np.asarray(self.values[indices[:, None] + self._offsets])
+        if block.ndim == 2:
+            block = block[..., None]
+        if self.transform is not None:
+            shape = block.shape
+            block = self.transform(block.reshape(-1, shape[-1])).reshape(shape)
+
+        block = torch.from_numpy(np.ascontiguousarray(block, dtype=np.float32))
+        X, y = block[:, :-1], block[:, -1]
+        if single:
+            return X[0], y[0]
+        return X, y
+
+
+def window_loader(
+    values: np.ndarray,
+    sequence_length: int,
+    batch_size: int = 32,
+    shuffle: bool = False,
+    transform: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    num_workers: int = 0,
+    indices: Optional[Sequence[int]] = None
+) -> DataLoader:
+    """
+    Stream (X, y) batches from a series without windowing it up front.
+
+    Args:
+        values: Array of shape (n,) or (n, features), may be memory-mapped
+        sequence_length: Number of timesteps per window
+        batch_size: Windows per batch
+        shuffle: Whether to visit windows in random order
+        transform: Optional function applied to each gathered block
+        num_workers: DataLoader worker processes
+        indices: Only visit these windows, e.g. a training split
+
+    Returns:
+        DataLoader yielding batched (X, y) tensors
+    """
+    dataset = WindowDataset(values, sequence_length, transform)
+    return _batched_loader(dataset, batch_size, shuffle, num_workers, indices)
+
+
+def tensor_loader(
+    X: torch.Tensor,
+    y: torch.Tensor,
+    batch_size: int = 32,
+    shuffle: bool = False
+) -> DataLoader:
+    """
+    Batch in-memory windows without per-sample indexing or collation.
+
+    Each batch is gathered from the tensors with one indexing operation,
+    so windowed views from `make_windows` are only copied batch by batch.
+
+    Args:
+        X: Windows of shape (n, sequence_length, features)
+        y: Targets of shape (n, features)
+        batch_size: Windows per batch
+        shuffle: Whether to visit windows in random order
+
+    Returns:
+        DataLoader yielding batched (X, y) tensors
+    """
+    return _batched_loader(TensorDataset(X, y), batch_size, shuffle)
+
+
+def _batched_loader(
+    dataset: Dataset,
+    batch_size: int,
+    shuffle: bool,
+    num_workers: int = 0,
+    indices: Optional[Sequence[int]] = None
+) -> DataLoader:
+    # batch_size=None hands whole index lists to the dataset, skipping collation
+    if indices is not None:
+        sampler = SubsetRandomSampler(indices) if shuffle else indices
+    else:
+        sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+    return DataLoader(
+        dataset,
+        batch_size=None,
+        sampler=BatchSampler(sampler, batch_size=batch_size, drop_last=False),
+        num_workers=num_workers
+    )
@@ -0,0 +1,3 @@
+"""
+Serving infrastructure for the API
+"""
\ No newline at end of file
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from src.serving.executor import BoundedExecutor
+from src.serving.metrics import REGISTRY
+
+BATCH_SIZE = REGISTRY.histogram(
+    'quantbrain_batch_size',
+    'Items per batch run by a micro-batcher',
+    labels=('batcher',),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+)
+BATCH_QUEUE_WAIT = REGISTRY.histogram(
+    'quantbrain_batch_queue_wait_seconds',
+    'Time a request waited for its micro-batch to start',
+    labels=('batcher',),
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 1.0)
+)
+
+# (items, future for their results, time the request was queued)
+PendingRequest = Tuple[List[Any], 'asyncio.Future', float]
+
+
+class MicroBatcher:
+    """
+    Coalesces items from concurrent requests into batched calls.
+
+    Requests are held for at most `max_wait` seconds, or until
+    `max_batch_size` items are waiting, and then run as one call to
+    `process` in `executor`. Each request gets back the slice of results
+    for its own items. A request is never split across batches; one larger
+    than `max_batch_size` runs on its own. Must be used from a single event
+    loop at a time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process: Callable[[List[Any]], List[Any]],
+        executor: BoundedExecutor,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005
+    ):
+        """
+        Args:
+            name: Label used in metrics
+            process: Blocking function mapping a list of items to a list of
+                results of the same length and order
+            executor: Executor the batches run in
+            max_batch_size: Items that trigger an immediate flush
+            max_wait: Seconds the first queued request waits for company
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.name = name
+        self.process = process
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self._pending: List[PendingRequest] = []
+        self._pending_items = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, items: List[Any]) -> List[Any]:
+        """
+        Queue items for the next batch and wait for their results.
+
+        Args:
+            items: Items from one request
+
+        Returns:
+            Results for `items`, in order
+
+        Raises:
+            Whatever `process` or the executor raised for the batch,
+            e.g. `CapacityExceeded`
+        """
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((list(items), future, time.perf_counter()))
+        self._pending_items += len(items)
+
+        if self._pending_items >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch, size = [], 0
+            while self._pending and (not batch or size + len(self._pending[0][0]) <= self.max_batch_size):
+                request = self._pending.pop(0)
+                batch.append(request)
+                size += len(request[0])
+            self._pending_items -= size
+            self._start(batch)
+
+            # Leave a partial batch to wait for more requests
+            if self._pending_items < self.max_batch_size:
+                break
+
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+
+    def _start(self, batch: List[PendingRequest]) -> None:
+        started = time.perf_counter()
+        items = []
+        for request_items, _, queued_at in batch:
+            items.extend(request_items)
+            BATCH_QUEUE_WAIT.observe(started - queued_at, batcher=self.name)
+        BATCH_SIZE.observe(len(items), batcher=self.name)
+
+        try:
+            task = self.executor.submit(self.process, items)
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        task.add_done_callback(lambda done: self._deliver(batch, done))
+
+    def _deliver(self, batch: List[PendingRequest], done: 'asyncio.Future') -> None:
+        if done.cancelled():
+            self._fail(batch, asyncio.CancelledError())
+            return
+        if done.exception() is not None:
+            self._fail(batch, done.exception())
+            return
+
+        results = done.result()
+        offset = 0
+        for request_items, future, _ in batch:
+            if not future.done():
+                future.set_result(results[offset:offset + len(request_items)])
+            offset += len(request_items)
+
+    @staticmethod
+    def _fail(batch: List[PendingRequest], error: BaseException) -> None:
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
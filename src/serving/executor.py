@@ -0,0 +1,121 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+
+class CapacityExceeded(Exception):
+    """Raised when an executor already has its maximum number of calls in flight."""
+
+
+class ExecutionTimeout(Exception):
+    """Raised when a call does not finish within the executor's timeout."""
+
+
+class BoundedExecutor:
+    """
+    Runs blocking calls off the event loop with a hard cap on queued work.
+
+    At most `max_pending` calls may be admitted at once (running or waiting
+    for a worker); further calls fail immediately with `CapacityExceeded`
+    instead of queueing without limit. A call that exceeds `timeout` raises
+    `ExecutionTimeout` to the caller, but keeps its slot until the
+    underlying work actually finishes so timed-out work cannot pile up.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 4,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = 30.0,
+        kind: str = 'thread'
+    ):
+        """
+        Args:
+            name: Name used in errors and stats
+            max_workers: Worker threads or processes
+            max_pending: Calls admitted at once (defaults to twice `max_workers`)
+            timeout: Seconds to wait for a call (None waits forever)
+            kind: 'thread' or 'process'; process workers need picklable calls
+        """
+        if kind not in ('thread', 'process'):
+            raise ValueError("kind must be 'thread' or 'process'")
+
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending or max_workers * 2
+        self.timeout = timeout
+        self.rejected = 0
+        self.timed_out = 0
+
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        if kind == 'thread':
+            self._executor: Executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        else:
+            self._executor = ProcessPoolExecutor(max_workers)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> 'asyncio.Future':
+        """
+        Admit `fn(*args, **kwargs)` and start it without waiting for the result.
+
+        Admission is decided immediately, so callers can reject a request
+        before committing to a response.
+
+        Returns:
+            Future resolving to the call's result
+
+        Raises:
+            CapacityExceeded: If `max_pending` calls are already admitted
+        """
+        with self._lock:
+            if self._in_flight >= self.max_pending:
+                self.rejected += 1
+                raise CapacityExceeded(f"{self.name} is at capacity ({self.max_pending} calls)")
+            self._in_flight += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return asyncio.ensure_future(self._wait(future))
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run `fn(*args, **kwargs)` in a worker and await its result.
+
+        Raises:
+            CapacityExceeded: If `max_pending` calls are already admitted
+            ExecutionTimeout: If the call takes longer than `timeout`
+        """
+        return await self.submit(fn, *args, **kwargs)
+
+    async def _wait(self, future: 'asyncio.Future') -> Any:
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise ExecutionTimeout(f"{self.name} call timed out after {self.timeout}s")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'in_flight': self._in_flight,
+                'max_pending': self.max_pending,
+                'max_workers': self.max_workers,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
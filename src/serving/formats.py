@@ -0,0 +1,103 @@
+import io
+from typing import List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+JSON_RECORDS = 'application/json'
+COLUMNAR_JSON = 'application/vnd.quantbrain.columnar+json'
+ARROW_STREAM = 'application/vnd.apache.arrow.stream'
+PARQUET = 'application/vnd.apache.parquet'
+
+FRAME_MEDIA_TYPES = [JSON_RECORDS, COLUMNAR_JSON, ARROW_STREAM, PARQUET]
+
+
+class NotAcceptable(Exception):
+    """Raised when none of the media types in an Accept header can be produced."""
+
+
+def negotiate(accept: Optional[str], supported: List[str], default: str) -> str:
+    """
+    Pick the response media type for an Accept header.
+
+    Args:
+        accept: Raw Accept header (None or empty means anything)
+        supported: Media types the endpoint can produce
+        default: Media type used for wildcards or a missing header
+
+    Returns:
+        Chosen media type
+
+    Raises:
+        NotAcceptable: If the header excludes every supported type
+    """
+    if not accept:
+        return default
+
+    candidates = []
+    for position, part in enumerate(accept.split(',')):
+        fields = [field.strip() for field in part.split(';')]
+        media_type, quality = fields[0].lower(), 1.0
+        for field in fields[1:]:
+            if field.startswith('q='):
+                try:
+                    quality = float(field[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media_type))
+
+    for _, _, media_type in sorted(candidates):
+        if media_type in ('*/*', 'application/*'):
+            return default
+        if media_type in supported:
+            return media_type
+    raise NotAcceptable(f"Supported media types: {', '.join(supported)}")
+
+
+def _table(df: pd.DataFrame) -> pa.Table:
+    if isinstance(df.index, pd.DatetimeIndex):
+        df = df.reset_index()
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def to_columnar_json(df: pd.DataFrame) -> dict:
+    """
+    Column-oriented JSON: one list per column, dates as ISO strings.
+
+    A date index is emitted as a leading 'Date' column.
+    """
+    if isinstance(df.index, pd.DatetimeIndex):
+        df = df.reset_index()
+    columns = {}
+    for name in df.columns:
+        column = df[name]
+        if pd.api.types.is_datetime64_any_dtype(column):
+            column = column.dt.strftime('%Y-%m-%d')
+        columns[str(name)] = column.tolist()
+    return {'length': len(df), 'columns': columns}
+
+
+def to_arrow_ipc(df: pd.DataFrame) -> bytes:
+    """Serialize a frame as an Arrow IPC stream, keeping a date index as a column."""
+    table = _table(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def to_parquet(df: pd.DataFrame) -> bytes:
+    """Serialize a frame as Parquet, keeping a date index as a column."""
+    buffer = io.BytesIO()
+    pq.write_table(_table(df), buffer)
+    return buffer.getvalue()
+
+
+def read_arrow_ipc(payload: bytes) -> pd.DataFrame:
+    """Inverse of `to_arrow_ipc`; a 'Date' column becomes the index again."""
+    df = pa.ipc.open_stream(payload).read_pandas()
+    if 'Date' in df.columns:
+        df = df.set_index('Date')
+    return df
@@ -0,0 +1,337 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from src.models.registry import ModelRegistry
+
+PENDING = 'pending'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+ACTIVE_STATES = (PENDING, RUNNING)
+
+COLUMNS = (
+    'id', 'symbol', 'params', 'status', 'created_at', 'started_at',
+    'finished_at', 'progress', 'result', 'error', 'owner', 'lease_expires'
+)
+# Added after the first release; older databases are migrated on open
+LEASE_COLUMNS = {'owner': 'TEXT', 'lease_expires': 'REAL', 'cancel_requested': 'INTEGER NOT NULL DEFAULT 0'}
+
+
+class JobCancelled(Exception):
+    """Raised inside a training run when its job has been cancelled."""
+
+
+class TrainingJobQueue:
+    """
+    Persistent queue of model training jobs.
+
+    Jobs are stored in SQLite and picked up by background worker threads,
+    which train through `ModelRegistry.train` so finished models are
+    published for prediction requests. Submitting a symbol that already has
+    a pending or running job with the same parameters returns that job
+    instead of queueing another.
+
+    Several processes (e.g. uvicorn workers) may share one database. A job
+    is claimed with a conditional UPDATE, so only one process runs it, and
+    the claiming queue holds a lease on it that a heartbeat renews. Running
+    jobs whose lease expired, because their process stopped, are queued
+    again; jobs of live processes are left alone.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        db_path: Optional[str] = None,
+        workers: int = 1,
+        poll_interval: float = 1.0,
+        lease: float = 60.0
+    ):
+        """
+        Args:
+            registry: Registry that trains and publishes models
+            db_path: SQLite file holding the queue (None keeps it in memory)
+            workers: Number of training threads (0 only queues jobs)
+            poll_interval: Seconds between idle checks for new jobs
+            lease: Seconds a running job stays claimed without a heartbeat
+                before another process may requeue it
+        """
+        self.registry = registry
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.lease = lease
+        # Identifies this queue's claims among processes sharing the database
+        self.owner = uuid.uuid4().hex
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stopping = False
+        self._stopped = threading.Event()
+
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        # Other processes may hold the write lock briefly
+        self._db = sqlite3.connect(db_path or ':memory:', check_same_thread=False, timeout=30)
+        if db_path:
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, symbol TEXT NOT NULL, params TEXT NOT NULL, "
+            "status TEXT NOT NULL, created_at REAL NOT NULL, started_at REAL, "
+            "finished_at REAL, progress TEXT, result TEXT, error TEXT)"
+        )
+        existing = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for name, definition in LEASE_COLUMNS.items():
+            if name not in existing:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._db.commit()
+        with self._lock:
+            self._requeue_expired()
+
+        self._workers = [
+            threading.Thread(target=self._work, name=f"training-job-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        if workers:
+            self._workers.append(threading.Thread(target=self._heartbeat, name="training-job-lease", daemon=True))
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, symbol: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Queue a training job, or return the identical job already queued.
+
+        Args:
+            symbol: Stock symbol
+            params: Overrides for the registry's `train_kwargs`, e.g. epochs
+
+        Returns:
+            Job record
+        """
+        symbol = symbol.upper()
+        encoded = json.dumps(params or {}, sort_keys=True)
+        with self._changed:
+            row = self._db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM jobs WHERE symbol = ? AND params = ? "
+                "AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (symbol, encoded, *ACTIVE_STATES)
+            ).fetchone()
+            if row is not None:
+                return self._record(row)
+
+            job_id = uuid.uuid4().hex
+            self._db.execute(
+                "INSERT INTO jobs (id, symbol, params, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, symbol, encoded, PENDING, time.time())
+            )
+            self._db.commit()
+            self._changed.notify_all()
+            return self._get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job record, or None for an unknown id."""
+        with self._lock:
+            return self._get(job_id)
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Most recent jobs first.
+
+        Args:
+            status: Only return jobs in this state
+            limit: Maximum number of jobs
+
+        Returns:
+            Job records
+        """
+        query = f"SELECT {', '.join(COLUMNS)} FROM jobs"
+        args: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            args = (status,)
+        with self._lock:
+            rows = self._db.execute(f"{query} ORDER BY created_at DESC LIMIT ?", (*args, limit))
+            return [self._record(row) for row in rows.fetchall()]
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a job.
+
+        A pending job is cancelled immediately. A running job, in this or
+        another process, stops at the end of its current epoch and its model
+        is not published. Finished jobs are left as they are.
+
+        Args:
+            job_id: Job id
+
+        Returns:
+            Job record after the request, or None for an unknown id
+        """
+        with self._changed:
+            job = self._get(job_id)
+            if job is None:
+                return None
+            if job['status'] == PENDING:
+                self._set_status(job_id, CANCELLED, finished_at=time.time())
+            elif job['status'] == RUNNING:
+                # Read by whichever process runs the job
+                self._db.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+                self._db.commit()
+            return self._get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Block until a job finishes or `timeout` seconds pass.
+
+        Returns:
+            Latest job record, or None for an unknown id
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._changed:
+            while True:
+                job = self._get(job_id)
+                if job is None or job['status'] not in ACTIVE_STATES:
+                    return job
+                remaining = deadline - time.monotonic() if deadline is not None else self.poll_interval
+                if remaining <= 0:
+                    return job
+                # Jobs run by other processes do not notify this one
+                self._changed.wait(min(remaining, self.poll_interval))
+
+    def stats(self) -> Dict[str, int]:
+        """Number of jobs in each state."""
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers after their current job."""
+        with self._changed:
+            self._stopping = True
+            self._stopped.set()
+            self._changed.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _work(self) -> None:
+        while True:
+            with self._changed:
+                job = self._claim()
+                while job is None and not self._stopping:
+                    self._changed.wait(self.poll_interval)
+                    job = self._claim()
+                if job is None:
+                    return
+            self._run(job)
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        # Callers hold the lock
+        self._requeue_expired()
+        candidates = self._db.execute(
+            "SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 8", (PENDING,)
+        ).fetchall()
+        for (job_id,) in candidates:
+            now = time.time()
+            # Only succeeds if no other process claimed the job in between
+            claimed = self._db.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, owner = ?, lease_expires = ? "
+                "WHERE id = ? AND status = ?",
+                (RUNNING, now, self.owner, now + self.lease, job_id, PENDING)
+            ).rowcount
+            self._db.commit()
+            if claimed:
+                self._changed.notify_all()
+                return self._get(job_id)
+        return None
+
+    def _requeue_expired(self) -> None:
+        """Queue again the running jobs whose owner stopped renewing its lease."""
+        # Callers hold the lock
+        requeued = self._db.execute(
+            "UPDATE jobs SET status = ?, started_at = NULL, progress = NULL, owner = NULL, "
+            "lease_expires = NULL WHERE status = ? AND (lease_expires IS NULL OR lease_expires < ?)",
+            (PENDING, RUNNING, time.time())
+        ).rowcount
+        self._db.commit()
+        if requeued:
+            print(f"Requeued {requeued} training job(s) whose worker stopped")
+
+    def _heartbeat(self) -> None:
+        """Renew the leases of jobs this queue is running."""
+        while not self._stopped.wait(self.lease / 3):
+            with self._lock:
+                self._db.execute(
+                    "UPDATE jobs SET lease_expires = ? WHERE owner = ? AND status = ?",
+                    (time.time() + self.lease, self.owner, RUNNING)
+                )
+                self._db.commit()
+
+    def _run(self, job: Dict[str, Any]) -> None:
+        job_id = job['id']
+
+        def report(epoch: int, loss: float) -> None:
+            with self._changed:
+                cancelled = self._db.execute(
+                    "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                if cancelled and cancelled[0]:
+                    raise JobCancelled(job_id)
+                self._db.execute(
+                    "UPDATE jobs SET progress = ? WHERE id = ?",
+                    (json.dumps({'epoch': epoch + 1, 'loss': loss}), job_id)
+                )
+                self._db.commit()
+                self._changed.notify_all()
+
+        try:
+            started = time.perf_counter()
+            predictor = self.registry.train(job['symbol'], callback=report, **job['params'])
+            result = {
+                'train_seconds': time.perf_counter() - started,
+                'sequence_length': predictor.sequence_length
+            }
+        except JobCancelled:
+            self._finish(job_id, CANCELLED)
+            return
+        except Exception as e:
+            print(f"Training job {job_id} for {job['symbol']} failed: {str(e)}")
+            self._finish(job_id, FAILED, error=str(e))
+            return
+        self._finish(job_id, SUCCEEDED, result=json.dumps(result))
+
+    def _finish(self, job_id: str, status: str, **fields) -> None:
+        with self._changed:
+            self._set_status(job_id, status, finished_at=time.time(), lease_expires=None, **fields)
+
+    def _set_status(self, job_id: str, status: str, **fields) -> None:
+        # Callers hold the lock
+        assignments = ', '.join(f"{name} = ?" for name in ('status', *fields))
+        self._db.execute(
+            f"UPDATE jobs SET {assignments} WHERE id = ?",
+            (status, *fields.values(), job_id)
+        )
+        self._db.commit()
+        self._changed.notify_all()
+
+    def _get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._db.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._record(row) if row is not None else None
+
+    @staticmethod
+    def _record(row: tuple) -> Dict[str, Any]:
+        job = dict(zip(COLUMNS, row))
+        for name in ('params', 'progress', 'result'):
+            if job[name] is not None:
+                job[name] = json.loads(job[name])
+        return job
@@ -0,0 +1,69 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+UNLOADED = 'unloaded'
+LOADING = 'loading'
+READY = 'ready'
+FAILED = 'failed'
+
+
+class LazyComponent(Generic[T]):
+    """
+    Thread-safe, build-on-first-use holder for an expensive component.
+
+    The factory runs at most once at a time; concurrent callers wait for
+    it. A failed build is recorded and retried on the next `get`.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        """
+        Args:
+            name: Name reported in status output
+            factory: Callable that builds the component
+        """
+        self.name = name
+        self.factory = factory
+        self.state = UNLOADED
+        self.load_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+
+        self._value: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """Return the component, building it if needed."""
+        if self.state == READY:
+            return self._value
+
+        with self._lock:
+            if self.state != READY:
+                self.state = LOADING
+                start = time.perf_counter()
+                try:
+                    self._value = self.factory()
+                except Exception as e:
+                    self.state = FAILED
+                    self.error = str(e)
+                    raise
+                self.load_seconds = time.perf_counter() - start
+                self.error = None
+                self.state = READY
+        return self._value
+
+    @property
+    def loaded(self) -> bool:
+        return self.state == READY
+
+    def peek(self) -> Optional[T]:
+        """Return the component if it is already built, without building it."""
+        return self._value if self.state == READY else None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'load_seconds': self.load_seconds,
+            'error': self.error
+        }
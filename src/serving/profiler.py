@@ -0,0 +1,95 @@
+import collections
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# Frames from these files are noise in a profile of request handling
+IGNORED_FILES = ('threading.py', 'concurrent/futures/thread.py', 'profiler.py')
+# A thread whose innermost frame is here is idle: a pool worker waiting for
+# work, an event loop waiting for I/O, or a caller blocked on a future
+IDLE_FILES = ('queue.py', 'selectors.py', 'concurrent/futures/_base.py')
+
+
+class SamplingProfiler:
+    """
+    Low-overhead stack sampler for profiling a single request.
+
+    A background thread records the Python stacks of every other thread
+    every `interval` seconds. Blocking work runs in executor threads rather
+    than on the event loop, so all threads are sampled; concurrent requests
+    therefore show up in each other's profiles.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64):
+        """
+        Args:
+            interval: Seconds between samples
+            max_depth: Innermost frames kept per stack
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples: 'collections.Counter[Tuple[str, ...]]' = collections.Counter()
+        self.sample_count = 0
+        self.started: Optional[float] = None
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'SamplingProfiler':
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> 'SamplingProfiler':
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.elapsed = time.perf_counter() - self.started
+        return self
+
+    def __enter__(self) -> 'SamplingProfiler':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def collapsed(self) -> str:
+        """Stacks in the collapsed format read by flamegraph tools, one per line."""
+        return '\n'.join(
+            f"{';'.join(stack)} {count}"
+            for stack, count in self.samples.most_common()
+        )
+
+    def top(self, limit: int = 20) -> Dict[str, float]:
+        """Fraction of samples in which each function appears, most frequent first."""
+        inclusive: 'collections.Counter[str]' = collections.Counter()
+        for stack, count in self.samples.items():
+            for frame in set(stack):
+                inclusive[frame] += count
+        total = sum(self.samples.values()) or 1
+        return {frame: count / total for frame, count in inclusive.most_common(limit)}
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample_count += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = self._stack(frame)
+                if stack:
+                    self.samples[stack] += 1
+
+    def _stack(self, frame) -> Tuple[str, ...]:
+        frames = []
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            filename = code.co_filename.replace('\\', '/')
+            if not frames and filename.endswith(IDLE_FILES):
+                return ()
+            if not filename.endswith(IGNORED_FILES):
+                frames.append(f"{code.co_name} ({filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+            frame = frame.f_back
+        return tuple(reversed(frames))
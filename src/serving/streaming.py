@@ -0,0 +1,127 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from src.serving.executor import BoundedExecutor
+
+NDJSON = 'application/x-ndjson'
+EVENT_STREAM = 'text/event-stream'
+STREAM_MEDIA_TYPES = [NDJSON, EVENT_STREAM]
+
+
+def encode_event(event: Dict[str, Any], media_type: str) -> str:
+    """
+    Encode one event as an NDJSON line or a server-sent event.
+
+    For SSE the event's 'event' field, if present, becomes the event name.
+    """
+    data = json.dumps(event)
+    if media_type == EVENT_STREAM:
+        name = event.get('event')
+        prefix = f"event: {name}\n" if name else ''
+        return f"{prefix}data: {data}\n\n"
+    return f"{data}\n"
+
+
+class StreamTimer:
+    """Tracks time-to-first-byte and total duration of a streamed response."""
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.first_byte: Optional[float] = None
+
+    def mark_first_byte(self) -> None:
+        if self.first_byte is None:
+            self.first_byte = time.perf_counter()
+
+    @property
+    def ttfb_ms(self) -> Optional[float]:
+        if self.first_byte is None:
+            return None
+        return (self.first_byte - self.started) * 1000
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            'ttfb_ms': self.ttfb_ms,
+            'elapsed_ms': (time.perf_counter() - self.started) * 1000
+        }
+
+
+async def encode_stream(
+    events: AsyncIterator[Dict[str, Any]],
+    media_type: str,
+    timer: StreamTimer,
+    name: str
+) -> AsyncIterator[str]:
+    """
+    Encode an event stream, stamping timing onto the final event.
+
+    The final event (the one with 'event' == 'done') gets the stream's
+    time-to-first-byte and total duration, which are also logged.
+
+    Args:
+        events: Events to send
+        media_type: NDJSON or EVENT_STREAM
+        timer: Timer started when the request arrived
+        name: Stream name used in the log line
+    """
+    async for event in events:
+        timer.mark_first_byte()
+        if event.get('event') == 'done':
+            event = {**event, **timer.summary()}
+            print(f"{name} stream finished: ttfb {event['ttfb_ms']:.1f} ms, "
+                  f"total {event['elapsed_ms']:.1f} ms")
+        yield encode_event(event, media_type)
+
+
+def stream_from_executor(
+    executor: BoundedExecutor,
+    fn: Callable[..., Optional[Dict[str, Any]]],
+    *args
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run `fn(emit, *args)` in an executor and stream the events it emits.
+
+    `emit` may be called from the worker thread any number of times. When
+    `fn` returns, a final 'done' event carrying its returned fields is
+    sent; if it raises, an 'error' event is sent instead. The call is
+    admitted immediately, so `CapacityExceeded` is raised here, before any
+    response is started.
+
+    Args:
+        executor: Executor to run `fn` in
+        fn: Blocking function taking an `emit` callback first
+
+    Returns:
+        Async iterator of event dictionaries
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(event: Dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    task = executor.submit(fn, emit, *args)
+
+    async def events() -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter in done:
+                yield getter.result()
+                continue
+            getter.cancel()
+            break
+
+        # Events emitted just before the call returned
+        while not queue.empty():
+            yield queue.get_nowait()
+        try:
+            result = task.result() or {}
+        except Exception as e:
+            yield {'event': 'error', 'detail': str(e)}
+            return
+        yield {'event': 'done', **result}
+
+    return events()
@@ -0,0 +1,3 @@
+"""
+Streamlit web interface and its API client
+"""
\ No newline at end of file
@@ -0,0 +1,164 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+
+
+class ApiError(Exception):
+    """A QuantBrain API call failed or returned an error status."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ApiClient:
+    """
+    Thin client for the QuantBrain API used by the Streamlit app.
+
+    All calls share one `requests.Session`, so connections are kept alive
+    and pooled instead of opened per request. Busy (429) and unavailable
+    (502-504) responses are retried with backoff, honouring Retry-After.
+    Failures raise `ApiError` rather than returning empty results, so
+    callers that memoize results never cache a failure.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        pool_size: int = 8,
+        timeout: float = 60.0,
+        retries: int = 2,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Args:
+            base_url: API root (defaults to QUANTBRAIN_API_URL or localhost)
+            pool_size: Connections kept open, and concurrent calls in `gather`
+            timeout: Seconds to wait for a response
+            retries: Retries of busy or unavailable responses
+            session: Preconfigured session to use instead of a pooled one
+        """
+        self.base_url = (base_url or os.getenv("QUANTBRAIN_API_URL", DEFAULT_BASE_URL)).rstrip('/')
+        self.timeout = timeout
+        self.session = session or self._pooled_session(pool_size, retries)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="api-client")
+
+    @staticmethod
+    def _pooled_session(pool_size: int, retries: int) -> requests.Session:
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def financial_data(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        """
+        Daily bars for [start, end], fetched as Arrow.
+
+        Args:
+            symbol: Stock symbol
+            start: First date
+            end: Last date
+
+        Returns:
+            DataFrame of OHLCV bars indexed by date
+        """
+        response = self._request(
+            'POST',
+            '/api/data/financial',
+            json={"symbol": symbol, "start_date": start.isoformat(), "end_date": end.isoformat()},
+            headers={"Accept": "application/vnd.apache.arrow.stream"}
+        )
+        return pa.ipc.open_stream(response.content).read_pandas().set_index('Date')
+
+    def company_info(self, symbol: str) -> Dict[str, Any]:
+        return self._request('GET', f'/api/company/{symbol}').json()
+
+    def price_prediction(self, symbol: str, steps: int = 5) -> Dict[str, Any]:
+        return self._request('POST', '/api/prediction/price', json={"symbol": symbol, "steps": steps}).json()
+
+    def sentiment(self, texts: List[str]) -> List[Dict[str, Any]]:
+        if not texts:
+            return []
+        return self._request('POST', '/api/analysis/sentiment', json={"texts": texts}).json()
+
+    def gather(self, *calls: Callable[[], Any]) -> List[Any]:
+        """
+        Run independent calls concurrently on the pooled session.
+
+        Args:
+            *calls: Zero-argument callables, e.g. lambdas over client methods
+
+        Returns:
+            Their results, in order
+
+        Raises:
+            The first failure, after every call has finished
+        """
+        futures = [self._executor.submit(call) for call in calls]
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            raise ApiError(f"{method} {path} failed: {str(e)}") from e
+        if response.status_code != 200:
+            try:
+                detail = response.json().get('detail', response.text)
+            except ValueError:
+                detail = response.text
+            raise ApiError(f"{method} {path} returned {response.status_code}: {detail}", response.status_code)
+        return response
+
+
+def score_new_texts(
+    client: ApiClient,
+    texts: List[str],
+    results: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Score only the texts that have no result yet.
+
+    Failed texts (results with an 'error' key) are not stored, so they are
+    sent again on the next call.
+
+    Args:
+        client: API client
+        texts: All texts on screen
+        results: Text -> successful sentiment result; updated in place
+
+    Returns:
+        Text -> result for every text sent for scoring, errors included
+    """
+    pending = list(dict.fromkeys(text for text in texts if text not in results))
+    if not pending:
+        return {}
+    scored = dict(zip(pending, client.sentiment(pending)))
+    results.update((text, result) for text, result in scored.items() if 'error' not in result)
+    return scored
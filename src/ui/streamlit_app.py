@@ -1,10 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import pandas as pd
-import json
-import requests
-from typing import List, Dict
+from typing import Any, Callable, Dict
+
+from src.ui.api_client import ApiClient, ApiError, score_new_texts
 
 # Configure the page
 st.set_page_config(
@@ -35,48 +35,43 @@ if 'current_symbol' not in st.session_state:
     st.session_state.current_symbol = 'AAPL'
 if 'sentiment_texts' not in st.session_state:
     st.session_state.sentiment_texts = []
+if 'sentiment_results' not in st.session_state:
+    # Text -> successful result, so adding a text only scores that text
+    st.session_state.sentiment_results = {}
+
+# Seconds results stay cached across reruns and sessions
+COMPANY_INFO_TTL = 3600
+MARKET_DATA_TTL = 300
+PREDICTION_TTL = 300
+
+@st.cache_resource
+def get_client() -> ApiClient:
+    """One pooled API client shared by every session"""
+    return ApiClient()
+
+# Failed calls raise, so they are never cached
+@st.cache_data(ttl=COMPANY_INFO_TTL, show_spinner=False)
+def get_company_info(symbol: str) -> Dict:
+    """Get company information from the API"""
+    return get_client().company_info(symbol)
 
-# API endpoints
-BASE_URL = "http://localhost:8000"
-
-def fetch_financial_data(symbol: str, days: int = 30) -> pd.DataFrame:
-    """Fetch financial data from the API"""
-    endpoint = f"{BASE_URL}/api/data/financial"
-    data = {
-        "symbol": symbol,
-        "start_date": (datetime.now() - timedelta(days=days)).isoformat(),
-        "end_date": datetime.now().isoformat()
-    }
-    response = requests.post(endpoint, json=data)
-    if response.status_code == 200:
-        return pd.DataFrame(response.json())
-    return pd.DataFrame()
-
-def analyze_sentiment(texts: List[str]) -> List[Dict]:
-    """Analyze sentiment using the API"""
-    endpoint = f"{BASE_URL}/api/analysis/sentiment"
-    data = {"texts": texts}
-    response = requests.post(endpoint, json=data)
-    if response.status_code == 200:
-        return response.json()
-    return []
+@st.cache_data(ttl=MARKET_DATA_TTL, show_spinner=False)
+def get_market_data(symbol: str, start: date, end: date) -> pd.DataFrame:
+    """Get bars for a date range from the API"""
+    return get_client().financial_data(symbol, start, end)
 
+@st.cache_data(ttl=PREDICTION_TTL, show_spinner=False)
 def get_price_prediction(symbol: str, steps: int = 5) -> Dict:
     """Get price predictions from the API"""
-    endpoint = f"{BASE_URL}/api/prediction/price"
-    data = {"symbol": symbol, "steps": steps}
-    response = requests.post(endpoint, json=data)
-    if response.status_code == 200:
-        return response.json()
-    return {}
+    return get_client().price_prediction(symbol, steps)
 
-def get_company_info(symbol: str) -> Dict:
-    """Get company information from the API"""
-    endpoint = f"{BASE_URL}/api/company/{symbol}"
-    response = requests.get(endpoint)
-    if response.status_code == 200:
-        return response.json()
-    return {}
+def call_api(fn: Callable, *args, default: Any = None) -> Any:
+    """Run an API call, showing failures instead of raising"""
+    try:
+        return fn(*args)
+    except ApiError as e:
+        st.error(str(e))
+        return default
 
 # Sidebar
 st.sidebar.title("📊 QuantBrain")
@@ -98,45 +93,58 @@ if page == "Market Data":
     with col1:
         symbol = st.text_input("Stock Symbol", value=st.session_state.current_symbol)
         days = st.slider("Time Period (days)", 7, 365, 30)
+        fetch = st.button("Fetch Data")
+    
+    # Whole days keep the cache key stable between reruns
+    end = date.today()
+    start = end - timedelta(days=days)
+    # Company info comes from its own longer-lived cache
+    if fetch:
+        # Independent requests, so run them side by side on the pooled client
+        info, df = call_api(
+            get_client().gather,
+            lambda: get_company_info(symbol),
+            lambda: get_market_data(symbol, start, end),
+            default=({}, None)
+        )
+    else:
+        info, df = call_api(get_company_info, symbol, default={}), None
     
     with col2:
         st.markdown("### Company Info")
-        info = get_company_info(symbol)
         if info:
             st.write(f"**Name:** {info.get('name', 'N/A')}")
             st.write(f"**Sector:** {info.get('sector', 'N/A')}")
             st.write(f"**Industry:** {info.get('industry', 'N/A')}")
     
-    if st.button("Fetch Data"):
-        df = fetch_financial_data(symbol, days)
-        if not df.empty:
-            fig = go.Figure(data=[go.Candlestick(
-                x=df.index,
-                open=df['Open'],
-                high=df['High'],
-                low=df['Low'],
-                close=df['Close']
-            )])
-            fig.update_layout(
-                title=f"{symbol} Stock Price",
-                yaxis_title="Price",
-                xaxis_title="Date",
-                template="plotly_dark"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Volume chart
-            fig_volume = go.Figure(data=[go.Bar(
-                x=df.index,
-                y=df['Volume']
-            )])
-            fig_volume.update_layout(
-                title="Trading Volume",
-                yaxis_title="Volume",
-                xaxis_title="Date",
-                template="plotly_dark"
-            )
-            st.plotly_chart(fig_volume, use_container_width=True)
+    if df is not None and not df.empty:
+        fig = go.Figure(data=[go.Candlestick(
+            x=df.index,
+            open=df['Open'],
+            high=df['High'],
+            low=df['Low'],
+            close=df['Close']
+        )])
+        fig.update_layout(
+            title=f"{symbol} Stock Price",
+            yaxis_title="Price",
+            xaxis_title="Date",
+            template="plotly_dark"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Volume chart
+        fig_volume = go.Figure(data=[go.Bar(
+            x=df.index,
+            y=df['Volume']
+        )])
+        fig_volume.update_layout(
+            title="Trading Volume",
+            yaxis_title="Volume",
+            xaxis_title="Date",
+            template="plotly_dark"
+        )
+        st.plotly_chart(fig_volume, use_container_width=True)
 
 elif page == "Sentiment Analysis":
     st.header("Sentiment Analysis")
@@ -146,20 +154,29 @@ elif page == "Sentiment Analysis":
     if st.button("Add Text"):
         if new_text:
             st.session_state.sentiment_texts.append(new_text)
-            st.experimental_rerun()
+            st.rerun()
     
     if st.session_state.sentiment_texts:
         st.markdown("### Analysis Results")
-        results = analyze_sentiment(st.session_state.sentiment_texts)
+        results = st.session_state.sentiment_results
+        # Failed texts are not kept in `results`, so they are retried on the next rerun
+        scored = call_api(score_new_texts, get_client(), st.session_state.sentiment_texts, results, default={})
         
-        for text, result in zip(st.session_state.sentiment_texts, results):
+        for text in st.session_state.sentiment_texts:
+            result = results.get(text) or scored.get(text)
+            if result is None:
+                continue
             with st.expander(f"Text: {text[:50]}..."):
-                st.write(f"**Sentiment:** {result['label']}")
-                st.write(f"**Confidence:** {result['score']:.2%}")
+                if 'error' in result:
+                    st.error(f"Could not analyze this text: {result['error']}")
+                else:
+                    st.write(f"**Sentiment:** {result['label']}")
+                    st.write(f"**Confidence:** {result['score']:.2%}")
         
         if st.button("Clear All"):
             st.session_state.sentiment_texts = []
-            st.experimental_rerun()
+            st.session_state.sentiment_results = {}
+            st.rerun()
 
 elif page == "Price Prediction":
     st.header("Price Prediction")
@@ -171,7 +188,7 @@ elif page == "Price Prediction":
         steps = st.slider("Prediction Steps", 1, 30, 5)
     
     if st.button("Generate Prediction"):
-        prediction = get_price_prediction(symbol, steps)
+        prediction = call_api(get_price_prediction, symbol, steps, default={})
         if prediction:
             st.markdown("### Price Predictions")
             
@@ -208,7 +225,7 @@ elif page == "Company Info":
     
     symbol = st.text_input("Stock Symbol", value=st.session_state.current_symbol)
     if st.button("Get Company Info"):
-        info = get_company_info(symbol)
+        info = call_api(get_company_info, symbol, default={})
         if info:
             col1, col2 = st.columns(2)
             with col1:
@@ -221,8 +238,6 @@ elif page == "Company Info":
                 st.markdown("### Financial Metrics")
                 st.write(f"**Market Cap:** ${info.get('market_cap', 0):,.2f}")
                 st.write(f"**P/E Ratio:** {info.get('pe_ratio', 'N/A')}")
-        else:
-            st.error("Could not fetch company information")
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,6 @@
+import pytest
+from fakes import FakeSource
+
+@pytest.fixture
+def source():
+    return FakeSource()
@@ -0,0 +1,55 @@
+"""Stand-ins for upstream data and models shared by the tests."""
+import time
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import synthetic_prices
+from src.data.sources import DataSource
+
+class FakeSource(DataSource):
+    """Deterministic business-day bars that record every upstream request."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+
+    def fetch(self, symbol, start, end):
+        self.requests.append((symbol, start, end))
+        time.sleep(self.delay)
+        index = pd.bdate_range(start, end - pd.Timedelta(days=1), name='Date')
+        close = 100.0 + index.dayofyear.values + np.sin(np.arange(len(index)))
+        return pd.DataFrame({
+            'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1000
+        }, index=index)
+
+    def company_info(self, symbol):
+        self.requests.append((symbol, 'info'))
+        return {
+            'name': f"{symbol} Inc.",
+            'sector': 'Technology',
+            'industry': 'Consumer Electronics',
+            'market_cap': 1e12,
+            'pe_ratio': 30.0
+        }
+
+class StubPipeline:
+    """Keyword-based stand-in for a transformers sentiment pipeline."""
+    tokenizer = None
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, inputs, **kwargs):
+        batch = inputs if isinstance(inputs, list) else [inputs]
+        self.calls.append(list(batch))
+        if any(not isinstance(text, str) or 'FAIL' in text for text in batch):
+            raise ValueError("bad input")
+        return [
+            {'label': 'NEGATIVE' if 'drop' in text else 'POSITIVE', 'score': 0.9}
+            for text in batch
+        ]
+
+def synthetic_bars(n=300, seed=0):
+    """Close and Volume bars around a `synthetic_prices` random walk."""
+    close = synthetic_prices(n, seed)
+    volume = np.random.default_rng(seed).integers(1_000, 5_000, n).astype(float)
+    return pd.DataFrame({'Close': close.values, 'Volume': volume}, index=close.index)
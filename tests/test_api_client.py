@@ -0,0 +1,111 @@
+import io
+import json
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+import pyarrow as pa
+import pytest
+from src.ui.api_client import ApiClient, ApiError, score_new_texts
+
+class FakeApi(BaseHTTPRequestHandler):
+    """Keep-alive stand-in for the API that records connections and requests."""
+    protocol_version = 'HTTP/1.1'
+    delay = 0.0
+
+    def do_GET(self):
+        self.record()
+        symbol = self.path.rsplit('/', 1)[-1]
+        if symbol == 'MISSING':
+            return self.reply(404, json.dumps({'detail': 'No data found'}).encode(), 'application/json')
+        self.reply(200, json.dumps({'name': f'{symbol} Inc.'}).encode(), 'application/json')
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.record(body)
+        if self.path == '/api/analysis/sentiment':
+            results = [
+                {'error': 'bad input'} if 'FAIL' in text else {'label': 'POSITIVE', 'score': len(text) / 100}
+                for text in body['texts']
+            ]
+            return self.reply(200, json.dumps(results).encode(), 'application/json')
+        frame = pd.DataFrame({'Date': pd.to_datetime([body['start_date'], body['end_date']]), 'Close': [1.0, 2.0]})
+        sink = io.BytesIO()
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        self.reply(200, sink.getvalue(), 'application/vnd.apache.arrow.stream')
+
+    def record(self, body=None):
+        self.server.connections.add(self.client_address)
+        self.server.requests.append((self.path, body))
+        time.sleep(self.delay)
+
+    def reply(self, status, payload, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeApi)
+    server.connections, server.requests = set(), []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def client(server):
+    client = ApiClient(f'http://127.0.0.1:{server.server_port}', retries=0)
+    yield client
+    client.close()
+
+def test_requests_reuse_pooled_connection(client, server):
+    for _ in range(5):
+        assert client.company_info('AAPL') == {'name': 'AAPL Inc.'}
+    assert len(server.connections) == 1
+
+def test_financial_data_reads_arrow(client, server):
+    frame = client.financial_data('AAPL', date(2024, 1, 2), date(2024, 1, 31))
+    assert frame['Close'].tolist() == [1.0, 2.0]
+    assert frame.index[0] == pd.Timestamp('2024-01-02')
+    assert server.requests[0][1]['start_date'] == '2024-01-02'
+
+def test_errors_raise(client):
+    with pytest.raises(ApiError) as error:
+        client.company_info('MISSING')
+    assert error.value.status_code == 404 and 'No data found' in str(error.value)
+
+def test_gather_runs_calls_concurrently(client, monkeypatch):
+    monkeypatch.setattr(FakeApi, 'delay', 0.2)
+    started = time.perf_counter()
+    info, frame = client.gather(
+        lambda: client.company_info('AAPL'),
+        lambda: client.financial_data('AAPL', date(2024, 1, 2), date(2024, 1, 31))
+    )
+    assert time.perf_counter() - started < 0.35
+    assert info['name'] == 'AAPL Inc.' and len(frame) == 2
+    with pytest.raises(ApiError):
+        client.gather(lambda: client.company_info('AAPL'), lambda: client.company_info('MISSING'))
+
+def test_only_new_texts_are_scored(client, server):
+    results = {}
+    assert list(score_new_texts(client, ['rally', 'drop'], results)) == ['rally', 'drop']
+    assert list(score_new_texts(client, ['rally', 'drop', 'beat', 'beat'], results)) == ['beat']
+    assert score_new_texts(client, ['rally', 'beat'], results) == {}
+    assert [body['texts'] for _, body in server.requests] == [['rally', 'drop'], ['beat']]
+    assert results['beat']['score'] == 0.04
+
+def test_failed_texts_are_retried(client, server):
+    results = {}
+    scored = score_new_texts(client, ['rally', 'FAIL'], results)
+    assert scored['FAIL'] == {'error': 'bad input'} and 'FAIL' not in results
+    assert list(score_new_texts(client, ['rally', 'FAIL'], results)) == ['FAIL']
@@ -0,0 +1,237 @@
+import json
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+import api.main as main
+from src.analysis.cache import SentimentCache
+from src.analysis.sentiment import SentimentAnalyzer
+from src.data.company_cache import CompanyInfoCache
+from src.data.financial import FinancialData
+from src.data.store import OHLCVStore
+from src.models.registry import ModelRegistry
+from src.serving.jobs import TrainingJobQueue
+from src.serving.lazy import LazyComponent
+from fakes import StubPipeline
+
+@pytest.fixture
+def client(monkeypatch, tmp_path, source):
+    """In-process API backed by a fake data source and a stub sentiment model."""
+    components = {
+        'financial_data': lambda: FinancialData(source=source, store=OHLCVStore(str(tmp_path / 'data'))),
+        'company_info': lambda: CompanyInfoCache(
+            main.financial_data.get().get_company_info,
+            snapshot_path=str(tmp_path / 'company_info.json')
+        ),
+        'sentiment_analyzer': lambda: SentimentAnalyzer(model=StubPipeline()),
+        'model_registry': lambda: ModelRegistry(
+            main.load_model_inputs,
+            cache_dir=str(tmp_path / 'models'),
+            train_kwargs={'epochs': 2},
+            factory=main.new_predictor
+        ),
+        'batch_models': lambda: main.build_batch_models(),
+        'training_jobs': lambda: TrainingJobQueue(main.model_registry.get())
+    }
+    for name, factory in components.items():
+        monkeypatch.setattr(main, name, LazyComponent(name, factory))
+    monkeypatch.setattr(main, 'COMPONENTS', [getattr(main, name) for name in components])
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+def test_health(client):
+    assert client.get('/health/live').status_code == 200
+    ready = client.get('/health/ready').json()
+    assert ready['components']['sentiment_analyzer']['state'] == 'unloaded'
+
+def test_financial_data(client):
+    response = client.post('/api/data/financial', json={
+        'symbol': 'AAPL', 'start_date': '2024-01-02', 'end_date': '2024-01-31'
+    })
+    assert response.status_code == 200
+    assert len(response.json()) == 22
+
+def test_bulk_financial_data(client, source):
+    response = client.post('/api/data/financial/bulk', json={
+        'symbols': ['AAPL', 'msft', 'GOOG', 'aapl'], 'start_date': '2024-01-02', 'end_date': '2024-01-31'
+    })
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload['symbols'] == ['AAPL', 'MSFT', 'GOOG']
+    assert len(payload['columns']['Close']) == 66
+    assert payload['columns']['Date'][0] == '2024-01-02'
+
+def test_sentiment(client):
+    response = client.post('/api/analysis/sentiment', json={'texts': ['prices drop', 'record revenue']})
+    assert [r['label'] for r in response.json()] == ['NEGATIVE', 'POSITIVE']
+
+def test_price_prediction_trains_once(client, source):
+    for _ in range(2):
+        response = client.post('/api/prediction/price', json={'symbol': 'AAPL', 'steps': 3})
+        assert response.status_code == 200
+        assert len(response.json()['predictions']) == 3
+    assert main.model_registry.get().symbols() == ['AAPL']
+
+def test_price_prediction_with_features(client, monkeypatch):
+    from src.models.features import FeaturePipeline
+    monkeypatch.setattr(main, 'FEATURES', FeaturePipeline())
+    response = client.post('/api/prediction/price', json={'symbol': 'AAPL', 'steps': 3})
+    assert response.status_code == 200
+    assert len(response.json()['predictions']) == 3
+    assert main.model_registry.get().get('AAPL').features is main.FEATURES
+
+def test_company_cache_survives_app_restart(client):
+    client.get('/api/company/AAPL')
+    # Another app starting and stopping in the same process shares the component
+    with TestClient(main.app):
+        pass
+    main.company_info.get().refresh('AAPL').result(timeout=10)
+    assert client.get('/api/company/AAPL').json()['name'] == 'AAPL Inc.'
+
+def test_batch_prediction_caches_model_per_universe(client, source, monkeypatch):
+    fetch = source.fetch
+    # NEW has fewer bars than one input window
+    monkeypatch.setattr(source, 'fetch', lambda symbol, start, end: fetch(symbol, start, end).iloc[-5:] if symbol == 'NEW' else fetch(symbol, start, end))
+    body = {'symbols': ['AAPL', 'msft', 'NEW'], 'steps': 3}
+    first = client.post('/api/prediction/price/batch', json=body).json()
+    assert sorted(first['predictions']) == ['AAPL', 'MSFT'] and first['missing'] == ['NEW']
+    assert len(first['predictions']['MSFT']['predictions']) == 3
+
+    registry = main.batch_models.get()['per_symbol']
+    trained = registry.peek('AAPL,MSFT')
+    assert registry.symbols() == ['AAPL,MSFT'] and trained is not None
+    assert client.post('/api/prediction/price/batch', json=body).json() == first
+    assert registry.peek('AAPL,MSFT') is trained
+    assert client.post('/api/prediction/price/batch', json={**body, 'scaling': 'bogus'}).status_code == 422
+
+def test_company_info(client, source):
+    assert client.get('/api/company/AAPL').json()['sector'] == 'Technology'
+    assert client.get('/api/company/aapl').json()['name'] == 'AAPL Inc.'
+    assert source.requests.count(('AAPL', 'info')) == 1
+
+@pytest.mark.parametrize('media_type', [
+    'application/vnd.apache.arrow.stream',
+    'application/vnd.apache.parquet',
+    'application/vnd.quantbrain.columnar+json'
+])
+def test_financial_data_formats(client, media_type):
+    import io
+    import pandas as pd
+    from src.serving.formats import read_arrow_ipc
+
+    response = client.post('/api/data/financial', headers={'Accept': media_type}, json={
+        'symbol': 'AAPL', 'start_date': '2024-01-02', 'end_date': '2024-01-31'
+    })
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith(media_type)
+    if 'arrow' in media_type:
+        df = read_arrow_ipc(response.content)
+    elif 'parquet' in media_type:
+        df = pd.read_parquet(io.BytesIO(response.content)).set_index('Date')
+    else:
+        payload = response.json()
+        df = pd.DataFrame(payload['columns']).set_index('Date')
+        assert payload['length'] == 22
+    assert len(df) == 22
+    assert str(pd.Timestamp(df.index[0]).date()) == '2024-01-02'
+
+def test_unsupported_format_rejected(client):
+    response = client.post('/api/data/financial', headers={'Accept': 'text/csv'}, json={'symbol': 'AAPL'})
+    assert response.status_code == 406
+
+def test_negotiate_prefers_quality():
+    from src.serving.formats import negotiate, ARROW_STREAM, JSON_RECORDS, PARQUET
+    supported = [JSON_RECORDS, ARROW_STREAM, PARQUET]
+    assert negotiate(f'{PARQUET};q=0.5, {ARROW_STREAM}', supported, JSON_RECORDS) == ARROW_STREAM
+    assert negotiate('*/*', supported, JSON_RECORDS) == JSON_RECORDS
+    assert negotiate(None, supported, JSON_RECORDS) == JSON_RECORDS
+
+def test_sentiment_stream(client):
+    texts = ['prices drop', 'record revenue', 'shares drop']
+    response = client.post('/api/analysis/sentiment/stream', json={'texts': texts, 'batch_size': 2})
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e['event'] for e in events] == ['batch', 'batch', 'done']
+    assert [e['offset'] for e in events[:2]] == [0, 2]
+    assert events[1]['results'][0]['label'] == 'NEGATIVE'
+    assert events[-1]['count'] == 3
+    assert events[-1]['ttfb_ms'] <= events[-1]['elapsed_ms']
+
+def test_price_prediction_stream(client):
+    response = client.post(
+        '/api/prediction/price/stream',
+        json={'symbol': 'AAPL', 'steps': 3},
+        headers={'Accept': 'text/event-stream'}
+    )
+    names = [line[len('event: '):] for line in response.text.splitlines() if line.startswith('event: ')]
+    assert names == ['training', 'epoch', 'epoch', 'forecast', 'done']
+    assert main.model_registry.get().symbols() == ['AAPL']
+
+    cached = client.post('/api/prediction/price/stream', json={'symbol': 'AAPL', 'steps': 3})
+    events = [json.loads(line) for line in cached.text.splitlines()]
+    assert [e['event'] for e in events] == ['model', 'forecast', 'done']
+    assert len(events[1]['predictions']) == 3
+
+def test_price_prediction_stream_serves_stale_model(client):
+    client.post('/api/prediction/price', json={'symbol': 'AAPL', 'steps': 3})
+    registry = main.model_registry.get()
+    trained = registry.peek('AAPL')
+    registry.max_age = -1
+
+    response = client.post('/api/prediction/price/stream', json={'symbol': 'AAPL', 'steps': 3})
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e['event'] for e in events] == ['model', 'forecast', 'done']
+    # The stale model was served and replaced in the background
+    registry.refresh('AAPL').result(timeout=60)
+    assert registry.peek('AAPL', stale=True) is not trained
+
+def test_price_prediction_stream_unknown_symbol(client, source, monkeypatch):
+    monkeypatch.setattr(source, 'fetch', lambda symbol, start, end: pd.DataFrame())
+    response = client.post('/api/prediction/price/stream', json={'symbol': 'NOPE'})
+    assert response.status_code == 404
+
+def test_training_job(client):
+    response = client.post('/api/jobs/train', json={'symbol': 'MSFT', 'epochs': 2})
+    assert response.status_code == 202
+    job = response.json()
+    assert main.training_jobs.get().wait(job['id'], timeout=60)['status'] == 'succeeded'
+    assert client.get(f"/api/jobs/{job['id']}").json()['status'] == 'succeeded'
+    assert main.model_registry.get().peek('MSFT') is not None
+    assert client.delete('/api/jobs/unknown').status_code == 404
+
+def test_metrics_endpoint(client):
+    client.post('/api/prediction/price', json={'symbol': 'AAPL', 'steps': 3})
+    main.sentiment_analyzer.get().cache = SentimentCache()
+    client.post('/api/analysis/sentiment', json={'texts': ['prices drop']})
+    client.post('/api/analysis/sentiment', json={'texts': ['prices drop']})
+    body = client.get('/metrics').text
+    assert 'quantbrain_http_request_duration_seconds_count{method="POST",route="/api/prediction/price",status="200"}' in body
+    for name in ('data.fetch', 'predictor.train_epoch', 'predictor.forward', 'prediction.model', 'sentiment.forward'):
+        assert f'quantbrain_stage_seconds_count{{stage="{name}"}}' in body
+    assert 'quantbrain_model_lookups_total{result="miss"}' in body
+    assert 'quantbrain_executor_in_flight{executor="prediction"} 0' in body
+    for result, count in (('memory_hits', 1), ('disk_hits', 0), ('misses', 1)):
+        assert f'quantbrain_sentiment_cache_lookups{{result="{result}"}} {count}' in body
+
+def test_request_profiling(client, monkeypatch):
+    monkeypatch.setattr(main, 'PROFILING', True)
+    response = client.post(
+        '/api/prediction/price', json={'symbol': 'AAPL', 'steps': 3}, headers={'X-Profile': '1'}
+    )
+    assert 'Server-Timing' in response.headers
+    profile_url = f"/debug/profiles/{response.headers['X-Profile-Id']}"
+    assert client.get(profile_url).json()['samples'] > 0
+    assert 'train (price_predictor.py' in client.get(profile_url, params={'format': 'collapsed'}).text
+    assert 'X-Profile-Id' not in client.post('/api/analysis/sentiment', json={'texts': ['x']}).headers
+
+def test_concurrent_sentiment_requests_share_a_batch(client, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    monkeypatch.setattr(main.sentiment_batcher, 'max_wait', 0.2)
+    pipeline = main.sentiment_analyzer.get().model
+    texts = [f'shares drop {i}' for i in range(6)]
+    with ThreadPoolExecutor(6) as pool:
+        responses = list(pool.map(
+            lambda text: client.post('/api/analysis/sentiment', json={'texts': [text]}), texts
+        ))
+    assert [r.json()[0]['text'] for r in responses] == texts
+    assert len(pipeline.calls) < len(texts)
+    assert 'quantbrain_batch_queue_wait_seconds_count{batcher="sentiment"}' in client.get('/metrics').text
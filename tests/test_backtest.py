@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+from benchmarks.synthetic import synthetic_prices
+from src.backtest.metrics import forecast_metrics
+from src.backtest.walk_forward import FoldRunner, WalkForwardBacktest, walk_forward_cutoffs
+from src.models.price_predictor import PricePredictor
+
+def test_walk_forward_cutoffs():
+    assert walk_forward_cutoffs(100, 60, 5, 10) == [60, 70, 80, 90]
+    assert walk_forward_cutoffs(64, 60, 5, 10) == []
+
+def test_fold_windows_match_prepare_data():
+    series = synthetic_prices(160)
+    runner = FoldRunner({'A': series}, sequence_length=10)
+    predictor = PricePredictor(10)
+    X_expected, y_expected = predictor.prepare_data(series.iloc[30:120])
+    X, y = runner.fold_windows('A', 30, 120, predictor.scaler)
+    torch.testing.assert_close(X, X_expected)
+    torch.testing.assert_close(y, y_expected)
+
+def test_forecast_metrics():
+    predictions = pd.DataFrame({
+        'symbol': 'A',
+        'cutoff': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']),
+        'date': pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05']),
+        'step': 1,
+        'previous': [100.0, 100.0, 100.0, 100.0],
+        'actual': [110.0, 90.0, 100.0, 95.0],
+        'predicted': [105.0, 95.0, 101.0, 102.0]
+    })
+    metrics = forecast_metrics(predictions, by=('symbol',), cost=0.01).loc['A']
+    assert metrics['forecasts'] == 4
+    assert metrics['mae'] == pytest.approx((5 + 5 + 1 + 7) / 4)
+    assert metrics['rmse'] == pytest.approx(np.sqrt((25 + 25 + 1 + 49) / 4))
+    assert metrics['mape'] == pytest.approx((5 / 110 + 5 / 90 + 1 / 100 + 7 / 95) / 4 * 100)
+    assert metrics['directional_accuracy'] == pytest.approx(0.5)
+    # Long +10%, short +10%, long 0%, long -5%, each minus 1% cost
+    assert metrics['total_return'] == pytest.approx(0.09 + 0.09 - 0.01 - 0.06)
+    assert metrics['hit_rate'] == pytest.approx(0.5)
+    assert metrics['max_drawdown'] == pytest.approx(0.07)
+    assert forecast_metrics(predictions, by=()).index.tolist() == ['all']
+
+def test_walk_forward_backtest_with_updates():
+    prices = {'A': synthetic_prices(160, seed=0), 'B': synthetic_prices(150, seed=1)}
+    backtest = WalkForwardBacktest(
+        horizon=3, min_train=100, step=10, max_updates=1,
+        train_kwargs={'epochs': 1}, update_kwargs={'epochs': 1}, workers=0
+    )
+    assert backtest.tasks(prices) == [('A', [100, 110]), ('A', [120, 130]), ('A', [140, 150]),
+                                      ('B', [100, 110]), ('B', [120, 130]), ('B', [140])]
+    result = backtest.run(prices)
+
+    assert len(result.predictions) == 11 * 3
+    assert (result.predictions['date'] > result.predictions['cutoff']).all()
+    assert result.folds['refit'].tolist()[:3] == ['train', 'update', 'train']
+    first = result.predictions.iloc[0]
+    assert first['previous'] == prices['A'].iloc[99] and first['actual'] == prices['A'].iloc[100]
+
+    summary = result.summary()
+    assert summary.index.tolist() == [1, 2, 3]
+    assert summary['forecasts'].tolist() == [11, 11, 11]
+
+def test_process_pool_matches_in_process():
+    prices = {'A': synthetic_prices(160)}
+    kwargs = dict(horizon=2, min_train=120, step=15, train_kwargs={'epochs': 1}, threads_per_worker=1)
+    local = WalkForwardBacktest(workers=0, **kwargs).run(prices)
+    pooled = WalkForwardBacktest(workers=1, **kwargs).run(prices)
+    pd.testing.assert_frame_equal(local.predictions, pooled.predictions, rtol=1e-4)
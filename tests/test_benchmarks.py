@@ -0,0 +1,35 @@
+from benchmarks.cases import summarize
+from benchmarks.run import compare, median_metrics, runner_mismatch
+
+BASELINE = {'predict': {'p50_ms': 10.0, 'p99_ms': 20.0, 'throughput': 100.0, 'peak_rss_mb': 500.0}}
+
+def test_compare_flags_slower_and_lower_throughput():
+    results = {'predict': {'p50_ms': 14.0, 'p99_ms': 25.0, 'throughput': 70.0, 'peak_rss_mb': 510.0}}
+    regressions = compare(results, BASELINE, tolerance=0.25)
+    assert [r.split(':')[0] for r in regressions] == ['predict p50_ms', 'predict throughput']
+
+def test_compare_ignores_improvements_and_new_cases():
+    results = {
+        'predict': {'p50_ms': 5.0, 'p99_ms': 45.0, 'throughput': 300.0, 'peak_rss_mb': 400.0},
+        'new_case': {'p50_ms': 1.0, 'p99_ms': 1.0, 'throughput': 1.0, 'peak_rss_mb': 1.0}
+    }
+    # p99 gets twice the tolerance, so +125% is still flagged but nothing else is
+    assert compare(results, BASELINE, tolerance=0.25) == [
+        'predict p99_ms: 45.00 vs baseline 20.00 (+125%)'
+    ]
+
+def test_summarize_uses_wall_time_for_concurrent_calls():
+    summary = summarize([0.1] * 10, wall_time=0.25)
+    assert summary['p50_ms'] == 100.0
+    assert summary['throughput'] == 40.0
+
+def test_runner_mismatch_lists_differences():
+    runner = {'cpu': 'Xeon', 'cpu_count': '8', 'torch': '2.2.0'}
+    assert runner_mismatch(runner, dict(runner)) == []
+    assert runner_mismatch({'cpu': 'Xeon', 'cpu_count': '4'}, runner) == [
+        "cpu_count: '4' vs '8'", "torch: None vs '2.2.0'"
+    ]
+
+def test_median_metrics_of_repeated_runs():
+    runs = [{'p50_ms': 10.0, 'throughput': 90.0}, {'p50_ms': 30.0, 'throughput': 100.0}, {'p50_ms': 12.0, 'throughput': 40.0}]
+    assert median_metrics(runs) == {'p50_ms': 12.0, 'throughput': 90.0}
@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import pytest
+from src.data.company_cache import CompanyInfoCache
+
+class FakeInfo:
+    """Upstream company info that counts calls and can be slowed or broken."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.market_cap = 1e12
+        self.fail = False
+        self.gate = None
+
+    def __call__(self, symbol):
+        self.calls.append(symbol)
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        if symbol == 'NOPE':
+            return {}
+        return {'name': f'{symbol} Inc.', 'sector': 'Technology', 'market_cap': self.market_cap, 'pe_ratio': None}
+
+def make_cache(fetch, market_cap_ttl=timedelta(minutes=5), **kwargs):
+    ttls = {'name': timedelta(days=7), 'sector': timedelta(days=7), 'market_cap': market_cap_ttl}
+    return CompanyInfoCache(fetch, field_ttls=ttls, **kwargs)
+
+def test_fresh_entries_are_served_from_memory():
+    fetch = FakeInfo()
+    cache = make_cache(fetch)
+    assert cache.get('aapl')['name'] == 'AAPL Inc.'
+    assert cache.get('AAPL')['market_cap'] == 1e12
+    assert fetch.calls == ['AAPL']
+    assert cache.get('AAPL')['pe_ratio'] is None
+
+def test_stale_fields_are_served_while_refreshing():
+    fetch = FakeInfo()
+    cache = make_cache(fetch, market_cap_ttl=timedelta(0))
+    cache.get('AAPL')
+
+    # Only descriptive fields requested: nothing is stale
+    cache.get('AAPL', fields=('name', 'sector'))
+    assert fetch.calls == ['AAPL']
+
+    fetch.gate, fetch.market_cap = threading.Event(), 2e12
+    started = time.perf_counter()
+    assert cache.get('AAPL')['market_cap'] == 1e12
+    assert time.perf_counter() - started < 0.5
+    refresh = cache.refresh('AAPL')
+    assert cache.refresh('AAPL') is refresh  # one refresh at a time
+    fetch.gate.set()
+    assert refresh.result()['market_cap'] == 2e12
+    assert cache.peek('AAPL')['market_cap'] == 2e12
+    assert fetch.calls == ['AAPL', 'AAPL']
+
+def test_concurrent_misses_share_one_fetch():
+    fetch = FakeInfo(delay=0.2)
+    cache = make_cache(fetch)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(cache.get, ['MSFT'] * 8))
+    assert all(result['name'] == 'MSFT Inc.' for result in results)
+    assert fetch.calls == ['MSFT']
+
+def test_unknown_symbols_are_remembered():
+    fetch = FakeInfo()
+    cache = make_cache(fetch)
+    assert cache.get('NOPE') == {} and cache.get('NOPE') == {}
+    assert fetch.calls == ['NOPE']
+
+def test_expired_entry_survives_upstream_failure():
+    fetch = FakeInfo()
+    cache = make_cache(fetch, max_stale=timedelta(0))
+    cache.get('AAPL')
+    fetch.fail = True
+    assert cache.get('AAPL')['name'] == 'AAPL Inc.'
+    with pytest.raises(RuntimeError):
+        cache.get('MSFT')
+
+def test_prewarm_and_snapshot_survive_restart(tmp_path):
+    path = str(tmp_path / 'snapshot' / 'company_info.json')
+    fetch = FakeInfo()
+    cache = make_cache(fetch, snapshot_path=path)
+    futures = cache.prewarm(['AAPL', ' msft', 'AAPL', ''], wait=True)
+    assert len(futures) == 2 and sorted(fetch.calls) == ['AAPL', 'MSFT']
+    assert cache.prewarm(['AAPL']) == []  # already fresh
+    cache.close()
+
+    broken = FakeInfo()
+    broken.fail = True
+    restored = make_cache(broken, snapshot_path=path)
+    assert restored.get('MSFT')['name'] == 'MSFT Inc.'
+    assert broken.calls == []
+
+def test_concurrent_saves_leave_a_valid_snapshot(tmp_path):
+    import json
+    path = tmp_path / 'company_info.json'
+    cache = make_cache(FakeInfo(), snapshot_path=str(path))
+    symbols = [f'S{i}' for i in range(16)]
+
+    def refresh_and_save(symbol):
+        cache.get(symbol)
+        cache.save()
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(refresh_and_save, symbols))
+    cache.save()
+    assert sorted(json.loads(path.read_text())) == sorted(symbols)
+    assert [p.name for p in tmp_path.iterdir()] == ['company_info.json']
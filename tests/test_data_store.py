@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import pandas as pd
+import pytest
+from src.data.financial import FinancialData
+from src.data.store import OHLCVStore
+from fakes import FakeSource
+
+@pytest.fixture
+def financial_data(source, tmp_path):
+    return FinancialData(source=source, store=OHLCVStore(str(tmp_path)))
+
+def test_repeated_request_served_from_store(financial_data, source):
+    first = financial_data.get_stock_data('AAPL', '2023-03-01', '2023-03-31')
+    second = financial_data.get_stock_data('AAPL', '2023-03-01', '2023-03-31')
+    assert len(source.requests) == 1
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+    assert first.index[0] == pd.Timestamp('2023-03-01')
+    assert first.index[-1] == pd.Timestamp('2023-03-31')
+
+def test_only_missing_ranges_fetched(financial_data, source):
+    financial_data.get_stock_data('AAPL', '2023-03-01', '2023-03-31')
+    data = financial_data.get_stock_data('AAPL', '2023-02-01', '2023-04-30')
+    assert [(start.date().isoformat(), end.date().isoformat()) for _, start, end in source.requests[1:]] == [
+        ('2023-02-01', '2023-03-01'),
+        ('2023-04-01', '2023-05-01')
+    ]
+    assert data.index.is_monotonic_increasing
+    assert len(data) == len(pd.bdate_range('2023-02-01', '2023-04-30'))
+
+def test_read_spans_year_partitions(financial_data, tmp_path):
+    financial_data.get_stock_data('MSFT', '2022-12-15', '2023-01-15')
+    store = OHLCVStore(str(tmp_path))
+    assert sorted(p.name for p in (tmp_path / 'MSFT').glob('*.parquet')) == ['2022.parquet', '2023.parquet']
+    january = store.read('MSFT', pd.Timestamp('2023-01-01'), pd.Timestamp('2023-02-01'))
+    assert january.index.min() >= pd.Timestamp('2023-01-01')
+    assert list(january.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def test_without_store_goes_upstream(source):
+    financial_data = FinancialData(source=source)
+    financial_data.get_stock_data('AAPL', period='1mo')
+    financial_data.get_stock_data('AAPL', period='1mo')
+    assert len(source.requests) == 2
+
+def test_open_range_reused_within_ttl(financial_data, source):
+    for _ in range(3):
+        financial_data.get_stock_data('AAPL', period='1mo')
+    assert len(source.requests) == 1
+
+def test_open_range_refetched_after_ttl(source, tmp_path):
+    financial_data = FinancialData(source=source, store=OHLCVStore(str(tmp_path)), open_range_ttl=timedelta(0))
+    financial_data.get_stock_data('AAPL', period='1mo')
+    financial_data.get_stock_data('AAPL', period='1mo')
+    today = pd.Timestamp.now().normalize()
+    assert len(source.requests) == 2
+    assert source.requests[1][1:] == (today, today + timedelta(days=1))
+
+def test_concurrent_requests_coalesced(tmp_path):
+    source = FakeSource(delay=0.1)
+    financial_data = FinancialData(source=source, store=OHLCVStore(str(tmp_path)))
+    with ThreadPoolExecutor(10) as pool:
+        results = list(pool.map(
+            lambda _: financial_data.get_stock_data('AAPL', '2023-03-01', '2023-03-31'),
+            range(10)
+        ))
+    assert len(source.requests) == 1
+    assert all(len(result) == len(results[0]) for result in results)
+
+def test_bulk_fetch_is_columnar(financial_data, source):
+    bulk = financial_data.get_bulk_stock_data(['AAPL', 'MSFT', ' aapl'], '2023-03-01', '2023-03-10')
+    assert list(bulk.columns) == ['Symbol', 'Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+    assert sorted(bulk['Symbol'].unique()) == ['AAPL', 'MSFT']
+    assert len(source.requests) == 2
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+from fakes import synthetic_bars
+from src.models.features import FeaturePipeline
+from src.models.price_predictor import PricePredictor
+
+def reference_row(bars, pipeline, i):
+    # Per-row definitions the vectorized kernels must agree with
+    close, volume = bars['Close'].values, bars['Volume'].values
+    returns = np.diff(np.log(close))
+    row = {
+        'log_return': returns[i - 1],
+        'volatility': np.std(returns[i - pipeline.volatility_window:i], ddof=1),
+    }
+    for window in pipeline.ma_windows:
+        row[f'ma_ratio_{window}'] = close[i] / close[i - window + 1:i + 1].mean() - 1
+    changes = np.diff(close)[i - pipeline.rsi_window:i]
+    gain, loss = changes.clip(min=0).mean(), (-changes).clip(min=0).mean()
+    row['rsi'] = 100 - 100 / (1 + gain / loss)
+    recent = volume[i - pipeline.volume_window + 1:i + 1]
+    row['volume_z'] = (volume[i] - recent.mean()) / recent.std(ddof=1)
+    return row
+
+def test_transform_matches_reference():
+    bars = synthetic_bars()
+    pipeline = FeaturePipeline()
+    frame = pipeline.transform(bars)
+    assert list(frame.columns) == pipeline.columns
+    assert frame.iloc[:pipeline.lookback].isna().any(axis=1).all()
+    assert not frame.iloc[pipeline.lookback:].isna().any().any()
+    for i in (pipeline.lookback, 150, len(bars) - 1):
+        expected = reference_row(bars, pipeline, i)
+        for name, value in expected.items():
+            assert frame[name].iloc[i] == pytest.approx(value, rel=1e-9), name
+
+def test_flat_prices_are_neutral():
+    bars = synthetic_bars(n=80)
+    bars['Close'], bars['Volume'] = 50.0, 1000.0
+    frame = FeaturePipeline().transform(bars).dropna()
+    assert len(frame) == 80 - FeaturePipeline().lookback
+    assert (frame['rsi'] == 50).all() and (frame['volume_z'] == 0).all()
+
+def test_update_computes_only_new_bars(monkeypatch):
+    bars = synthetic_bars()
+    pipeline = FeaturePipeline()
+    pipeline.update('aapl', bars[:250])
+
+    lengths = []
+    transform = pipeline.transform
+    monkeypatch.setattr(pipeline, 'transform', lambda b: lengths.append(len(b)) or transform(b))
+    frame = pipeline.update('AAPL', bars)
+    assert lengths == [pipeline.lookback + 1 + 50]
+    assert frame.equals(transform(bars))  # windows are views, so no drift from the shorter input
+
+    assert pipeline.update('AAPL', bars) is frame
+    assert len(lengths) == 1
+
+def test_update_recomputes_revised_history():
+    bars = synthetic_bars()
+    pipeline = FeaturePipeline()
+    pipeline.update('AAPL', bars[:250])
+    revised = bars.copy()
+    revised.iloc[100, 0] *= 1.1
+    pd.testing.assert_frame_equal(pipeline.update('AAPL', revised), pipeline.transform(revised))
+
+def test_predictor_with_features_round_trip(tmp_path):
+    bars = synthetic_bars()
+    pipeline = FeaturePipeline()
+    predictor = PricePredictor(features=pipeline)
+    predictor.train(bars, epochs=2)
+    assert predictor.model.lstm.input_size == 1 + len(pipeline.feature_names)
+    # Raw bars are replayed, so update() can recompute features of new bars
+    np.testing.assert_array_equal(predictor.replay, bars[['Close', 'Volume']].values[-len(predictor.replay):])
+
+    # Precomputed (cached) features and raw bars give the same forecast
+    predictions = predictor.predict(bars, steps=3)
+    assert len(predictions) == 3 and predictions.notna().all()
+    pd.testing.assert_series_equal(predictor.predict(pipeline.update('X', bars), steps=3), predictions)
+
+    predictor.save(tmp_path / 'model.pt')
+    restored = PricePredictor.load(tmp_path / 'model.pt')
+    assert restored.features.config() == pipeline.config()
+    pd.testing.assert_series_equal(restored.predict(bars, steps=3), predictions)
+
+def test_predictor_with_features_updates_on_new_bars(tmp_path):
+    bars = synthetic_bars(360)
+    pipeline = FeaturePipeline()
+    predictor = PricePredictor(features=pipeline)
+    predictor.train(bars[:300], epochs=1)
+    scaled_max = predictor.feature_scaler.data_max_.copy()
+
+    # The full history may be passed; only bars after the last seen date are new
+    assert len(predictor.update(pipeline.update('X', bars), epochs=2)) == 2
+    assert predictor.updates == 1 and predictor.last_index == bars.index[-1]
+    assert (predictor.feature_scaler.data_max_ >= scaled_max).all()
+    assert predictor.update(bars) == []
+
+    predictor.save(tmp_path / 'model.pt')
+    restored = PricePredictor.load(tmp_path / 'model.pt')
+    np.testing.assert_array_equal(restored.replay, predictor.replay)
+    restored.update(synthetic_bars(365)[-5:].set_axis(pd.bdate_range(bars.index[-1], periods=6, name='Date')[1:]), epochs=1)
+    assert restored.updates == 2
+
+@pytest.mark.parametrize('quantize', [False, True])
+def test_predictor_with_features_export_round_trip(tmp_path, quantize):
+    from src.models.export import compare_backends, export_predictor, load_exported
+    bars = synthetic_bars()
+    predictor = PricePredictor(features=FeaturePipeline())
+    predictor.train(bars, epochs=2)
+    exported = load_exported(export_predictor(predictor, str(tmp_path / 'model.pt'), quantize=quantize))
+    np.testing.assert_allclose(
+        exported.predict(bars, steps=3).values,
+        predictor.predict(bars, steps=3).values,
+        atol=0.5 if quantize else 1e-4
+    )
+    if not quantize:
+        report = compare_backends(predictor, bars, steps=2, repeats=2, variants=[{'format': 'torchscript'}])
+        assert report['max_abs_error'].max() < 1e-3
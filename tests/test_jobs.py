@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from src.models.registry import ModelRegistry
+from src.serving.jobs import CANCELLED, PENDING, RUNNING, SUCCEEDED, TrainingJobQueue
+
+@pytest.fixture
+def registry(source, tmp_path):
+    def loader(symbol):
+        return source.fetch(symbol, pd.Timestamp('2023-01-02'), pd.Timestamp('2023-06-30'))['Close']
+    registry = ModelRegistry(loader, cache_dir=str(tmp_path / 'models'), train_kwargs={'epochs': 2})
+    yield registry
+    registry.shutdown()
+
+def test_job_trains_and_publishes(registry, tmp_path):
+    jobs = TrainingJobQueue(registry, db_path=str(tmp_path / 'jobs.sqlite'))
+    job = jobs.submit('aapl', {'epochs': 3})
+    finished = jobs.wait(job['id'], timeout=60)
+    jobs.shutdown()
+
+    assert finished['status'] == SUCCEEDED
+    assert finished['progress']['epoch'] == 3
+    assert registry.peek('AAPL') is not None
+
+def test_identical_pending_jobs_are_deduplicated(registry):
+    jobs = TrainingJobQueue(registry, workers=0)
+    first = jobs.submit('AAPL', {'epochs': 3})
+    assert jobs.submit('aapl', {'epochs': 3})['id'] == first['id']
+    assert jobs.submit('AAPL', {'epochs': 5})['id'] != first['id']
+    assert jobs.stats() == {PENDING: 2}
+
+def test_cancel_pending_job(registry):
+    jobs = TrainingJobQueue(registry, workers=0)
+    job = jobs.submit('AAPL')
+    assert jobs.cancel(job['id'])['status'] == CANCELLED
+    assert jobs.cancel('missing') is None
+    # A cancelled job no longer blocks a new submission
+    assert jobs.submit('AAPL')['id'] != job['id']
+
+def test_cancel_running_job(registry):
+    jobs = TrainingJobQueue(registry)
+    job = jobs.submit('AAPL', {'epochs': 500})
+    while (jobs.get(job['id'])['progress'] or {}).get('epoch', 0) < 1:
+        jobs.wait(job['id'], timeout=0.05)
+    jobs.cancel(job['id'])
+    assert jobs.wait(job['id'], timeout=60)['status'] == CANCELLED
+    jobs.shutdown()
+    assert registry.peek('AAPL') is None
+
+def test_interrupted_jobs_resume_after_restart(registry, tmp_path):
+    db_path = str(tmp_path / 'jobs.sqlite')
+    jobs = TrainingJobQueue(registry, db_path=db_path, workers=0)
+    job = jobs.submit('AAPL')
+    with jobs._lock:
+        jobs._set_status(job['id'], 'running')
+
+    restarted = TrainingJobQueue(registry, db_path=db_path, workers=1)
+    assert restarted.wait(job['id'], timeout=60)['status'] == SUCCEEDED
+    restarted.shutdown()
+
+def test_processes_sharing_a_database_claim_each_job_once(registry, tmp_path):
+    db_path = str(tmp_path / 'jobs.sqlite')
+    first = TrainingJobQueue(registry, db_path=db_path, workers=0)
+    job = first.submit('AAPL')
+    with first._lock:
+        assert first._claim()['owner'] == first.owner
+
+    # A second worker process neither requeues nor claims the live job
+    second = TrainingJobQueue(registry, db_path=db_path, workers=0)
+    assert second.get(job['id'])['status'] == RUNNING
+    with second._lock:
+        assert second._claim() is None
+
+    # Once the owner's lease lapses, the job is queued again
+    with first._lock:
+        first._db.execute("UPDATE jobs SET lease_expires = 0 WHERE id = ?", (job['id'],))
+        first._db.commit()
+    with second._lock:
+        assert second._claim()['owner'] == second.owner
+
+def test_cancel_reaches_job_running_in_another_process(registry, tmp_path):
+    db_path = str(tmp_path / 'jobs.sqlite')
+    runner = TrainingJobQueue(registry, db_path=db_path)
+    job = runner.submit('AAPL', {'epochs': 500})
+    while (runner.get(job['id'])['progress'] or {}).get('epoch', 0) < 1:
+        runner.wait(job['id'], timeout=0.05)
+    TrainingJobQueue(registry, db_path=db_path, workers=0).cancel(job['id'])
+    assert runner.wait(job['id'], timeout=60)['status'] == CANCELLED
+    runner.shutdown()
@@ -0,0 +1,51 @@
+import threading
+import time
+import pytest
+from src.serving.metrics import MetricsRegistry
+from src.serving.profiler import SamplingProfiler
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('latency_seconds', 'Latency', labels=('route',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value, route='/a')
+    lines = registry.render().splitlines()
+    assert lines[:2] == ['# HELP latency_seconds Latency', '# TYPE latency_seconds histogram']
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1.0"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 6.05',
+        'latency_seconds_count{route="/a"} 4',
+    ]
+
+def test_counter_gauge_and_label_checks():
+    registry = MetricsRegistry()
+    counter = registry.counter('lookups_total', 'Lookups', labels=('result',))
+    counter.inc(result='hit')
+    counter.inc(2, result='hit')
+    assert counter.value(result='hit') == 3
+    assert registry.counter('lookups_total', 'Lookups', labels=('result',)) is counter
+    with pytest.raises(ValueError):
+        counter.inc(kind='hit')
+    with pytest.raises(ValueError):
+        registry.histogram('lookups_total', 'Lookups', labels=('result',))
+
+    registry.gauge('ratio', 'Ratio', lambda: {('a"b',): 0.5}, labels=('name',))
+    assert 'ratio{name="a\\"b"} 0.5' in registry.render()
+
+def test_sampling_profiler_sees_busy_thread():
+    def busy_loop(stop):
+        while not stop.is_set():
+            sum(range(1000))
+
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,))
+    worker.start()
+    with SamplingProfiler(interval=0.001) as profiler:
+        time.sleep(0.1)
+    stop.set()
+    worker.join()
+    # The main thread's deep pytest stack ties with busy_loop, so look past the default top 20
+    assert any(frame.startswith('busy_loop ') for frame in profiler.top(limit=1000))
+    assert 'busy_loop' in profiler.collapsed()
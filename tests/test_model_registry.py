@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from datetime import timedelta
+from benchmarks.synthetic import synthetic_prices
+from fakes import synthetic_bars
+from src.models.features import FeaturePipeline
+from src.models.price_predictor import PricePredictor
+from src.models.registry import ModelRegistry
+
+TRAIN_KWARGS = {'epochs': 2}
+
+@pytest.fixture
+def calls():
+    return []
+
+@pytest.fixture
+def loader(calls):
+    def load(symbol):
+        calls.append(symbol)
+        return synthetic_prices(60)
+    return load
+
+def test_trains_once_then_serves_from_memory(loader, calls):
+    registry = ModelRegistry(loader, train_kwargs=TRAIN_KWARGS)
+    first = registry.get('AAPL')
+    second = registry.get('aapl')
+    assert first is second
+    assert calls == ['AAPL']
+    assert len(first.predict(synthetic_prices(60), steps=3)) == 3
+
+def test_lru_eviction(loader):
+    registry = ModelRegistry(loader, capacity=2, train_kwargs=TRAIN_KWARGS)
+    for symbol in ['AAPL', 'MSFT', 'AAPL', 'GOOG']:
+        registry.get(symbol)
+    assert registry.symbols() == ['AAPL', 'GOOG']
+
+def test_persistence_round_trip(loader, calls, tmp_path):
+    data = synthetic_prices(60)
+    registry = ModelRegistry(loader, cache_dir=str(tmp_path), train_kwargs=TRAIN_KWARGS)
+    expected = registry.get('AAPL').predict(data, steps=3)
+
+    restored = ModelRegistry(loader, cache_dir=str(tmp_path), train_kwargs=TRAIN_KWARGS)
+    predictions = restored.get('AAPL').predict(data, steps=3)
+    assert calls == ['AAPL']
+    np.testing.assert_allclose(predictions.values, expected.values, rtol=1e-6)
+
+def test_saved_model_with_other_features_is_retrained(loader, calls, tmp_path):
+    bars = synthetic_bars(200)
+    with_features = lambda: PricePredictor(features=FeaturePipeline())
+    plain = ModelRegistry(loader, cache_dir=str(tmp_path), train_kwargs=TRAIN_KWARGS)
+    featured = ModelRegistry(lambda symbol: bars, cache_dir=str(tmp_path), train_kwargs=TRAIN_KWARGS,
+                             factory=with_features)
+
+    plain.get('AAPL')
+    assert featured.peek('AAPL') is None
+    assert featured.get('AAPL').features is not None
+
+    assert ModelRegistry(loader, cache_dir=str(tmp_path)).peek('AAPL') is None
+    assert plain.train('AAPL').features is None
+    assert ModelRegistry(lambda symbol: bars, cache_dir=str(tmp_path), factory=with_features).peek('AAPL') is None
+
+def test_stale_model_refreshed_in_background(loader, calls):
+    registry = ModelRegistry(loader, max_age=timedelta(seconds=0), train_kwargs=TRAIN_KWARGS)
+    stale = registry.get('AAPL')
+    served = registry.get('AAPL')
+    assert served is stale
+    fresh = registry.refresh('AAPL').result(timeout=30)
+    assert fresh is not stale
+    assert calls.count('AAPL') >= 2
+    registry.shutdown()
+
+def test_refresh_fine_tunes_until_max_updates():
+    series = synthetic_prices(80)
+    history = {'n': 60}
+    registry = ModelRegistry(
+        lambda symbol: series[:history['n']],
+        train_kwargs=TRAIN_KWARGS,
+        max_updates=1
+    )
+    registry.get('AAPL')
+    history['n'] = 70
+    updated = registry.refresh('AAPL').result(timeout=30)
+    assert updated.updates == 1
+    assert updated.last_index == series.index[69]
+
+    history['n'] = 80
+    retrained = registry.refresh('AAPL').result(timeout=30)
+    assert retrained.updates == 0
+    registry.shutdown()
@@ -0,0 +1,231 @@
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+from sklearn.preprocessing import MinMaxScaler
+from benchmarks.synthetic import synthetic_prices
+from src.models.price_predictor import PricePredictor
+from src.models.windowing import window_loader
+
+def reference_windows(data, sequence_length):
+    # The original list-based implementation of prepare_data
+    scaled_data = MinMaxScaler().fit_transform(data.values.reshape(-1, 1))
+    X, y = [], []
+    for i in range(len(scaled_data) - sequence_length):
+        X.append(scaled_data[i:(i + sequence_length)])
+        y.append(scaled_data[i + sequence_length])
+    return torch.FloatTensor(np.array(X)), torch.FloatTensor(np.array(y))
+
+@pytest.mark.parametrize('sequence_length', [1, 10, 30])
+def test_prepare_data_matches_reference(sequence_length):
+    data = synthetic_prices(200)
+    X, y = PricePredictor(sequence_length).prepare_data(data)
+    expected_X, expected_y = reference_windows(data, sequence_length)
+    assert torch.equal(X, expected_X)
+    assert torch.equal(y, expected_y)
+
+def test_prepare_data_short_series():
+    X, y = PricePredictor(10).prepare_data(synthetic_prices(5))
+    assert X.shape == (0, 10, 1)
+    assert y.shape == (0, 1)
+
+def test_streaming_loader_matches_in_memory_windows(tmp_path):
+    data = synthetic_prices(200)
+    path = tmp_path / 'series.npy'
+    np.save(path, data.values)
+    mapped = np.load(path, mmap_mode='r')
+
+    predictor = PricePredictor(10)
+    loader = predictor.prepare_loader(mapped, batch_size=16)
+    X = torch.cat([batch_X for batch_X, _ in loader])
+    y = torch.cat([batch_y for _, batch_y in loader])
+    expected_X, expected_y = reference_windows(data, 10)
+    torch.testing.assert_close(X, expected_X)
+    torch.testing.assert_close(y, expected_y)
+
+def test_window_loader_shuffle_covers_all_windows():
+    values = np.arange(50, dtype=np.float32)
+    loader = window_loader(values, 5, batch_size=8, shuffle=True)
+    targets = torch.cat([batch_y for _, batch_y in loader]).flatten()
+    assert sorted(targets.tolist()) == list(range(5, 50))
+
+def test_streaming_training():
+    predictor = PricePredictor()
+    losses = predictor.train(synthetic_prices(200), epochs=2, streaming=True)
+    assert len(losses) == 2
+    assert len(predictor.predict(synthetic_prices(200), steps=3)) == 3
+
+def test_validation_and_early_stopping():
+    predictor = PricePredictor()
+    losses = predictor.train(
+        synthetic_prices(200), epochs=200, validation_split=0.2, patience=3, min_delta=1.0
+    )
+    # A min_delta no loss can reach stops right after the patience window
+    assert len(losses) == 4
+    assert predictor.history['best_epoch'] == 0
+    assert all(v is not None for v in predictor.history['val_loss'])
+    assert len(predictor.history['epoch_time']) == 4
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_gradient_accumulation_matches_larger_batch(streaming):
+    data = synthetic_prices(74)  # 64 windows, so every batch is full
+    torch.manual_seed(0)
+    large = PricePredictor()
+    small = PricePredictor()
+    small.model.load_state_dict(large.model.state_dict())
+    # Dropout is the only source of randomness left once shuffling is off
+    large.model.lstm.dropout = small.model.lstm.dropout = 0.0
+
+    large.train(data, epochs=1, batch_size=16, shuffle=False, streaming=streaming)
+    small.train(data, epochs=1, batch_size=8, shuffle=False, streaming=streaming, accumulation_steps=2)
+    for a, b in zip(large.model.parameters(), small.model.parameters()):
+        torch.testing.assert_close(a, b, rtol=1e-4, atol=1e-5)
+
+def test_update_fine_tunes_on_new_bars_only():
+    data = synthetic_prices(220)
+    predictor = PricePredictor(replay_size=50)
+    predictor.train(data[:200], epochs=2)
+    assert predictor.last_index == data.index[199]
+    assert len(predictor.replay) == 60
+    weights = [p.detach().clone() for p in predictor.model.parameters()]
+
+    # Passing the full history only uses the bars after the last seen date
+    losses = predictor.update(data, epochs=3)
+    assert len(losses) == 3
+    assert predictor.last_index == data.index[-1]
+    np.testing.assert_array_equal(predictor.replay, data.values[-60:])
+    assert any(not torch.equal(a, b) for a, b in zip(weights, predictor.model.parameters()))
+    assert predictor.update(data) == []
+
+def test_update_scaler_policies():
+    data = synthetic_prices(120)
+    spike = pd.Series([data.max() + 50.0], index=[data.index[-1] + pd.Timedelta(days=1)])
+    for policy, expected_max in [('fixed', data[:100].max()), ('expand', spike.iloc[0])]:
+        predictor = PricePredictor()
+        predictor.train(data[:100], epochs=1)
+        predictor.update(pd.concat([data[100:], spike]), epochs=1, scaler_policy=policy)
+        assert predictor.scaler.data_max_[0] == pytest.approx(expected_max)
+        # Earlier values keep their scaled position under either policy
+        assert predictor.scaler.data_min_[0] == pytest.approx(data[:100].min())
+
+def test_update_state_round_trip(tmp_path):
+    data = synthetic_prices(200)
+    predictor = PricePredictor()
+    predictor.train(data[:150], epochs=1)
+    predictor.update(data, epochs=1)
+    predictor.save(tmp_path / 'model.pt')
+    restored = PricePredictor.load(tmp_path / 'model.pt')
+    np.testing.assert_array_equal(restored.replay, predictor.replay)
+    assert restored.last_index == predictor.last_index
+    assert restored.updates == 1
+    restored.update(data, epochs=1)  # nothing new, but the buffer is usable
+
+def test_multi_series_batch_prediction():
+    from src.models.multi_series import MultiSeriesPredictor
+    data = {
+        'AAPL': synthetic_prices(200, seed=1),
+        'MSFT': synthetic_prices(200, seed=2) * 3,
+        'GOOG': synthetic_prices(200, seed=3) + 50
+    }
+    predictor = MultiSeriesPredictor(scaling='per_symbol')
+    X, _ = predictor.prepare_data(data)
+    assert len(X) == sum(len(series) - 10 for series in data.values())
+
+    predictor.train(data, epochs=2)
+    predictions = predictor.predict(data, steps=4)
+    assert set(predictions) == set(data)
+    assert all(len(series) == 4 for series in predictions.values())
+
+    # Batched inference matches one symbol at a time
+    single = predictor.predict({'MSFT': data['MSFT']}, steps=4)
+    np.testing.assert_allclose(single['MSFT'].values, predictions['MSFT'].values, rtol=1e-5)
+
+    # Unseen symbols are scaled for the call only
+    predictor.predict({'NFLX': synthetic_prices(200, seed=4)}, steps=2)
+    assert sorted(predictor.scalers) == ['AAPL', 'GOOG', 'MSFT']
+
+def test_multi_series_validation_holds_out_recent_windows():
+    from src.models.multi_series import MultiSeriesPredictor
+    data = {'AAPL': synthetic_prices(60, seed=1), 'MSFT': synthetic_prices(110, seed=2)}
+    predictor = MultiSeriesPredictor()
+    _, val_batches, n_train, n_val = predictor._training_loaders(data, 32, False, 0.1, False)
+    assert (n_train, n_val) == (45 + 90, 5 + 10)
+    val_y = torch.cat([y for _, y in val_batches]).flatten()
+    expected = np.concatenate([
+        predictor.scalers[symbol].transform(series.values[-n:].reshape(-1, 1)).flatten()
+        for symbol, series, n in [('AAPL', data['AAPL'], 5), ('MSFT', data['MSFT'], 10)]
+    ])
+    np.testing.assert_allclose(val_y.numpy(), expected, rtol=1e-6)
+
+def test_multi_series_state_round_trip(tmp_path):
+    from src.models.multi_series import MultiSeriesPredictor
+    data = {'AAPL': synthetic_prices(200, seed=1), 'MSFT': synthetic_prices(200, seed=2) * 3}
+    predictor = MultiSeriesPredictor(scaling='shared')
+    predictor.train(data, epochs=1)
+    predictor.save(tmp_path / 'multi.pt')
+    restored = MultiSeriesPredictor.load(tmp_path / 'multi.pt')
+    assert restored.scaling == 'shared'
+    np.testing.assert_allclose(
+        restored.predict(data, steps=2)['AAPL'].values,
+        predictor.predict(data, steps=2)['AAPL'].values,
+        rtol=1e-6
+    )
+
+def test_multi_series_rejects_unsupported_modes():
+    from src.models.multi_series import MultiSeriesPredictor
+    data = {'AAPL': synthetic_prices(200, seed=1)}
+    predictor = MultiSeriesPredictor()
+    with pytest.raises(ValueError, match='streaming'):
+        predictor.train(data, epochs=1, streaming=True)
+    with pytest.raises(ValueError, match='Streaming'):
+        predictor.prepare_loader(data)
+    with pytest.raises(ValueError, match='Incremental'):
+        predictor.update(data)
+
+def reference_forecast(model, window, steps):
+    # The original torch.cat based decoding loop
+    predictions = []
+    for _ in range(steps):
+        pred = model(window)
+        predictions.append(pred.item())
+        window = torch.cat([window[:, 1:, :], pred.unsqueeze(1)], dim=1)
+    return torch.tensor(predictions)
+
+def test_buffered_forecast_matches_reference():
+    from src.models.price_predictor import forecast
+    predictor = PricePredictor()
+    predictor.model.eval()
+    X, _ = predictor.prepare_data(synthetic_prices(200))
+    window = X[-1:].contiguous()
+    with torch.no_grad():
+        expected = reference_forecast(predictor.model, window, 30)
+        predictions = forecast(predictor.model, window, 30)
+    torch.testing.assert_close(predictions[0], expected)
+
+@pytest.mark.parametrize('quantize', [False, True])
+def test_torchscript_export_round_trip(tmp_path, quantize):
+    from src.models.export import export_predictor, load_exported
+    data = synthetic_prices(200)
+    predictor = PricePredictor()
+    predictor.train(data, epochs=2)
+    path = export_predictor(predictor, str(tmp_path / 'model.pt'), quantize=quantize)
+
+    exported = load_exported(path)
+    expected = predictor.predict(data, steps=5)
+    np.testing.assert_allclose(
+        exported.predict(data, steps=5).values,
+        expected.values,
+        atol=0.5 if quantize else 1e-4
+    )
+
+def test_compare_backends_reports_every_variant():
+    from src.models.export import compare_backends
+    data = synthetic_prices(200)
+    predictor = PricePredictor()
+    predictor.train(data, epochs=1)
+    report = compare_backends(
+        predictor, data, repeats=3,
+        variants=[{'format': 'torchscript', 'quantize': False}]
+    )
+    assert list(report['backend']) == ['eager', 'torchscript']
+    assert report['max_abs_error'].max() < 1e-3
@@ -0,0 +1,148 @@
+import pandas as pd
+import pytest
+from src.analysis.sentiment import SentimentAnalyzer
+from fakes import StubPipeline
+
+@pytest.fixture
+def stub():
+    return StubPipeline()
+
+@pytest.fixture
+def analyzer(stub):
+    return SentimentAnalyzer(model=stub, batch_size=4)
+
+def test_texts_are_batched_and_sorted_by_length(analyzer, stub):
+    texts = [f"{'long ' * (i % 5)}headline {i}" for i in range(10)]
+    results = analyzer.analyze_texts(texts)
+    assert [r['text'] for r in results] == texts
+    assert [len(call) for call in stub.calls] == [4, 4, 2]
+    lengths = [len(text) for call in stub.calls for text in call]
+    assert lengths == sorted(lengths)
+
+def test_bad_text_is_isolated(analyzer):
+    texts = ["prices drop", "FAIL", "record revenue"]
+    results = analyzer.analyze_texts(texts)
+    assert results[0]['label'] == 'NEGATIVE'
+    assert 'error' in results[1]
+    assert results[2]['label'] == 'POSITIVE'
+
+def test_empty_input(analyzer, stub):
+    assert analyzer.analyze_texts([]) == []
+    assert stub.calls == []
+
+def test_duplicates_scored_once(analyzer, stub):
+    texts = ["record revenue", "record  revenue", "prices drop", "record revenue"]
+    results = analyzer.analyze_texts(texts)
+    assert [r['text'] for r in results] == texts
+    assert sum(len(call) for call in stub.calls) == 2
+
+def test_cache_skips_scored_texts(stub, tmp_path):
+    from src.analysis.cache import SentimentCache
+    cache = SentimentCache(capacity=10, db_path=str(tmp_path / 'cache.sqlite'))
+    analyzer = SentimentAnalyzer(model=stub, cache=cache)
+    analyzer.analyze_texts(["record revenue", "prices drop"])
+    analyzer.analyze_texts(["record revenue", "prices drop", "new launch"])
+    assert stub.calls[-1] == ["new launch"]
+    assert analyzer.analyze_text("prices drop")['label'] == 'NEGATIVE'
+    assert cache.stats()['hits'] == 3
+
+    # A fresh process picks results up from the SQLite tier
+    restarted = SentimentCache(db_path=str(tmp_path / 'cache.sqlite'))
+    calls = len(stub.calls)
+    SentimentAnalyzer(model=stub, cache=restarted).analyze_texts(["new launch"])
+    assert len(stub.calls) == calls
+    stats = restarted.stats()
+    assert (stats['hits'], stats['memory_hits'], stats['disk_hits']) == (1, 0, 1)
+
+def test_errors_are_not_cached(stub):
+    from src.analysis.cache import SentimentCache
+    cache = SentimentCache()
+    analyzer = SentimentAnalyzer(model=stub, cache=cache)
+    assert 'error' in analyzer.analyze_texts(["FAIL"])[0]
+    assert cache.stats()['size'] == 0
+
+def test_cache_lru_eviction():
+    from src.analysis.cache import SentimentCache
+    cache = SentimentCache(capacity=2)
+    cache.put('a', {'label': 'POSITIVE', 'score': 0.9})
+    cache.put('b', {'label': 'POSITIVE', 'score': 0.9})
+    cache.get('a')
+    cache.put('c', {'label': 'NEGATIVE', 'score': 0.8})
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+
+def make_corpus(n):
+    return pd.DataFrame({
+        'id': range(n),
+        'headline': [f"prices drop {i}" if i % 3 == 0 else f"record revenue {i}" for i in range(n)]
+    })
+
+@pytest.mark.parametrize('output_name', ['scored.csv', 'scored.parquet'])
+def test_stream_scoring_resumes_after_interruption(analyzer, tmp_path, output_name):
+    source = tmp_path / 'news.csv'
+    make_corpus(25).to_csv(source, index=False)
+    output = str(tmp_path / output_name)
+
+    class Interrupted(Exception):
+        pass
+
+    # Fail while scoring the third chunk
+    original = analyzer.analyze_texts
+    def flaky(texts, *args, **kwargs):
+        if any(text.endswith(' 20') for text in texts):
+            raise Interrupted()
+        return original(texts, *args, **kwargs)
+    analyzer.analyze_texts = flaky
+    with pytest.raises(Interrupted):
+        analyzer.analyze_stream(str(source), 'headline', output, chunksize=10)
+
+    analyzer.analyze_texts = original
+    stats = analyzer.analyze_stream(str(source), 'headline', output, chunksize=10)
+    assert stats['rows'] == 5
+    assert stats['total_rows'] == 25
+
+    if output_name.endswith('.parquet'):
+        result = pd.read_parquet(output)
+    else:
+        result = pd.read_csv(output)
+    assert list(result['id']) == list(range(25))
+    assert (result['sentiment_label'] == 'NEGATIVE').sum() == 9
+
+@pytest.mark.parametrize('output_name', ['scored.csv', 'scored.parquet'])
+def test_stream_scoring_without_resume_starts_over(analyzer, tmp_path, output_name):
+    output = str(tmp_path / output_name)
+    analyzer.analyze_stream(make_corpus(10), 'headline', output, chunksize=3)
+    stats = analyzer.analyze_stream(make_corpus(4), 'headline', output, chunksize=3, resume=False)
+    assert stats['rows'] == 4
+
+    if output_name.endswith('.parquet'):
+        result = pd.read_parquet(output)
+    else:
+        result = pd.read_csv(output)
+    assert list(result['id']) == list(range(4))
+
+def test_stream_scoring_from_chunk_iterator(analyzer, tmp_path):
+    corpus = make_corpus(12)
+    chunks = (corpus.iloc[i:i + 5] for i in range(0, 12, 5))
+    stats = analyzer.analyze_stream(chunks, 'headline', str(tmp_path / 'out.csv'))
+    assert stats['chunks'] == 3
+    assert len(pd.read_csv(tmp_path / 'out.csv')) == 12
+
+def make_stub():
+    return StubPipeline()
+
+def test_worker_pool_scores_in_order():
+    from src.analysis.workers import SentimentWorkerPool
+    pool = SentimentWorkerPool(num_workers=2, batch_size=3, model_factory=make_stub)
+    try:
+        analyzer = SentimentAnalyzer(pool=pool)
+        assert analyzer.model is None
+        texts = [f"prices drop {i}" if i % 2 else f"record revenue {'x' * i}" for i in range(10)] + ["FAIL"]
+        results = analyzer.analyze_texts(texts)
+        assert [r.get('text') for r in results[:-1]] == texts[:-1]
+        assert results[1]['label'] == 'NEGATIVE'
+        assert 'error' in results[-1]
+        assert analyzer.analyze_text("prices drop")['label'] == 'NEGATIVE'
+        assert len(pool.worker_pids()) >= 1
+    finally:
+        pool.shutdown()
@@ -0,0 +1,143 @@
+import threading
+import time
+import pytest
+from src.serving.lazy import LazyComponent
+
+def test_lazy_component_builds_once_under_concurrency():
+    calls = []
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    component = LazyComponent('slow', factory)
+    assert component.status()['state'] == 'unloaded'
+    assert component.peek() is None
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(component.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert component.status()['state'] == 'ready'
+    assert component.status()['load_seconds'] > 0
+
+def test_lazy_component_records_failure_and_retries():
+    attempts = []
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("model download failed")
+        return 'model'
+
+    component = LazyComponent('flaky', factory)
+    with pytest.raises(RuntimeError):
+        component.get()
+    assert component.status() == {
+        'state': 'failed', 'load_seconds': None, 'error': 'model download failed'
+    }
+    assert component.get() == 'model'
+    assert component.loaded
+
+def test_bounded_executor_rejects_over_capacity():
+    import asyncio
+    from src.serving.executor import BoundedExecutor, CapacityExceeded
+
+    executor = BoundedExecutor('test', max_workers=1, max_pending=2, timeout=5)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(executor.run(release.wait))
+        second = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(CapacityExceeded):
+            await executor.run(release.wait)
+        release.set()
+        await asyncio.gather(first, second)
+
+    asyncio.run(scenario())
+    assert executor.stats()['rejected'] == 1
+    assert executor.stats()['in_flight'] == 0
+    executor.shutdown()
+
+def test_bounded_executor_timeout_keeps_slot_until_done():
+    import asyncio
+    from src.serving.executor import BoundedExecutor, ExecutionTimeout
+
+    executor = BoundedExecutor('test', max_workers=1, max_pending=1, timeout=0.05)
+    release = threading.Event()
+
+    async def scenario():
+        with pytest.raises(ExecutionTimeout):
+            await executor.run(release.wait)
+        # The timed-out call is still running and still holds its slot
+        assert executor.stats()['in_flight'] == 1
+        release.set()
+        await asyncio.sleep(0.05)
+        assert executor.stats()['in_flight'] == 0
+        assert await executor.run(lambda: 42) == 42
+
+    asyncio.run(scenario())
+    executor.shutdown()
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    import asyncio
+    from src.serving.batching import BATCH_SIZE, MicroBatcher
+    from src.serving.executor import BoundedExecutor
+
+    calls = []
+    def process(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    executor = BoundedExecutor('test', max_workers=1)
+    batcher = MicroBatcher('test-coalesce', process, executor, max_batch_size=5, max_wait=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            batcher.submit([1]), batcher.submit([2, 3]), batcher.submit([4]),
+            batcher.submit([5, 6, 7])
+        )
+
+    results = asyncio.run(scenario())
+    assert results == [[2], [4, 6], [8], [10, 12, 14]]
+    # Four items fill no batch, so the fourth request starts a second batch
+    assert calls == [[1, 2, 3, 4], [5, 6, 7]]
+    assert BATCH_SIZE.count(batcher='test-coalesce') == 2
+    executor.shutdown()
+
+def test_micro_batcher_flushes_full_batch_without_waiting():
+    import asyncio
+    from src.serving.batching import MicroBatcher
+    from src.serving.executor import BoundedExecutor
+
+    executor = BoundedExecutor('test', max_workers=1)
+    batcher = MicroBatcher('test-full', lambda items: items, executor, max_batch_size=2, max_wait=10)
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(batcher.submit(['a']), batcher.submit(['b'])), 1)
+
+    assert asyncio.run(scenario()) == [['a'], ['b']]
+    executor.shutdown()
+
+def test_micro_batcher_propagates_errors_to_every_request():
+    import asyncio
+    from src.serving.batching import MicroBatcher
+    from src.serving.executor import BoundedExecutor
+
+    def process(items):
+        raise ValueError("model failed")
+
+    executor = BoundedExecutor('test', max_workers=1)
+    batcher = MicroBatcher('test-errors', process, executor, max_wait=0.01)
+
+    async def scenario():
+        return await asyncio.gather(batcher.submit([1]), batcher.submit([2]), return_exceptions=True)
+
+    errors = asyncio.run(scenario())
+    assert all(isinstance(error, ValueError) for error in errors)
+    executor.shutdown()